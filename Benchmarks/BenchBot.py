@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+
+from discord import Intents
+
+from Classes.Bot import StaffPartyBot
+from .FakeDatabase import BenchDatabase
+from .FakeDiscord import FakeDiscord
+from .FakeXIVVenues import FakeXIVVenues
+
+if TYPE_CHECKING:
+    from .Dataset import SyntheticDataset
+    from .FakeDiscord import FakeChannel, FakeGuild, FakeMember, FakeMessage
+################################################################################
+
+__all__ = ("BenchBot",)
+
+################################################################################
+class BenchBot(StaffPartyBot):
+    """The real bot with Discord and Postgres swapped for in-process fakes.
+
+    It never logs in - the gateway cache py-cord would normally populate is
+    answered from ``FakeDiscord`` instead, and the database cursor reads the
+    synthetic tables. Must be created inside a running event loop.
+    """
+
+################################################################################
+    def __init__(
+        self,
+        dataset: SyntheticDataset,
+        rest_latency: float = 0.0,
+        db_latency: float = 0.0
+    ):
+
+        super().__init__(intents=Intents.none())
+
+        self.fake: FakeDiscord = FakeDiscord.from_dataset(dataset, rest_latency)
+        self._db = BenchDatabase(self, dataset, db_latency)
+        self._xiv_client = FakeXIVVenues(self.fake, dataset.seed)
+
+################################################################################
+    async def close(self) -> None:
+
+        task = self._timers._task
+        if task is not None and not task.done():
+            task.cancel()
+
+################################################################################
+    @property
+    def guilds(self) -> List[FakeGuild]:
+
+        return self.fake.guilds
+
+################################################################################
+    @property
+    def user(self) -> FakeMember:
+
+        return self.fake.user(0)
+
+################################################################################
+    @property
+    def veni_client(self) -> FakeXIVVenues:
+
+        return self._xiv_client  # type: ignore
+
+################################################################################
+    def get_guild(self, guild_id: int, /) -> Optional[FakeGuild]:
+
+        return next((g for g in self.fake.guilds if g.id == guild_id), None)
+
+################################################################################
+    def get_channel(self, channel_id: int, /) -> Optional[FakeChannel]:
+
+        return self.fake.channels.get(channel_id)
+
+################################################################################
+    def get_message(self, message_id: int, /) -> Optional[FakeMessage]:
+
+        # py-cord's message cache is empty right after a restart, which is the
+        # case the benchmarks care about.
+        return None
+
+################################################################################
+    def get_user(self, user_id: int, /) -> Optional[FakeMember]:
+
+        return self.fake.users.get(user_id)
+
+################################################################################
+    async def fetch_user(self, user_id: int, /) -> FakeMember:
+
+        await self.fake.rest("GET", "/users/{user_id}")
+        return self.fake.user(user_id)
+
+################################################################################
+    async def fetch_channel(self, channel_id: int, /) -> FakeChannel:
+
+        await self.fake.rest("GET", "/channels/{channel_id}")
+        return self.fake.channel(channel_id)
+
+################################################################################
+    async def get_or_fetch_user(self, user_id: int, /) -> FakeMember:
+
+        return self.get_user(user_id) or await self.fetch_user(user_id)
+
+################################################################################
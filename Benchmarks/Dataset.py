@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import pytz
+################################################################################
+
+__all__ = ("DatasetSize", "SyntheticDataset", "SIZES")
+
+Row = Tuple[Any, ...]
+
+################################################################################
+class DatasetSize:
+    """How many of each record a synthetic guild gets. Child records
+    (availability, qualifications, hours, signups...) scale off these."""
+
+    __slots__ = (
+        "tusers",
+        "positions",
+        "venues",
+        "profiles",
+        "job_postings",
+        "group_trainings",
+        "posted",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        tusers: int,
+        positions: int,
+        venues: int,
+        profiles: int,
+        job_postings: int,
+        group_trainings: int,
+        posted: float = 0.6
+    ) -> None:
+
+        self.tusers: int = tusers
+        self.positions: int = positions
+        self.venues: int = venues
+        self.profiles: int = profiles
+        self.job_postings: int = job_postings
+        self.group_trainings: int = group_trainings
+        # Fraction of postable records that have a live post message.
+        self.posted: float = posted
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+################################################################################
+    def with_overrides(self, **overrides: Any) -> DatasetSize:
+
+        data = self.to_dict()
+        data.update({k: v for k, v in overrides.items() if v is not None})
+        return DatasetSize(**data)
+
+################################################################################
+SIZES: Dict[str, DatasetSize] = {
+    "small": DatasetSize(tusers=100, positions=10, venues=25, profiles=50, job_postings=20, group_trainings=5),
+    "medium": DatasetSize(tusers=1000, positions=20, venues=200, profiles=500, job_postings=150, group_trainings=30),
+    "large": DatasetSize(tusers=10000, positions=30, venues=1500, profiles=4000, job_postings=1000, group_trainings=200),
+}
+
+POSITION_NAMES = [
+    "Bartender", "Dancer", "Greeter", "Host", "Security", "DJ", "Gamba",
+    "Photographer", "Bard", "Shout Runner", "Manager", "Courtesan", "Cook",
+    "Tarot Reader", "Performer", "Server", "Barista", "Pillow", "Model",
+    "Streamer",
+]
+
+################################################################################
+class DiscordSpec:
+    """The Discord-side objects the rows refer to, for the fake client."""
+
+    __slots__ = (
+        "guild_id",
+        "members",
+        "roles",
+        "channels",
+        "threads",
+        "messages",
+    )
+
+    def __init__(self, guild_id: int) -> None:
+
+        self.guild_id: int = guild_id
+        # (id, name, role ids)
+        self.members: List[Tuple[int, str, List[int]]] = []
+        # (id, name)
+        self.roles: List[Tuple[int, str]] = []
+        # (id, name, forum tag names)
+        self.channels: List[Tuple[int, str, List[str]]] = []
+        # (id, parent_id, name)
+        self.threads: List[Tuple[int, int, str]] = []
+        # (id, channel_id)
+        self.messages: List[Tuple[int, int]] = []
+
+################################################################################
+class SyntheticDataset:
+    """Generates a guild's worth of database rows in exactly the shape
+    ``DatabaseLoader`` reads them, plus the Discord objects they point at.
+
+    Generation is seeded, so two runs with the same size and seed produce
+    identical data and their timings can be compared.
+    """
+
+    __slots__ = (
+        "size",
+        "seed",
+        "tables",
+        "discord",
+        "_rng",
+        "_snowflake",
+        "_channels",
+        "_threads",
+    )
+
+################################################################################
+    def __init__(self, size: DatasetSize, seed: int = 0) -> None:
+
+        self.size: DatasetSize = size
+        self.seed: int = seed
+
+        self._rng: random.Random = random.Random(seed)
+        self._snowflake: int = 100_000_000_000_000_000
+
+        self.tables: Dict[str, List[Row]] = {}
+        self.discord: DiscordSpec = DiscordSpec(guild_id=self._next_snowflake())
+        self._channels: Dict[str, int] = {}
+        self._threads: Dict[Tuple[int, str], int] = {}
+
+        self._generate()
+
+################################################################################
+    @classmethod
+    def from_name(cls, name: str, seed: int = 0, **overrides: int) -> SyntheticDataset:
+
+        return cls(SIZES[name].with_overrides(**overrides), seed)
+
+################################################################################
+    @property
+    def guild_id(self) -> int:
+
+        return self.discord.guild_id
+
+################################################################################
+    @property
+    def member_ids(self) -> List[int]:
+
+        return [m[0] for m in self.discord.members]
+
+################################################################################
+    def counts(self) -> Dict[str, int]:
+
+        return {table: len(rows) for table, rows in self.tables.items()}
+
+################################################################################
+    def _next_snowflake(self) -> int:
+
+        self._snowflake += self._rng.randint(1, 4096)
+        return self._snowflake
+
+################################################################################
+    def _new_id(self) -> str:
+
+        return UUID(int=self._rng.getrandbits(128), version=4).hex
+
+################################################################################
+    def _channel_index(self, name: str) -> int:
+
+        return next(i for i, c in enumerate(self.discord.channels) if c[1] == name)
+
+################################################################################
+    def _post(self, channel_id: int, thread_name: Optional[str] = None) -> Optional[str]:
+        """Creates a message (in a new or existing thread if a name is given)
+        and returns its jump URL, or ``None`` if this record isn't posted."""
+
+        if self._rng.random() >= self.size.posted:
+            return None
+
+        if thread_name is not None:
+            thread_id = self._threads.get((channel_id, thread_name))
+            if thread_id is None:
+                thread_id = self._threads[(channel_id, thread_name)] = self._next_snowflake()
+                self.discord.threads.append((thread_id, channel_id, thread_name))
+            channel_id = thread_id
+
+        message_id = self._next_snowflake()
+        self.discord.messages.append((message_id, channel_id))
+
+        return f"https://discord.com/channels/{self.guild_id}/{channel_id}/{message_id}"
+
+################################################################################
+    def _generate(self) -> None:
+
+        self._generate_guild()
+        positions = self._generate_positions()
+        members = self._generate_members()
+        venues = self._generate_venues(positions, members)
+        self._generate_tusers(positions, members)
+        self._generate_trainings(positions, members)
+        self._generate_profiles(positions, members)
+        self._generate_job_postings(positions, members, venues)
+        self._generate_group_trainings(positions, members)
+
+        for table in (
+            "service_config", "service_profiles", "services",
+            "sp_availability", "sp_images", "job_hours",
+        ):
+            self.tables[table] = []
+
+################################################################################
+    def _generate_guild(self) -> None:
+
+        for name, tags in (
+            ("temporary-jobs", []),
+            ("permanent-jobs", []),
+            ("venues", []),
+            ("profiles", ["Accepting DMs", "Not Accepting DMs"]),
+            ("bot-log", []),
+            ("services", []),
+            ("welcome", []),
+            ("group-training", []),
+            ("trainer-signup", []),
+        ):
+            channel_id = self._next_snowflake()
+            self._channels[name] = channel_id
+            self.discord.channels.append((channel_id, name, tags))
+
+        role_ids = []
+        for name in (
+            "Trainer", "Trainer Pending", "Trainer Hiatus", "Staff",
+            "Staff Unvalidated", "Venue Management", "Trainee", "Trainee Hiatus",
+        ):
+            role_ids.append(self._next_snowflake())
+            self.discord.roles.append((role_ids[-1], name))
+
+        signup_msg = self._next_snowflake()
+        self.discord.messages.append((signup_msg, self._channels["trainer-signup"]))
+
+        c = self._channels
+        self.tables["bot_config"] = [(self.guild_id, None, c["trainer-signup"], signup_msg)]
+        self.tables["roles"] = [(self.guild_id, *role_ids)]
+        self.tables["channels"] = [(
+            self.guild_id, c["temporary-jobs"], c["permanent-jobs"], c["venues"],
+            c["profiles"], c["bot-log"], c["services"], c["welcome"], [],
+            c["group-training"],
+        )]
+
+################################################################################
+    def _generate_positions(self) -> List[str]:
+
+        positions, requirements = [], []
+        self.tables["positions"] = []
+
+        for i in range(self.size.positions):
+            name = POSITION_NAMES[i % len(POSITION_NAMES)]
+            if i >= len(POSITION_NAMES):
+                name += f" {i // len(POSITION_NAMES) + 1}"
+
+            # Roughly half the positions carry a linked role, which makes
+            # eligibility checks fetch the member.
+            role_id = None
+            if self._rng.random() < 0.5:
+                role_id = self._next_snowflake()
+                self.discord.roles.append((role_id, name))
+
+            pos_id = self._new_id()
+            positions.append(pos_id)
+            self.tables["positions"].append(
+                (pos_id, self.guild_id, name, role_id, self._rng.choice([50_000, 100_000, 250_000]), False, f"All about being a {name}.")
+            )
+            # Profiles are tagged by their top positions.
+            self.discord.channels[self._channel_index("profiles")][2].append(name)
+
+            for j in range(5):
+                requirements.append((self._new_id(), self.guild_id, pos_id, f"{name} requirement #{j + 1}"))
+
+        for j in range(5):
+            requirements.append((self._new_id(), self.guild_id, "0", f"Global requirement #{j + 1}"))
+
+        self.tables["requirements"] = requirements
+
+        return positions
+
+################################################################################
+    def _generate_members(self) -> List[int]:
+
+        role_ids = [r[0] for r in self.discord.roles]
+        count = max(self.size.tusers, self.size.profiles) + self.size.venues
+
+        members = []
+        for i in range(count):
+            member_id = self._next_snowflake()
+            roles = self._rng.sample(role_ids, k=min(len(role_ids), self._rng.randint(0, 4)))
+            self.discord.members.append((member_id, f"member{i}", roles))
+            members.append(member_id)
+
+        return members
+
+################################################################################
+    def _times(self) -> Tuple[time, time]:
+
+        start = self._rng.randrange(0, 22)
+        return time(start, 0), time(min(start + self._rng.randint(1, 6), 23), 30)
+
+################################################################################
+    def _generate_venues(self, positions: List[str], members: List[int]) -> List[str]:
+
+        venues, hours = [], []
+        self.tables["venue_master"] = []
+        tags = ["Nightclub", "Bards", "Lounge", "Cafe", "Tavern", "Gambling", "TwitchDJ"]
+
+        for i in range(self.size.venues):
+            venue_id = self._new_id()
+            venues.append(venue_id)
+
+            post_url = self._post(self._channels["venues"], thread_name=f"Venue {i}")
+            self.tables["venue_master"].append((
+                venue_id, self.guild_id,
+                self._rng.sample(members, k=self._rng.randint(1, 3)),
+                self._rng.sample(positions, k=min(len(positions), self._rng.randint(1, 5))),
+                False, post_url, f"Venue {i}", "A lovely place to spend the evening.",
+                True, None, None,
+                self._rng.sample(members, k=self._rng.randint(0, 3)),
+                self._new_id(),
+                # Location
+                self._rng.randint(1, 7), self._rng.randint(1, 40), self._rng.randint(1, 5),
+                self._rng.randint(1, 30), self._rng.randint(1, 60), None, None, False,
+                # At A Glance
+                self._rng.randint(1, 5), self._rng.random() < 0.3, None,
+                self._rng.sample(tags, k=self._rng.randint(0, 3)),
+                # URLs
+                None, None, None, None, None,
+                # xiv_modified
+                None,
+            ))
+
+            for day in self._rng.sample(range(7), k=self._rng.randint(1, 4)):
+                hours.append((venue_id, self.guild_id, day, *self._times()))
+
+        self.tables["venue_hours"] = hours
+
+        return venues
+
+################################################################################
+    def _generate_tusers(self, positions: List[str], members: List[int]) -> None:
+
+        tusers, availability, qualifications, bg_checks = [], [], [], []
+
+        for i, user_id in enumerate(members[:self.size.tusers]):
+            tusers.append((
+                user_id, self.guild_id, None, f"Trainee {i}", None,
+                self._rng.random() < 0.1,
+                [str(self._rng.randint(1, 4))],
+                True, None, True,
+            ))
+
+            for day in self._rng.sample(range(7), k=self._rng.randint(0, 4)):
+                availability.append((user_id, self.guild_id, day, *self._times()))
+
+            for pos_id in self._rng.sample(positions, k=min(len(positions), self._rng.randint(0, 3))):
+                qualifications.append((self._new_id(), self.guild_id, user_id, pos_id, self._rng.randint(1, 2)))
+
+            bg_checks.append((
+                user_id, True, [f"Trainee {i}"],
+                [f"Some Venue::{self._rng.randint(1, 7)}::{self._rng.randint(1, 40)}::Bartender||Host"],
+                self._rng.sample(positions, k=min(len(positions), 2)),
+                True, self.guild_id, self._rng.random() < 0.3, True,
+                self._post(self._channels["bot-log"]) if self._rng.random() < 0.1 else None,
+                datetime.now(pytz.utc), None, None,
+            ))
+
+        self.tables["tuser_master"] = tusers
+        self.tables["availability"] = availability
+        self.tables["qualifications"] = qualifications
+        self.tables["bg_checks"] = bg_checks
+
+################################################################################
+    def _generate_trainings(self, positions: List[str], members: List[int]) -> None:
+
+        trainings, overrides = [], []
+        tuser_ids = members[:self.size.tusers]
+        requirements = [r[0] for r in self.tables["requirements"]]
+
+        for trainee_id in tuser_ids:
+            for pos_id in self._rng.sample(positions, k=min(len(positions), self._rng.randint(0, 2))):
+                trainer_id = self._rng.choice(tuser_ids) if self._rng.random() < 0.6 else None
+                training_id = self._new_id()
+                complete = trainer_id is not None and self._rng.random() < 0.5
+                trainings.append((
+                    training_id, self.guild_id, trainee_id, pos_id, trainer_id,
+                    complete and self._rng.random() < 0.5, complete,
+                ))
+
+                if self._rng.random() < 0.3:
+                    overrides.append((
+                        self._new_id(), self.guild_id, training_id,
+                        self._rng.choice(requirements), self._rng.randint(1, 3),
+                    ))
+
+        self.tables["trainings"] = trainings
+        self.tables["requirement_overrides"] = overrides
+
+################################################################################
+    def _generate_profiles(self, positions: List[str], members: List[int]) -> None:
+
+        profiles, images, availability = [], [], []
+
+        for i, user_id in enumerate(members[:self.size.profiles]):
+            profile_id = self._new_id()
+            profiles.append((
+                profile_id, user_id, self.guild_id,
+                # Details
+                f"Character {i}", None, 0x9B59B6, ["Bartender"], "Negotiable",
+                self._post(self._channels["profiles"], thread_name=f"Character {i}"),
+                self._rng.sample(positions, k=min(len(positions), self._rng.randint(0, 3))),
+                self._rng.random() < 0.5,
+                # Personality
+                "Long walks", "Short walks", "Bubbly", "Hi!" if self._rng.random() < 0.5 else None,
+                # At A Glance
+                "1", [1, 2], "2", "3", "1", 168, "25", None, [self._rng.randint(1, 4)],
+                # Images
+                None, None,
+            ))
+
+            for _ in range(self._rng.randint(0, 3)):
+                images.append((self._new_id(), profile_id, "https://example.com/img.png", None))
+            for day in self._rng.sample(range(7), k=self._rng.randint(0, 4)):
+                availability.append((profile_id, day, *self._times()))
+
+        self.tables["profile_master"] = profiles
+        self.tables["additional_images"] = images
+        self.tables["profile_availability"] = availability
+
+################################################################################
+    def _generate_job_postings(self, positions: List[str], members: List[int], venues: List[str]) -> None:
+
+        postings = []
+        tuser_ids = members[:self.size.tusers]
+        names = {p[0]: p[2] for p in self.tables["positions"]}
+        now = datetime.now(pytz.utc)
+
+        for _ in range(self.size.job_postings):
+            pos_id = self._rng.choice(positions)
+            start = now + timedelta(hours=self._rng.randint(1, 24 * 14))
+            postings.append((
+                self._new_id(), self.guild_id, self._rng.choice(venues),
+                self._rng.choice(members), None, pos_id, "Looking for help!",
+                self._rng.choice([100_000, 250_000]), self._rng.randint(1, 2), None,
+                self._post(self._channels["temporary-jobs"], thread_name=names[pos_id]),
+                start, start + timedelta(hours=self._rng.randint(1, 6)),
+                self._rng.choice(tuser_ids) if self._rng.random() < 0.2 else None,
+                self._rng.sample(tuser_ids, k=self._rng.randint(0, 2)),
+            ))
+
+        self.tables["job_postings"] = postings
+
+################################################################################
+    def _generate_group_trainings(self, positions: List[str], members: List[int]) -> None:
+
+        groups, signups = [], []
+        tuser_ids = members[:self.size.tusers]
+        now = datetime.now(pytz.utc)
+
+        for i in range(self.size.group_trainings):
+            group_id = self._new_id()
+            start = now + timedelta(days=self._rng.randint(-7, 14))
+            groups.append((
+                group_id, self.guild_id, f"Group Training {i}", "Learn the ropes together.",
+                start, start + timedelta(hours=2),
+                self._rng.sample(positions, k=min(len(positions), self._rng.randint(1, 3))),
+                self._rng.choice(tuser_ids), self._post(self._channels["group-training"]),
+                False, False, [],
+            ))
+
+            for user_id in self._rng.sample(tuser_ids, k=min(len(tuser_ids), self._rng.randint(0, 15))):
+                signups.append((self._new_id(), group_id, user_id, self._rng.randint(1, 2)))
+
+        self.tables["group_trainings"] = groups
+        self.tables["group_training_signups"] = signups
+
+################################################################################
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import re
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from Utilities.Database import Database
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+    from .Dataset import SyntheticDataset
+################################################################################
+
+__all__ = ("BenchDatabase", "RecordingCursor", "RecordingConnection")
+
+Row = Tuple[Any, ...]
+
+################################################################################
+class RecordingCursor:
+    """Stands in for a psycopg2 cursor.
+
+    ``SELECT * FROM <table>`` is served straight out of the synthetic
+    dataset; everything else is accepted and counted but otherwise ignored.
+    Each statement blocks for ``latency`` seconds, the same way a real
+    round trip would block the event loop.
+    """
+
+    __slots__ = (
+        "_tables",
+        "_latency",
+        "_result",
+        "statements",
+    )
+
+    SELECT_ALL = re.compile(r"\s*SELECT \* FROM (\w+)\s*;?\s*$", re.IGNORECASE)
+
+################################################################################
+    def __init__(self, tables: Dict[str, List[Row]], latency: float) -> None:
+
+        self._tables: Dict[str, List[Row]] = tables
+        self._latency: float = latency
+        self._result: List[Row] = []
+
+        # statement -> times executed, for eyeballing what a scenario did
+        self.statements: Dict[str, int] = {}
+
+################################################################################
+    def execute(self, query: str, args: Any = None) -> None:
+
+        if self._latency:
+            time.sleep(self._latency)
+
+        self.statements[query] = self.statements.get(query, 0) + 1
+
+        match = self.SELECT_ALL.match(query)
+        self._result = list(self._tables.get(match.group(1), [])) if match else []
+
+################################################################################
+    def fetchall(self) -> Tuple[Row, ...]:
+
+        result, self._result = self._result, []
+        return tuple(result)
+
+################################################################################
+    def fetchone(self) -> Optional[Row]:
+
+        return self._result.pop(0) if self._result else None
+
+################################################################################
+    def close(self) -> None:
+
+        pass
+
+################################################################################
+class RecordingConnection:
+
+    __slots__ = (
+        "_cursor",
+        "commits",
+        "rollbacks",
+    )
+
+    def __init__(self, cursor: RecordingCursor) -> None:
+
+        self._cursor: RecordingCursor = cursor
+        self.commits: int = 0
+        self.rollbacks: int = 0
+
+    def cursor(self) -> RecordingCursor:
+
+        return self._cursor
+
+    def commit(self) -> None:
+
+        self.commits += 1
+
+    def rollback(self) -> None:
+
+        self.rollbacks += 1
+
+    def close(self) -> None:
+
+        pass
+
+################################################################################
+class BenchDatabase(Database):
+    """``Database`` wired to a ``RecordingCursor`` instead of Postgres.
+
+    Everything above the cursor - the worker branches, transactions and
+    the ``Metrics`` hook in ``execute`` - is the real code.
+    """
+
+    __slots__ = (
+        "_tables",
+        "_latency",
+    )
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot, dataset: SyntheticDataset, latency: float = 0.0):
+
+        super().__init__(bot)
+
+        self._tables: Dict[str, List[Row]] = dataset.tables
+        self._latency: float = latency
+
+        self._connect()
+
+################################################################################
+    def _connect(self) -> None:
+
+        self._connection = self._open_connection()
+        self._cursor = self._connection.cursor()
+
+################################################################################
+    def _open_connection(self) -> RecordingConnection:
+
+        return RecordingConnection(RecordingCursor(self._tables, self._latency))
+
+################################################################################
+    @property
+    def statements(self) -> Dict[str, int]:
+
+        return self._cursor.statements
+
+################################################################################
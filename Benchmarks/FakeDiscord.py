@@ -0,0 +1,785 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
+
+import pytz
+from discord import InteractionType
+
+from Utilities import Metrics
+
+if TYPE_CHECKING:
+    from .Dataset import SyntheticDataset
+################################################################################
+
+__all__ = (
+    "FakeDiscord",
+    "FakeGuild",
+    "FakeMember",
+    "FakeRole",
+    "FakeChannel",
+    "FakeThread",
+    "FakeMessage",
+    "FakeInteraction",
+    "InteractionScript",
+)
+
+################################################################################
+class FakeDiscord:
+    """An in-process stand-in for Discord's REST API and object cache.
+
+    Only the surface the managers actually touch is implemented. Every call
+    that would be a REST request in py-cord goes through ``rest()``, which
+    optionally sleeps for a simulated round trip and records the call by
+    route in ``Metrics`` just like the real HTTP client does.
+    """
+
+    __slots__ = (
+        "latency",
+        "guilds",
+        "users",
+        "channels",
+        "messages",
+        "_snowflake",
+    )
+
+################################################################################
+    def __init__(self, latency: float = 0.0) -> None:
+
+        self.latency: float = latency
+
+        self.guilds: List[FakeGuild] = []
+        self.users: Dict[int, FakeMember] = {}
+        self.channels: Dict[int, FakeChannel] = {}
+        self.messages: Dict[int, FakeMessage] = {}
+
+        self._snowflake: int = 900_000_000_000_000_000
+
+################################################################################
+    @classmethod
+    def from_dataset(cls, dataset: SyntheticDataset, latency: float = 0.0) -> FakeDiscord:
+
+        self = cls(latency)
+        spec = dataset.discord
+
+        guild = FakeGuild(self, spec.guild_id, "Synthetic Guild")
+        self.guilds.append(guild)
+
+        for role_id, name in spec.roles:
+            guild.roles[role_id] = FakeRole(guild, role_id, name)
+
+        for member_id, name, role_ids in spec.members:
+            member = FakeMember(self, member_id, name, guild)
+            member.roles = [guild.roles[r] for r in role_ids]
+            guild.members[member_id] = member
+            self.users[member_id] = member
+
+        for channel_id, name, tags in spec.channels:
+            channel = FakeChannel(self, channel_id, name, guild, tags)
+            guild.channels[channel_id] = channel
+            self.channels[channel_id] = channel
+
+        for thread_id, parent_id, name in spec.threads:
+            parent = self.channels[parent_id]
+            thread = FakeThread(self, thread_id, name, guild, parent)
+            parent.threads.append(thread)
+            guild.channels[thread_id] = thread
+            self.channels[thread_id] = thread
+
+        for message_id, channel_id in spec.messages:
+            self.channels[channel_id].add_message(FakeMessage(self, message_id, self.channels[channel_id]))
+
+        return self
+
+################################################################################
+    def next_snowflake(self) -> int:
+
+        self._snowflake += 1
+        return self._snowflake
+
+################################################################################
+    async def rest(self, method: str, route: str) -> None:
+
+        start = time.perf_counter()
+        # Always yield, like a real request would, even with no latency.
+        await asyncio.sleep(self.latency)
+        Metrics.record_rest(f"{method} {route}", time.perf_counter() - start)
+
+################################################################################
+    def user(self, user_id: int) -> FakeMember:
+
+        user = self.users.get(user_id)
+        if user is None:
+            user = self.users[user_id] = FakeMember(self, user_id, f"user{user_id}", None)
+
+        return user
+
+################################################################################
+    def channel(self, channel_id: int) -> FakeChannel:
+
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            guild = self.guilds[0] if self.guilds else None
+            channel = self.channels[channel_id] = FakeChannel(self, channel_id, f"channel{channel_id}", guild)
+
+        return channel
+
+################################################################################
+class FakeGuild:
+
+    __slots__ = (
+        "_fake",
+        "id",
+        "name",
+        "members",
+        "roles",
+        "channels",
+    )
+
+    def __init__(self, fake: FakeDiscord, guild_id: int, name: str) -> None:
+
+        self._fake: FakeDiscord = fake
+
+        self.id: int = guild_id
+        self.name: str = name
+
+        self.members: Dict[int, FakeMember] = {}
+        self.roles: Dict[int, FakeRole] = {}
+        self.channels: Dict[int, FakeChannel] = {}
+
+    def __eq__(self, other: Any) -> bool:
+
+        return isinstance(other, FakeGuild) and other.id == self.id
+
+    def __hash__(self) -> int:
+
+        return hash(self.id)
+
+    @property
+    def me(self) -> FakeMember:
+
+        return self._fake.user(0)
+
+    @property
+    def member_count(self) -> int:
+
+        return len(self.members)
+
+    def get_member(self, user_id: int) -> Optional[FakeMember]:
+
+        return self.members.get(user_id)
+
+    async def fetch_member(self, user_id: int) -> FakeMember:
+
+        await self._fake.rest("GET", "/guilds/{guild_id}/members/{user_id}")
+        return self.members.get(user_id) or self._fake.user(user_id)
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+
+        return self.roles.get(role_id)
+
+    async def _fetch_role(self, role_id: int) -> Optional[FakeRole]:
+
+        await self._fake.rest("GET", "/guilds/{guild_id}/roles")
+        return self.roles.get(role_id)
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+
+        return self.channels.get(channel_id)
+
+    async def fetch_channel(self, channel_id: int) -> FakeChannel:
+
+        await self._fake.rest("GET", "/channels/{channel_id}")
+        return self._fake.channel(channel_id)
+
+################################################################################
+class FakeRole:
+
+    __slots__ = (
+        "guild",
+        "id",
+        "name",
+    )
+
+    def __init__(self, guild: FakeGuild, role_id: int, name: str) -> None:
+
+        self.guild: FakeGuild = guild
+        self.id: int = role_id
+        self.name: str = name
+
+    def __eq__(self, other: Any) -> bool:
+
+        return isinstance(other, FakeRole) and other.id == self.id
+
+    def __hash__(self) -> int:
+
+        return hash(self.id)
+
+    @property
+    def mention(self) -> str:
+
+        return f"<@&{self.id}>"
+
+    @property
+    def members(self) -> List[FakeMember]:
+
+        return [m for m in self.guild.members.values() if self in m.roles]
+
+################################################################################
+class FakeAsset:
+
+    __slots__ = ("url",)
+
+    def __init__(self, url: str) -> None:
+
+        self.url: str = url
+
+################################################################################
+class FakeMember:
+    """Doubles as both ``User`` and ``Member``."""
+
+    __slots__ = (
+        "_fake",
+        "id",
+        "name",
+        "guild",
+        "roles",
+        "joined_at",
+    )
+
+    bot = False
+
+    def __init__(self, fake: FakeDiscord, user_id: int, name: str, guild: Optional[FakeGuild]) -> None:
+
+        self._fake: FakeDiscord = fake
+
+        self.id: int = user_id
+        self.name: str = name
+        self.guild: Optional[FakeGuild] = guild
+        self.roles: List[FakeRole] = []
+        self.joined_at: datetime = datetime(2024, 1, 1, tzinfo=pytz.utc)
+
+    def __eq__(self, other: Any) -> bool:
+
+        return getattr(other, "id", None) == self.id
+
+    def __hash__(self) -> int:
+
+        return hash(self.id)
+
+    @property
+    def display_name(self) -> str:
+
+        return self.name
+
+    @property
+    def global_name(self) -> str:
+
+        return self.name
+
+    @property
+    def mention(self) -> str:
+
+        return f"<@{self.id}>"
+
+    @property
+    def display_avatar(self) -> FakeAsset:
+
+        return FakeAsset(f"https://cdn.discordapp.com/embed/avatars/{self.id % 5}.png")
+
+    avatar = display_avatar
+
+    @property
+    def _user(self) -> FakeMember:
+
+        return self
+
+    async def send(self, *args, **kwargs) -> FakeMessage:
+
+        # Opening the DM channel is a request of its own the first time.
+        await self._fake.rest("POST", "/users/@me/channels")
+        await self._fake.rest("POST", "/channels/{channel_id}/messages")
+        return FakeMessage(self._fake, self._fake.next_snowflake(), None, **kwargs)
+
+    async def add_roles(self, *roles: FakeRole, **kwargs) -> None:
+
+        for role in roles:
+            await self._fake.rest("PUT", "/guilds/{guild_id}/members/{user_id}/roles/{role_id}")
+            if role not in self.roles:
+                self.roles.append(role)
+
+    async def remove_roles(self, *roles: FakeRole, **kwargs) -> None:
+
+        for role in roles:
+            await self._fake.rest("DELETE", "/guilds/{guild_id}/members/{user_id}/roles/{role_id}")
+            if role in self.roles:
+                self.roles.remove(role)
+
+################################################################################
+class FakeTag:
+
+    __slots__ = ("id", "name")
+
+    def __init__(self, tag_id: int, name: str) -> None:
+
+        self.id: int = tag_id
+        self.name: str = name
+
+################################################################################
+class FakeChannel:
+    """Text and forum channels alike."""
+
+    __slots__ = (
+        "_fake",
+        "id",
+        "name",
+        "guild",
+        "threads",
+        "available_tags",
+        "_messages",
+    )
+
+    def __init__(
+        self,
+        fake: FakeDiscord,
+        channel_id: int,
+        name: str,
+        guild: Optional[FakeGuild],
+        tags: Optional[List[str]] = None
+    ) -> None:
+
+        self._fake: FakeDiscord = fake
+
+        self.id: int = channel_id
+        self.name: str = name
+        self.guild: Optional[FakeGuild] = guild
+
+        self.threads: List[FakeThread] = []
+        self.available_tags: List[FakeTag] = [
+            FakeTag(fake.next_snowflake(), t) for t in (tags or [])
+        ]
+        self._messages: Dict[int, FakeMessage] = {}
+
+    def __eq__(self, other: Any) -> bool:
+
+        return isinstance(other, FakeChannel) and other.id == self.id
+
+    def __hash__(self) -> int:
+
+        return hash(self.id)
+
+    @property
+    def mention(self) -> str:
+
+        return f"<#{self.id}>"
+
+    @property
+    def jump_url(self) -> str:
+
+        return f"https://discord.com/channels/{self.guild.id if self.guild else '@me'}/{self.id}"
+
+    @property
+    def last_message(self) -> Optional[FakeMessage]:
+
+        return next(reversed(self._messages.values()), None)
+
+    @property
+    def last_message_id(self) -> Optional[int]:
+
+        return next(reversed(self._messages), None)
+
+    @property
+    def message_count(self) -> int:
+
+        return len(self._messages)
+
+    def add_message(self, message: FakeMessage) -> None:
+
+        self._messages[message.id] = message
+        self._fake.messages[message.id] = message
+
+    async def send(self, *args, **kwargs) -> FakeMessage:
+
+        await self._fake.rest("POST", "/channels/{channel_id}/messages")
+
+        message = FakeMessage(self._fake, self._fake.next_snowflake(), self, **kwargs)
+        self.add_message(message)
+
+        return message
+
+    async def fetch_message(self, message_id: int) -> FakeMessage:
+
+        await self._fake.rest("GET", "/channels/{channel_id}/messages/{message_id}")
+
+        message = self._messages.get(message_id)
+        if message is None:
+            message = FakeMessage(self._fake, message_id, self)
+            self.add_message(message)
+
+        return message
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+
+        return self._messages.get(message_id) or FakeMessage(self._fake, message_id, self)
+
+    async def archived_threads(self, *args, **kwargs) -> AsyncIterator[FakeThread]:
+
+        # Synthetic forums have no archived threads, but listing them still costs a call.
+        await self._fake.rest("GET", "/channels/{channel_id}/threads/archived/public")
+        for _ in ():
+            yield
+
+    async def history(self, *args, **kwargs) -> AsyncIterator[FakeMessage]:
+
+        await self._fake.rest("GET", "/channels/{channel_id}/messages")
+        for message in list(self._messages.values()):
+            yield message
+
+    async def create_thread(self, name: str, *args, **kwargs) -> FakeThread:
+
+        await self._fake.rest("POST", "/channels/{channel_id}/threads")
+
+        thread = FakeThread(self._fake, self._fake.next_snowflake(), name, self.guild, self)
+        self.threads.append(thread)
+        self._fake.channels[thread.id] = thread
+        if self.guild is not None:
+            self.guild.channels[thread.id] = thread
+
+        # Like Discord's forums, the starter message shares the thread's ID.
+        kwargs.pop("applied_tags", None)
+        thread.add_message(FakeMessage(self._fake, thread.id, thread, **kwargs))
+
+        return thread
+
+    async def edit(self, **kwargs) -> FakeChannel:
+
+        await self._fake.rest("PATCH", "/channels/{channel_id}")
+        if "name" in kwargs:
+            self.name = kwargs["name"]
+
+        return self
+
+    async def delete(self, **kwargs) -> None:
+
+        await self._fake.rest("DELETE", "/channels/{channel_id}")
+        self._fake.channels.pop(self.id, None)
+
+################################################################################
+class FakeThread(FakeChannel):
+
+    __slots__ = ("parent",)
+
+    def __init__(
+        self,
+        fake: FakeDiscord,
+        thread_id: int,
+        name: str,
+        guild: Optional[FakeGuild],
+        parent: FakeChannel
+    ) -> None:
+
+        super().__init__(fake, thread_id, name, guild)
+
+        self.parent: FakeChannel = parent
+
+    @property
+    def parent_id(self) -> int:
+
+        return self.parent.id
+
+    async def delete(self, **kwargs) -> None:
+
+        await super().delete()
+        if self in self.parent.threads:
+            self.parent.threads.remove(self)
+
+################################################################################
+class FakeMessage:
+
+    __slots__ = (
+        "_fake",
+        "id",
+        "channel",
+        "content",
+        "embeds",
+        "attachments",
+        "author",
+    )
+
+    def __init__(self, fake: FakeDiscord, message_id: int, channel: Optional[FakeChannel], **kwargs) -> None:
+
+        self._fake: FakeDiscord = fake
+
+        self.id: int = message_id
+        self.channel: Optional[FakeChannel] = channel
+        self.content: Optional[str] = kwargs.get("content")
+        self.embeds: List[Any] = kwargs.get("embeds") or ([kwargs["embed"]] if kwargs.get("embed") else [])
+        self.attachments: List[Any] = []
+        self.author: FakeMember = fake.user(0)
+
+    def __eq__(self, other: Any) -> bool:
+
+        return isinstance(other, FakeMessage) and other.id == self.id
+
+    def __hash__(self) -> int:
+
+        return hash(self.id)
+
+    @property
+    def guild(self) -> Optional[FakeGuild]:
+
+        return self.channel.guild if self.channel is not None else None
+
+    @property
+    def jump_url(self) -> str:
+
+        guild_id = self.guild.id if self.guild is not None else "@me"
+        channel_id = self.channel.id if self.channel is not None else 0
+        return f"https://discord.com/channels/{guild_id}/{channel_id}/{self.id}"
+
+    async def fetch(self) -> FakeMessage:
+
+        await self._fake.rest("GET", "/channels/{channel_id}/messages/{message_id}")
+
+        return self
+
+    async def edit(self, **kwargs) -> FakeMessage:
+
+        await self._fake.rest("PATCH", "/channels/{channel_id}/messages/{message_id}")
+        if "content" in kwargs:
+            self.content = kwargs["content"]
+        if "embeds" in kwargs or "embed" in kwargs:
+            self.embeds = kwargs.get("embeds") or [kwargs.get("embed")]
+
+        return self
+
+    async def delete(self, **kwargs) -> None:
+
+        await self._fake.rest("DELETE", "/channels/{channel_id}/messages/{message_id}")
+        self._fake.messages.pop(self.id, None)
+
+################################################################################
+class InteractionScript:
+    """What the simulated user does once a command has responded.
+
+    Every time a view is sent or edited in, the next label in ``clicks`` is
+    pressed on it (as its own task, the way py-cord dispatches clicks); once
+    the clicks run out every view shown so far is stopped, which unwinds the
+    ``view.wait()`` calls up the stack. Modals are filled in from ``modal``
+    by input label and submitted, or dismissed if it's empty.
+    """
+
+    __slots__ = (
+        "clicks",
+        "modal",
+        "views",
+        "tasks",
+    )
+
+    def __init__(self, clicks: Optional[List[str]] = None, modal: Optional[Dict[str, str]] = None) -> None:
+
+        self.clicks: List[str] = list(clicks or [])
+        self.modal: Dict[str, str] = dict(modal or {})
+        self.views: List[Any] = []
+        self.tasks: List[asyncio.Task] = []
+
+################################################################################
+class FakeInteraction:
+    """Stands in for ``Interaction``, following an ``InteractionScript``."""
+
+    __slots__ = (
+        "_fake",
+        "_script",
+        "user",
+        "guild",
+        "client",
+        "custom_id",
+        "type",
+        "message",
+        "response",
+        "followup",
+        "responses",
+    )
+
+    def __init__(
+        self,
+        fake: FakeDiscord,
+        user: FakeMember,
+        guild: FakeGuild,
+        script: Optional[InteractionScript] = None,
+        client: Any = None,
+        custom_id: Optional[str] = None
+    ) -> None:
+
+        self._fake: FakeDiscord = fake
+        self._script: InteractionScript = script or InteractionScript()
+
+        self.user: FakeMember = user
+        self.guild: FakeGuild = guild
+        self.client: Any = client
+        self.custom_id: Optional[str] = custom_id
+        self.type: InteractionType = (
+            InteractionType.component if custom_id is not None
+            else InteractionType.application_command
+        )
+        self.message: Optional[FakeMessage] = (
+            FakeMessage(fake, fake.next_snowflake(), None) if custom_id is not None else None
+        )
+
+        self.response: FakeInteractionResponse = FakeInteractionResponse(self)
+        self.followup: FakeWebhook = FakeWebhook(self)
+        self.responses: List[Dict[str, Any]] = []
+
+    @property
+    def guild_id(self) -> int:
+
+        return self.guild.id
+
+    async def respond(self, *args, **kwargs) -> FakeInteraction:
+
+        await self._fake.rest("POST", "/interactions/{interaction_id}/{interaction_token}/callback")
+        self.responses.append(kwargs)
+        await self.present(kwargs.get("view"))
+
+        return self
+
+    async def edit(self, *args, **kwargs) -> None:
+
+        await self._fake.rest("PATCH", "/webhooks/{application_id}/{interaction_token}/messages/@original")
+        await self.present(kwargs.get("view"))
+
+    edit_original_response = edit
+
+    async def delete_original_response(self) -> None:
+
+        await self._fake.rest("DELETE", "/webhooks/{application_id}/{interaction_token}/messages/@original")
+
+    async def present(self, view: Any) -> None:
+
+        if view is None:
+            return
+
+        script = self._script
+        if view not in script.views:
+            script.views.append(view)
+
+        if not script.clicks:
+            await self.close_all()
+            return
+
+        label = script.clicks.pop(0)
+        item = next((c for c in view.children if getattr(c, "label", None) == label), None)
+        if item is None:
+            await self.close_all()
+            return
+
+        script.tasks.append(asyncio.create_task(item.callback(self._click(item))))
+
+    async def open_modal(self, modal: Any) -> None:
+
+        script = self._script
+        if not script.modal:
+            modal.stop()
+            return
+
+        for child in modal.children:
+            if child.label in script.modal:
+                child.value = script.modal[child.label]
+        script.modal = {}
+
+        script.tasks.append(asyncio.create_task(modal.callback(self._click(modal))))
+
+    async def close_all(self) -> None:
+
+        # Innermost first, so each menu's wait() returns in turn.
+        for view in reversed(self._script.views):
+            result = view.stop()
+            if inspect.isawaitable(result):
+                await result
+
+    async def settle(self) -> List[BaseException]:
+        """Waits out every click this script triggered and returns whatever
+        they raised."""
+
+        errors = []
+        while self._script.tasks:
+            tasks, self._script.tasks = self._script.tasks, []
+            for result in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(result, BaseException):
+                    errors.append(result)
+
+        await self.close_all()
+
+        return errors
+
+    def _click(self, item: Any) -> FakeInteraction:
+
+        return FakeInteraction(
+            self._fake,
+            self.user,
+            self.guild,
+            self._script,
+            self.client,
+            getattr(item, "custom_id", None) or "click"
+        )
+
+################################################################################
+class FakeInteractionResponse:
+
+    __slots__ = (
+        "_parent",
+        "_done",
+    )
+
+    def __init__(self, parent: FakeInteraction) -> None:
+
+        self._parent: FakeInteraction = parent
+        self._done: bool = False
+
+    def is_done(self) -> bool:
+
+        return self._done
+
+    async def defer(self, *args, **kwargs) -> None:
+
+        self._done = True
+        await self._parent._fake.rest("POST", "/interactions/{interaction_id}/{interaction_token}/callback")
+
+    async def send_message(self, *args, **kwargs) -> None:
+
+        self._done = True
+        await self._parent.respond(*args, **kwargs)
+
+    async def edit_message(self, *args, **kwargs) -> None:
+
+        self._done = True
+        await self._parent._fake.rest("POST", "/interactions/{interaction_id}/{interaction_token}/callback")
+        await self._parent.present(kwargs.get("view"))
+
+    async def send_modal(self, modal: Any) -> None:
+
+        self._done = True
+        await self._parent._fake.rest("POST", "/interactions/{interaction_id}/{interaction_token}/callback")
+        await self._parent.open_modal(modal)
+
+################################################################################
+class FakeWebhook:
+
+    __slots__ = ("_parent",)
+
+    def __init__(self, parent: FakeInteraction) -> None:
+
+        self._parent: FakeInteraction = parent
+
+    async def send(self, *args, **kwargs) -> FakeMessage:
+
+        fake = self._parent._fake
+        await fake.rest("POST", "/webhooks/{webhook_id}/{webhook_token}")
+        await self._parent.present(kwargs.get("view"))
+
+        return FakeMessage(fake, fake.next_snowflake(), None, **kwargs)
+
+################################################################################
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import pytz
+
+from Classes.XIVVenues import XIVVenue
+from Utilities import DataCenter, GameWorld, HousingZone, VenueForumTag
+
+if TYPE_CHECKING:
+    from .FakeDiscord import FakeDiscord
+################################################################################
+
+__all__ = ("FakeXIVVenues",)
+
+################################################################################
+class FakeXIVVenues:
+    """Stands in for ``XIVVenuesClient``, answering from a set of listings
+    registered up front instead of the FFXIV Venues API. Lookups are charged
+    as REST calls against ``FakeDiscord`` so they show up in the metrics."""
+
+    __slots__ = (
+        "_fake",
+        "_rng",
+        "_listings",
+    )
+
+################################################################################
+    def __init__(self, fake: FakeDiscord, seed: int = 0) -> None:
+
+        self._fake: FakeDiscord = fake
+        self._rng: random.Random = random.Random(seed)
+
+        # manager ID -> raw API payloads
+        self._listings: Dict[int, List[Dict[str, Any]]] = {}
+
+################################################################################
+    def add_listing(self, name: str, manager_id: int) -> None:
+
+        while True:
+            world = self._rng.choice(list(GameWorld))
+            try:
+                dc = DataCenter.from_world(world)
+            except Exception:
+                continue
+            if dc is not None:
+                break
+
+        tags = [t.proper_name for t in VenueForumTag]
+        self._listings.setdefault(manager_id, []).append({
+            "id": f"{self._rng.getrandbits(48):012x}",
+            "name": name,
+            "added": datetime.now(pytz.utc).isoformat(),
+            "description": ["Imported during a load test."],
+            "location": {
+                "dataCenter": dc.proper_name,
+                "world": world.proper_name,
+                "district": self._rng.choice(list(HousingZone)).name,
+                "ward": self._rng.randint(1, 30),
+                "plot": self._rng.randint(1, 60),
+                "apartment": 0,
+                "room": 0,
+                "subdivision": False,
+            },
+            "sfw": self._rng.random() < 0.7,
+            "hiring": True,
+            "tags": self._rng.sample(tags, k=min(len(tags), 3)),
+            "managers": [str(manager_id)],
+            "schedule": [],
+            "scheduleOverrides": [],
+        })
+
+################################################################################
+    async def get_venues_by_manager(self, manager_id: int) -> List[XIVVenue]:
+
+        await self._fake.rest("GET", "/venue?manager={manager_id}")
+        return [XIVVenue.from_data(v) for v in self._listings.get(manager_id, [])]
+
+################################################################################
+    async def get_venues_by_name(self, name: str) -> List[XIVVenue]:
+
+        await self._fake.rest("GET", "/venue?search={name}")
+        return [
+            XIVVenue.from_data(v)
+            for listings in self._listings.values() for v in listings
+            if name.lower() in v["name"].lower()
+        ]
+
+################################################################################
+    async def get_all_venues(self) -> List[XIVVenue]:
+
+        await self._fake.rest("GET", "/venue")
+        return [XIVVenue.from_data(v) for listings in self._listings.values() for v in listings]
+
+################################################################################
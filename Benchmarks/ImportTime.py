@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from .Runner import BenchHistory, bench_environment
+################################################################################
+
+__all__ = ("ImportProfiler", "LAZY_MODULES")
+
+################################################################################
+
+# Heavy optional dependencies that must not be loaded just by starting the bot.
+LAZY_MODULES = ("pandas", "openpyxl", "PIL", "flask", "requests")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in a fresh interpreter, so nothing is already in sys.modules. Imports
+# what main.py does - the bot and every Cog - and reports how long that took
+# and which of the lazy modules came along with it.
+_CHILD = """
+import importlib, json, os, sys, time
+root, lazy = sys.argv[1], sys.argv[2:]
+start = time.perf_counter()
+import discord, dotenv
+import Classes.Bot
+for filename in sorted(os.listdir(os.path.join(root, "Cogs"))):
+    if filename.endswith(".py") and filename != "__init__.py":
+        importlib.import_module(f"Cogs.{filename[:-3]}")
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "eager": [m for m in lazy if m in sys.modules]}))
+"""
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+################################################################################
+class ImportProfiler:
+    """Times a cold start's imports, each sample in its own interpreter.
+
+    Bytecode caches are left warm - that's what a restart in production
+    sees - so the number is the cost of executing the module bodies. One
+    extra run under ``-X importtime`` breaks the total down by top-level
+    package, so a regression can be traced to whatever started loading.
+    """
+
+    __slots__ = (
+        "iterations",
+        "_timings",
+        "_eager",
+        "_breakdown",
+    )
+
+    SCENARIO = "import.cold_start"
+
+################################################################################
+    def __init__(self, iterations: int = 5) -> None:
+
+        self.iterations: int = iterations
+
+        self._timings: List[float] = []
+        self._eager: List[str] = []
+        self._breakdown: List[Tuple[str, float]] = []
+
+################################################################################
+    @property
+    def config(self) -> Dict[str, Any]:
+
+        return {
+            "target": "import_time",
+            "python": platform.python_version(),
+        }
+
+################################################################################
+    @property
+    def eager(self) -> List[str]:
+        """Lazy modules that were imported at startup anyway."""
+
+        return self._eager
+
+################################################################################
+    @property
+    def breakdown(self) -> List[Tuple[str, float]]:
+        """(top-level package, cumulative ms), slowest first."""
+
+        return self._breakdown
+
+################################################################################
+    def run(self) -> Dict[str, Dict[str, Any]]:
+
+        with bench_environment():
+            for _ in range(self.iterations):
+                sample = json.loads(self._spawn().stdout)
+                self._timings.append(sample["ms"])
+                self._eager = sample["eager"]
+
+            self._breakdown = self._parse_importtime(self._spawn("-X", "importtime").stderr)
+
+        return {
+            self.SCENARIO: {
+                "iterations": len(self._timings),
+                "min_ms": round(min(self._timings), 3),
+                "median_ms": round(statistics.median(self._timings), 3),
+                "mean_ms": round(statistics.fmean(self._timings), 3),
+            }
+        }
+
+################################################################################
+    @staticmethod
+    def _spawn(*flags: str) -> subprocess.CompletedProcess:
+
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        return subprocess.run(
+            [sys.executable, *flags, "-c", _CHILD, ROOT, *LAZY_MODULES],
+            capture_output=True, text=True, check=True, env=env
+        )
+
+################################################################################
+    @staticmethod
+    def _parse_importtime(output: str) -> List[Tuple[str, float]]:
+
+        totals: Dict[str, float] = {}
+        for line in output.splitlines():
+            match = _IMPORTTIME.match(line)
+            # Only outermost imports - nested ones are already in their
+            # parent's cumulative time.
+            if match is None or len(match.group(3)) != 1:
+                continue
+            package = match.group(4).split(".")[0]
+            totals[package] = totals.get(package, 0.0) + int(match.group(2)) / 1000
+
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+################################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m Benchmarks.ImportTime",
+        description="Measure cold-start import time and fail if it goes over budget."
+    )
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=None,
+        help="Fail if the median import time exceeds this many milliseconds."
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="Median slowdown (as a fraction) that counts as a regression."
+    )
+    parser.add_argument("--top", type=int, default=10, help="Packages to list in the breakdown.")
+    parser.add_argument("--history", default=None, help="Path to the history file.")
+    parser.add_argument("--no-record", action="store_true", help="Don't append this run to the history.")
+    args = parser.parse_args()
+
+    profiler = ImportProfiler(args.iterations)
+    results = profiler.run()
+    result = results[ImportProfiler.SCENARIO]
+
+    history = BenchHistory(args.history)
+    commit = history.current_commit()
+    baseline: Optional[Dict[str, Any]] = history.baseline(commit, profiler.config)
+    regressions = (
+        history.regressions(baseline, results, args.threshold)
+        if baseline is not None else {}
+    )
+
+    print(f"Commit {commit} | python {platform.python_version()} | iterations={args.iterations}")
+    if baseline is not None:
+        print(f"Compared against {baseline['commit']} ({baseline['timestamp']})")
+    print()
+    print(
+        f"Cold-start imports: min {result['min_ms']:.1f} ms, "
+        f"median {result['median_ms']:.1f} ms, mean {result['mean_ms']:.1f} ms"
+    )
+    print()
+    print(f"{'Package':<30} {'cumulative ms':>14}")
+    for package, ms in profiler.breakdown[:args.top]:
+        print(f"{package[:30]:<30} {ms:>14.1f}")
+    print()
+
+    failures = []
+    if profiler.eager:
+        failures.append(f"loaded at startup but should be lazy: {', '.join(profiler.eager)}")
+    if args.budget is not None and result["median_ms"] > args.budget:
+        failures.append(f"median {result['median_ms']:.1f} ms is over the {args.budget:.1f} ms budget")
+    if ImportProfiler.SCENARIO in regressions:
+        failures.append(f"median regressed +{regressions[ImportProfiler.SCENARIO]:.0%}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    if not args.no_record:
+        history.append(commit, profiler.config, results)
+
+    return 1 if failures else 0
+
+################################################################################
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+################################################################################
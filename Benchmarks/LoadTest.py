@@ -0,0 +1,528 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
+
+from UI.Common import PersistentView
+from Utilities import Metrics
+from .Dataset import SIZES, SyntheticDataset
+from .FakeDiscord import FakeInteraction, InteractionScript
+from .Runner import bench_environment, start_bot
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+    from .BenchBot import BenchBot
+    from .FakeDiscord import FakeMember
+################################################################################
+
+__all__ = (
+    "LoadEvent",
+    "LoadStream",
+    "LoadDriver",
+    "LoopLagMonitor",
+    "ACTIONS",
+)
+
+################################################################################
+class LoadContext:
+    """What an action gets to pick its target and build its interaction."""
+
+    __slots__ = (
+        "bot",
+        "guild",
+        "dataset",
+        "rng",
+    )
+
+    def __init__(self, bot: BenchBot, guild: GuildData, dataset: SyntheticDataset, rng: random.Random) -> None:
+
+        self.bot: BenchBot = bot
+        self.guild: GuildData = guild
+        self.dataset: SyntheticDataset = dataset
+        self.rng: random.Random = rng
+
+    def member(self, user_id: Optional[int] = None) -> FakeMember:
+
+        return self.bot.fake.user(user_id or self.rng.choice(self.dataset.member_ids))
+
+    def interaction(self, user: FakeMember, *, custom_id: Optional[str] = None, **script) -> FakeInteraction:
+
+        return FakeInteraction(
+            self.bot.fake,
+            user,
+            self.bot.fake.guilds[0],
+            InteractionScript(**script),
+            client=self.bot,
+            custom_id=custom_id
+        )
+
+################################################################################
+
+# Action name -> coroutine that performs it and returns the interaction it
+# used (so the driver can wait for any clicks it scripted), if any.
+Action = Callable[[LoadContext], Awaitable[Optional[FakeInteraction]]]
+ACTIONS: Dict[str, Action] = {}
+
+def action(name: str) -> Callable[[Action], Action]:
+
+    def decorator(func: Action) -> Action:
+        ACTIONS[name] = func
+        return func
+
+    return decorator
+
+################################################################################
+@action("/trainer dashboard")
+async def trainer_dashboard(ctx: LoadContext) -> None:
+
+    tusers = ctx.guild.training_manager.tusers
+    trainers = [t for t in tusers if t.trainings_as_trainer] or tusers
+    tuser = ctx.guild.training_manager[ctx.rng.choice(trainers).user_id]
+
+    # The paginator insists on a real Interaction, so render the pages it
+    # would be handed - that's where the work is.
+    tuser.dashboard_pages(ctx.member(tuser.user_id))
+
+################################################################################
+@action("/staffing profile")
+async def profile_edit(ctx: LoadContext) -> FakeInteraction:
+
+    user = ctx.member(ctx.rng.choice(ctx.dataset.tables["profile_master"])[1])
+    interaction = ctx.interaction(
+        user,
+        clicks=["Main Info & Details", "Character Name"],
+        modal={"Name": f"Load Test {ctx.rng.randint(0, 9999)}"}
+    )
+
+    profile = ctx.guild.get_or_create_profile(user)  # type: ignore
+    await profile.main_menu(interaction)  # type: ignore
+
+    return interaction
+
+################################################################################
+@action("/jobs create_post")
+async def jobs_create_post(ctx: LoadContext) -> Optional[FakeInteraction]:
+
+    venues = [v for v in ctx.guild.venue_manager.venues if v.authorized_users]
+    if not venues:
+        return
+
+    venue = ctx.rng.choice(venues)
+    interaction = ctx.interaction(ctx.rng.choice(venue.authorized_users))  # type: ignore
+
+    await ctx.guild.jobs_manager.create_new(interaction, venue.name)  # type: ignore
+
+    return interaction
+
+################################################################################
+@action("/venue import")
+async def venue_import(ctx: LoadContext) -> FakeInteraction:
+
+    user = ctx.member()
+    name = f"Imported Venue {ctx.rng.getrandbits(32):08x}"
+    ctx.bot.veni_client.add_listing(name, user.id)
+
+    interaction = ctx.interaction(user, clicks=["Confirm"])
+    await ctx.guild.venue_manager.import_venue(interaction, name)  # type: ignore
+
+    return interaction
+
+################################################################################
+@action("JobPostingPickupView.accept")
+async def job_posting_accept(ctx: LoadContext) -> Optional[FakeInteraction]:
+
+    postings = [p for p in ctx.guild.jobs_manager.all_postings if p.post_message is not None]
+    if not postings:
+        return
+
+    posting = ctx.rng.choice(postings)
+    interaction = ctx.interaction(ctx.member(), custom_id=f"{posting.id}_accept")
+    await PersistentView.dispatch(interaction)  # type: ignore
+
+    return interaction
+
+################################################################################
+class LoadEvent:
+
+    __slots__ = (
+        "at",
+        "action",
+        "seed",
+    )
+
+    def __init__(self, at: float, action: str, seed: int) -> None:
+
+        self.at: float = at
+        self.action: str = action
+        # Picks the event's target, so a replay hits the same records.
+        self.seed: int = seed
+
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {"at": round(self.at, 4), "action": self.action, "seed": self.seed}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> LoadEvent:
+
+        return cls(float(data["at"]), data["action"], int(data.get("seed", 0)))
+
+################################################################################
+class LoadStream:
+    """A timed sequence of interactions, stored as JSON lines of
+    ``{"at": seconds, "action": name, "seed": int}``. Action names are the
+    same ones ``Metrics`` records interactions under."""
+
+    __slots__ = ("events",)
+
+    DEFAULT_MIX = {
+        "/trainer dashboard": 4,
+        "/staffing profile": 3,
+        "JobPostingPickupView.accept": 2,
+        "/jobs create_post": 1,
+        "/venue import": 1,
+    }
+
+################################################################################
+    def __init__(self, events: List[LoadEvent]) -> None:
+
+        self.events: List[LoadEvent] = sorted(events, key=lambda e: e.at)
+
+################################################################################
+    @classmethod
+    def synthetic(
+        cls,
+        rate: float,
+        duration: float,
+        seed: int = 0,
+        mix: Optional[Dict[str, int]] = None
+    ) -> LoadStream:
+        """Poisson arrivals at ``rate`` per second, actions drawn by weight."""
+
+        rng = random.Random(seed)
+        mix = mix or cls.DEFAULT_MIX
+        names, weights = list(mix), list(mix.values())
+
+        events, at = [], 0.0
+        while True:
+            at += rng.expovariate(rate)
+            if at >= duration:
+                break
+            events.append(LoadEvent(at, rng.choices(names, weights)[0], rng.getrandbits(32)))
+
+        return cls(events)
+
+################################################################################
+    @classmethod
+    def load(cls, path: str) -> LoadStream:
+
+        with open(path, "r") as f:
+            return cls([LoadEvent.from_dict(json.loads(line)) for line in f if line.strip()])
+
+################################################################################
+    def save(self, path: str) -> None:
+
+        with open(path, "w") as f:
+            for event in self.events:
+                f.write(json.dumps(event.to_dict()) + "\n")
+
+################################################################################
+    @property
+    def duration(self) -> float:
+
+        return self.events[-1].at if self.events else 0.0
+
+################################################################################
+class LoopLagMonitor:
+    """Measures how late the event loop wakes a task that asked to sleep for
+    ``interval`` - anything blocking the loop shows up here directly."""
+
+    __slots__ = (
+        "interval",
+        "samples",
+        "_task",
+    )
+
+    def __init__(self, interval: float = 0.01) -> None:
+
+        self.interval: float = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, (time.perf_counter() - start - self.interval) * 1000))
+
+################################################################################
+class _ActionStats:
+
+    __slots__ = (
+        "latencies",
+        "db_statements",
+        "rest_calls",
+        "errors",
+        "failed",
+    )
+
+    def __init__(self) -> None:
+
+        self.latencies: List[float] = []
+        self.db_statements: List[int] = []
+        self.rest_calls: List[int] = []
+        self.errors: List[str] = []
+        # Interactions with at least one error
+        self.failed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "count": len(self.latencies),
+            **percentiles(self.latencies),
+            "db_mean": round(sum(self.db_statements) / len(self.db_statements), 1) if self.db_statements else 0,
+            "db_p95": percentiles(self.db_statements)["p95"],
+            "rest_mean": round(sum(self.rest_calls) / len(self.rest_calls), 1) if self.rest_calls else 0,
+            "errors": len(self.errors),
+            "failed": self.failed,
+            "first_error": self.errors[0] if self.errors else None,
+        }
+
+################################################################################
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """Nearest-rank p50/p95/p99/max."""
+
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+    ordered = sorted(values)
+
+    def rank(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)], 2)
+
+    return {"p50": rank(0.50), "p95": rank(0.95), "p99": rank(0.99), "max": round(ordered[-1], 2)}
+
+################################################################################
+class LoadDriver:
+    """Replays a ``LoadStream`` against a loaded ``BenchBot``.
+
+    Arrivals are open-loop: every event is started at its scheduled time
+    whether or not earlier ones have finished, so slow interactions pile up
+    the way they would under real traffic instead of throttling the load.
+    """
+
+    __slots__ = (
+        "bot",
+        "dataset",
+        "stream",
+        "speed",
+        "_stats",
+        "_skipped",
+        "_lag",
+    )
+
+################################################################################
+    def __init__(self, bot: BenchBot, dataset: SyntheticDataset, stream: LoadStream, speed: float = 1.0) -> None:
+
+        self.bot: BenchBot = bot
+        self.dataset: SyntheticDataset = dataset
+        self.stream: LoadStream = stream
+        self.speed: float = speed
+
+        self._stats: Dict[str, _ActionStats] = {}
+        self._skipped: Dict[str, int] = {}
+        self._lag: LoopLagMonitor = LoopLagMonitor()
+
+################################################################################
+    async def run(self) -> Dict[str, Any]:
+
+        guild = self.bot.guild_manager.fguilds[0]
+        loop = asyncio.get_running_loop()
+
+        self._lag.start()
+        start = loop.time()
+
+        tasks = []
+        for event in self.stream.events:
+            delay = start + event.at / self.speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self._fire(guild, event)))
+
+        await asyncio.gather(*tasks)
+        elapsed = loop.time() - start
+        await self._lag.stop()
+
+        everything = _ActionStats()
+        for stats in self._stats.values():
+            everything.latencies += stats.latencies
+            everything.db_statements += stats.db_statements
+            everything.rest_calls += stats.rest_calls
+            everything.errors += stats.errors
+            everything.failed += stats.failed
+
+        return {
+            "events": len(tasks),
+            "elapsed_s": round(elapsed, 2),
+            "throughput": round(len(tasks) / elapsed, 2) if elapsed else 0.0,
+            "overall": everything.to_dict(),
+            "actions": {name: s.to_dict() for name, s in sorted(self._stats.items())},
+            "loop_lag_ms": percentiles(self._lag.samples),
+            "skipped": self._skipped,
+        }
+
+################################################################################
+    async def _fire(self, guild: GuildData, event: LoadEvent) -> None:
+
+        func = ACTIONS.get(event.action)
+        if func is None:
+            self._skipped[event.action] = self._skipped.get(event.action, 0) + 1
+            return
+
+        stats = self._stats.get(event.action)
+        if stats is None:
+            stats = self._stats[event.action] = _ActionStats()
+
+        ctx = LoadContext(self.bot, guild, self.dataset, random.Random(event.seed))
+        errors = []
+
+        async with Metrics.track(event.action) as sample:
+            start = time.perf_counter()
+            try:
+                interaction = await func(ctx)
+                if interaction is not None:
+                    errors = await interaction.settle()
+            except Exception as ex:
+                errors = [ex]
+            elapsed = time.perf_counter() - start
+
+        stats.latencies.append(elapsed * 1000)
+        stats.db_statements.append(sample.db_statements)
+        stats.rest_calls.append(sample.rest_calls)
+        stats.errors += [f"{type(e).__name__}: {e}" for e in errors]
+        stats.failed += bool(errors)
+
+################################################################################
+def render(report: Dict[str, Any]) -> str:
+
+    lines = [
+        f"{report['events']} interactions in {report['elapsed_s']}s "
+        f"({report['throughput']}/s)",
+        "",
+        f"{'Action':<30} {'n':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'db':>6} {'rest':>6} {'err':>4}",
+    ]
+    for name, s in [*report["actions"].items(), ("(all)", report["overall"])]:
+        lines.append(
+            f"{name[:30]:<30} {s['count']:>5} {s['p50']:>8.1f} {s['p95']:>8.1f} "
+            f"{s['p99']:>8.1f} {s['db_mean']:>6.1f} {s['rest_mean']:>6.1f} {s['errors']:>4}"
+        )
+
+    lag = report["loop_lag_ms"]
+    lines.append("")
+    lines.append(
+        f"Event loop lag (ms): p50 {lag['p50']} | p95 {lag['p95']} | "
+        f"p99 {lag['p99']} | max {lag['max']}"
+    )
+
+    for name, s in report["actions"].items():
+        if s["first_error"]:
+            lines.append(f"{name}: {s['first_error']}")
+    if report["skipped"]:
+        lines.append(f"Skipped (no such action): {report['skipped']}")
+
+    return "\n".join(lines)
+
+################################################################################
+def error_rates(report: Dict[str, Any], limit: float) -> Dict[str, float]:
+    """Action -> fraction of its interactions that errored, for every
+    action over ``limit``."""
+
+    ret = {}
+    for name, s in report["actions"].items():
+        rate = s["failed"] / s["count"] if s["count"] else 0.0
+        if rate > limit:
+            ret[name] = rate
+
+    return ret
+
+################################################################################
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+
+    dataset = SyntheticDataset.from_name(args.size, args.seed)
+    stream = (
+        LoadStream.load(args.stream) if args.stream
+        else LoadStream.synthetic(args.rate, args.duration, args.seed)
+    )
+    if args.save_stream:
+        stream.save(args.save_stream)
+
+    with bench_environment(args.with_logging):
+        bot = await start_bot(dataset, args.rest_latency, args.db_latency)
+        Metrics.reset()
+        try:
+            return await LoadDriver(bot, dataset, stream, args.speed).run()
+        finally:
+            await bot.close()
+
+################################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m Benchmarks.LoadTest",
+        description="Replay a stream of interactions against the bot at a target rate."
+    )
+    parser.add_argument("--size", choices=sorted(SIZES), default="medium")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=20.0, help="Interactions per second (synthetic streams).")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of traffic (synthetic streams).")
+    parser.add_argument("--stream", default=None, help="Replay this JSONL stream instead of generating one.")
+    parser.add_argument("--save-stream", default=None, help="Write the stream that was run to this path.")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed multiplier.")
+    parser.add_argument("--rest-latency", type=float, default=0.05)
+    parser.add_argument("--db-latency", type=float, default=0.002)
+    parser.add_argument("--with-logging", action="store_true")
+    parser.add_argument("--json", default=None, help="Also write the full report to this path.")
+    parser.add_argument(
+        "--max-error-rate", type=float, default=0.0,
+        help="Fail if more than this fraction of any action's interactions errored."
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(render(report))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    failed = error_rates(report, args.max_error_rate)
+    for name, rate in failed.items():
+        print(f"FAIL: {name} errored on {rate:.0%} of interactions (limit {args.max_error_rate:.0%})")
+
+    return 1 if failed else 0
+
+################################################################################
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+################################################################################
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+import pytz
+
+from Classes.ReportManager import ReportManager
+from Utilities import Metrics, NSFWPreference, RPLevel, VenueForumTag
+from .BenchBot import BenchBot
+from .FakeDiscord import FakeInteraction
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+    from .Dataset import SyntheticDataset
+################################################################################
+
+__all__ = ("BenchRunner", "BenchHistory", "ScenarioResult", "bench_environment", "start_bot")
+
+################################################################################
+@contextmanager
+def bench_environment(with_logging: bool = False) -> Iterator[str]:
+    """Runs the block from a scratch directory with the bot's on-disk state
+    pointed into it, and logging off unless asked for. Yields the directory."""
+
+    # The file handler is created at import time, so the only way to keep
+    # it quiet (and out of the numbers) is to disable logging outright.
+    if not with_logging:
+        logging.disable(logging.CRITICAL)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        # Anything the bot writes to disk (timers, reports) lands here.
+        os.chdir(tmp)
+        os.environ["DISABLE_SNAPSHOT"] = "True"
+        # Neither "True" nor "False", so no debug-guild filtering, query
+        # echoing, or production-only side effects.
+        os.environ["DEBUG"] = "Bench"
+        # Don't open the webhook port.
+        os.environ["WEBHOOK_SECRET"] = ""
+        # Shorten offline, never against cutt.ly.
+        os.environ["URL_SHORTENER"] = "local"
+
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+            logging.disable(logging.NOTSET)
+
+################################################################################
+async def start_bot(dataset: SyntheticDataset, rest_latency: float = 0.0, db_latency: float = 0.0) -> BenchBot:
+
+    bot = BenchBot(dataset, rest_latency, db_latency)
+    with redirect_stdout(io.StringIO()):
+        await bot.load_all()
+
+    return bot
+
+################################################################################
+class ScenarioResult:
+
+    __slots__ = (
+        "name",
+        "timings",
+        "db_statements",
+        "rest_calls",
+    )
+
+################################################################################
+    def __init__(self, name: str) -> None:
+
+        self.name: str = name
+        self.timings: List[float] = []
+        self.db_statements: List[int] = []
+        self.rest_calls: List[int] = []
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "iterations": len(self.timings),
+            "min_ms": round(min(self.timings), 3),
+            "median_ms": round(statistics.median(self.timings), 3),
+            "mean_ms": round(statistics.fmean(self.timings), 3),
+            "db_statements": round(statistics.fmean(self.db_statements), 1),
+            "rest_calls": round(statistics.fmean(self.rest_calls), 1),
+        }
+
+################################################################################
+class BenchRunner:
+    """Runs every scenario against a synthetic guild and collects timings.
+
+    Each scenario is timed with ``perf_counter`` inside ``Metrics.track`` so
+    the database statements and REST calls it made are counted alongside
+    its wall time. Scenarios share one loaded bot, except ``Bot.load_all``
+    which gets a fresh one every iteration.
+    """
+
+    __slots__ = (
+        "dataset",
+        "iterations",
+        "rest_latency",
+        "db_latency",
+        "with_logging",
+        "_rng",
+        "_results",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        dataset: SyntheticDataset,
+        iterations: int = 5,
+        rest_latency: float = 0.0,
+        db_latency: float = 0.0,
+        with_logging: bool = False
+    ) -> None:
+
+        self.dataset: SyntheticDataset = dataset
+        self.iterations: int = iterations
+        self.rest_latency: float = rest_latency
+        self.db_latency: float = db_latency
+        self.with_logging: bool = with_logging
+
+        self._rng: random.Random = random.Random(dataset.seed)
+        self._results: Dict[str, ScenarioResult] = {}
+
+################################################################################
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Everything that has to match for two runs to be comparable."""
+
+        return {
+            "size": self.dataset.size.to_dict(),
+            "seed": self.dataset.seed,
+            "rest_latency": self.rest_latency,
+            "db_latency": self.db_latency,
+            "with_logging": self.with_logging,
+        }
+
+################################################################################
+    async def run(self) -> Dict[str, Dict[str, Any]]:
+
+        with bench_environment(self.with_logging):
+            Metrics.reset()
+            await self._run_all()
+
+        return {name: r.to_dict() for name, r in self._results.items()}
+
+################################################################################
+    async def _run_all(self) -> None:
+
+        await self._measure("Bot.load_all", self._load_all)
+
+        bot = await start_bot(self.dataset, self.rest_latency, self.db_latency)
+        guild = bot.guild_manager.fguilds[0]
+
+        payload = bot.database._load_all()
+        await self._measure("Database._load_all", self._sync(bot.database._load_all))
+        await self._measure("Bot._parse_data", self._sync(lambda: bot._parse_data(payload)))
+
+        await self._measure(
+            "TrainingManager._matching_routine",
+            self._sync(lambda: self._matching_batch(guild))
+        )
+
+        postings = [p for p in guild.jobs_manager.all_postings if p.post_message is not None]
+        if postings:
+            await self._measure(
+                "JobPosting.notify_eligible_applicants",
+                lambda: self._rng.choice(postings).notify_eligible_applicants()
+            )
+
+        interaction = FakeInteraction(bot.fake, bot.fake.user(self.dataset.member_ids[0]), bot.fake.guilds[0])
+        members = list(bot.fake.guilds[0].members.values())
+        roles = list(bot.fake.guilds[0].roles.values())
+        await self._measure(
+            "ReportManager.roles_report",
+            lambda: ReportManager.roles_report(interaction, members, roles)  # type: ignore
+        )
+
+        # Uncached, so the history keeps tracking the cost of a full re-score.
+        ranker = guild.training_manager.ranker
+        await self._measure(
+            "TrainerRanker.rank_all",
+            self._sync(lambda: (ranker.invalidate(), ranker.rank_all()))
+        )
+        await self._measure("TrainerRanker.rank_all.cached", self._sync(ranker.rank_all))
+        await self._measure(
+            "VenueManager._get_venue_page_groups",
+            self._sync(guild.venue_manager._get_venue_page_groups)
+        )
+        await self._measure(
+            "Position.status",
+            self._sync(lambda: [p.status() for p in guild.position_manager.positions])
+        )
+
+        # Leaving is destructive, so every iteration takes a different member.
+        leavers = iter(self.dataset.member_ids)
+        await self._measure(
+            "GuildData.on_member_leave",
+            lambda: guild.on_member_leave(bot.fake.guilds[0].members[next(leavers)])  # type: ignore
+        )
+
+        await bot.close()
+
+################################################################################
+    async def _load_all(self) -> None:
+
+        bot = await start_bot(self.dataset, self.rest_latency, self.db_latency)
+        await bot.close()
+
+################################################################################
+    def _matching_batch(self, guild: GuildData, n: int = 50) -> None:
+
+        tags = list(VenueForumTag)
+        for _ in range(n):
+            guild.training_manager._matching_routine(
+                self._rng.choice(list(RPLevel)),
+                self._rng.choice(list(NSFWPreference)),
+                self._rng.sample(tags, self._rng.randint(0, min(3, len(tags))))
+            )
+
+################################################################################
+    @staticmethod
+    def _sync(func: Callable[[], Any]) -> Callable[[], Awaitable[None]]:
+
+        async def wrapper() -> None:
+            func()
+
+        return wrapper
+
+################################################################################
+    async def _measure(self, name: str, func: Callable[[], Awaitable[Any]]) -> None:
+
+        result = self._results[name] = ScenarioResult(name)
+
+        for _ in range(self.iterations):
+            async with Metrics.track(name) as sample:
+                start = time.perf_counter()
+                await func()
+                elapsed = time.perf_counter() - start
+
+            result.timings.append(elapsed * 1000)
+            result.db_statements.append(sample.db_statements)
+            result.rest_calls.append(sample.rest_calls)
+
+################################################################################
+class BenchHistory:
+    """Append-only log of benchmark runs, one JSON object per line.
+
+    A run is compared against the most recent run of the same config from a
+    *different* commit, so re-running on the same commit never compares
+    against itself.
+    """
+
+    __slots__ = ("_path",)
+
+    DEFAULT_PATH = "bench_history.jsonl"
+
+################################################################################
+    def __init__(self, path: Optional[str] = None) -> None:
+
+        self._path: str = path or os.getenv("BENCH_HISTORY") or self.DEFAULT_PATH
+
+################################################################################
+    @staticmethod
+    def current_commit() -> str:
+
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return "unknown"
+
+################################################################################
+    def _entries(self) -> List[Dict[str, Any]]:
+
+        if not os.path.exists(self._path):
+            return []
+
+        ret = []
+        with open(self._path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    ret.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+        return ret
+
+################################################################################
+    def baseline(self, commit: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+
+        for entry in reversed(self._entries()):
+            if entry.get("commit") != commit and entry.get("config") == config:
+                return entry
+
+################################################################################
+    def append(self, commit: str, config: Dict[str, Any], results: Dict[str, Dict[str, Any]]) -> None:
+
+        entry = {
+            "commit": commit,
+            "timestamp": datetime.now(pytz.utc).isoformat(),
+            "config": config,
+            "results": results,
+        }
+        with open(self._path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+################################################################################
+    @staticmethod
+    def regressions(
+        baseline: Dict[str, Any],
+        results: Dict[str, Dict[str, Any]],
+        threshold: float
+    ) -> Dict[str, float]:
+        """Scenario -> fractional slowdown of its median, for every scenario
+        that got slower than ``threshold`` (0.10 == 10%)."""
+
+        ret = {}
+        for name, result in results.items():
+            before = baseline["results"].get(name)
+            if not before or not before["median_ms"]:
+                continue
+            change = (result["median_ms"] - before["median_ms"]) / before["median_ms"]
+            if change > threshold:
+                ret[name] = change
+
+        return ret
+
+################################################################################
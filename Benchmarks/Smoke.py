@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+from typing import Dict, List
+
+from Utilities.Metrics import Metrics
+from .Dataset import SIZES, SyntheticDataset
+from .LoadTest import ACTIONS, LoadContext
+from .Runner import bench_environment, start_bot
+################################################################################
+
+__all__ = ("smoke",)
+
+# Modules whose ``Metrics`` name has to be the class - under main.py's import
+# order it used to resolve to the Utilities.Metrics module instead.
+METRICS_USERS = ("UI.Common.FroggeView", "UI.Common.PersistentView")
+
+################################################################################
+async def smoke(size: str = "small", seed: int = 0, rounds: int = 3) -> Dict[str, List[str]]:
+    """Runs every load-test action ``rounds`` times against the real bot -
+    imported the way main.py imports it - and returns action -> errors."""
+
+    failures: Dict[str, List[str]] = {}
+
+    for name in METRICS_USERS:
+        if sys.modules[name].Metrics is not Metrics:
+            failures.setdefault("imports", []).append(f"{name}.Metrics is not the Metrics class")
+
+    dataset = SyntheticDataset.from_name(size, seed)
+    with bench_environment():
+        bot = await start_bot(dataset)
+        try:
+            guild = bot.guild_manager.fguilds[0]
+            for name, func in ACTIONS.items():
+                for i in range(rounds):
+                    ctx = LoadContext(bot, guild, dataset, random.Random(seed + i))
+                    try:
+                        interaction = await func(ctx)
+                        errors = await interaction.settle() if interaction is not None else []
+                    except Exception as ex:
+                        errors = [ex]
+                    if errors:
+                        failures.setdefault(name, []).extend(f"{type(e).__name__}: {e}" for e in errors)
+        finally:
+            await bot.close()
+
+    return failures
+
+################################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m Benchmarks.Smoke",
+        description="Click through every load-test action once per round and fail on any error."
+    )
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    failures = asyncio.run(smoke(args.size, args.seed, args.rounds))
+    for name, errors in failures.items():
+        print(f"FAIL {name}: {len(errors)} error(s), first: {errors[0]}")
+
+    if not failures:
+        print(f"OK - {len(ACTIONS)} actions x {args.rounds} rounds.")
+
+    return 1 if failures else 0
+
+################################################################################
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+################################################################################
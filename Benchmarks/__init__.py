@@ -0,0 +1,8 @@
+# Modules
+from .BenchBot import BenchBot
+from .Dataset import DatasetSize, SyntheticDataset, SIZES
+from .FakeDatabase import BenchDatabase
+from .FakeDiscord import *
+from .FakeXIVVenues import FakeXIVVenues
+from .Runner import BenchHistory, BenchRunner, ScenarioResult
+################################################################################
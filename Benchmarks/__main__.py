@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from .Dataset import SIZES, SyntheticDataset
+from .Runner import BenchHistory, BenchRunner
+################################################################################
+
+def parse_args() -> argparse.Namespace:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m Benchmarks",
+        description="Benchmark the bot against a synthetic guild."
+    )
+    parser.add_argument("--size", choices=sorted(SIZES), default="medium")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument(
+        "--rest-latency", type=float, default=0.0,
+        help="Simulated seconds per Discord REST call."
+    )
+    parser.add_argument(
+        "--db-latency", type=float, default=0.0,
+        help="Simulated seconds per database statement."
+    )
+    parser.add_argument(
+        "--with-logging", action="store_true",
+        help="Leave logging on. It's disabled by default to keep it out of the timings."
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="Median slowdown (as a fraction) that counts as a regression."
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true",
+        help="Exit non-zero if any scenario regressed."
+    )
+    parser.add_argument("--history", default=None, help="Path to the history file.")
+    parser.add_argument("--no-record", action="store_true", help="Don't append this run to the history.")
+
+    # Per-record overrides on top of the chosen size.
+    for attr in SIZES["small"].to_dict():
+        if attr == "posted":
+            parser.add_argument(f"--{attr}", type=float, default=None)
+        else:
+            parser.add_argument(f"--{attr.replace('_', '-')}", type=int, default=None)
+
+    return parser.parse_args()
+
+################################################################################
+def main() -> int:
+
+    args = parse_args()
+
+    overrides = {attr: getattr(args, attr) for attr in SIZES["small"].to_dict()}
+    dataset = SyntheticDataset.from_name(args.size, args.seed, **overrides)
+
+    runner = BenchRunner(
+        dataset,
+        iterations=args.iterations,
+        rest_latency=args.rest_latency,
+        db_latency=args.db_latency,
+        with_logging=args.with_logging
+    )
+    results = asyncio.run(runner.run())
+
+    history = BenchHistory(args.history)
+    commit = history.current_commit()
+    baseline = history.baseline(commit, runner.config)
+    regressions = (
+        history.regressions(baseline, results, args.threshold)
+        if baseline is not None else {}
+    )
+
+    print(f"Commit {commit} | size={args.size} seed={args.seed} iterations={args.iterations}")
+    if baseline is not None:
+        print(f"Compared against {baseline['commit']} ({baseline['timestamp']})")
+    print()
+    print(f"{'Scenario':<40} {'min':>9} {'median':>9} {'mean':>9} {'db':>7} {'rest':>7}")
+    for name, r in results.items():
+        flag = f"  REGRESSED +{regressions[name]:.0%}" if name in regressions else ""
+        print(
+            f"{name[:40]:<40} {r['min_ms']:>9.2f} {r['median_ms']:>9.2f} "
+            f"{r['mean_ms']:>9.2f} {r['db_statements']:>7.1f} {r['rest_calls']:>7.1f}{flag}"
+        )
+
+    if not args.no_record:
+        history.append(commit, runner.config, results)
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+################################################################################
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+################################################################################
@@ -3,14 +3,20 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Dict, Any, Optional
 
-from discord import Attachment, Bot, TextChannel, NotFound
+from discord import ApplicationContext, Attachment, Bot, TextChannel, NotFound
 from discord.abc import GuildChannel
 from dotenv import load_dotenv
 
-from Utilities import log
+from Utilities import log, Metrics
 from Utilities.Database import Database
+from .BulkJobs import BulkJobRunner
+from .DataTransfer import DataTransfer
 from .GuildManager import GuildManager
+from .ImagePipeline import ImagePipeline
 from .ReportManager import ReportManager
+from .SnapshotManager import SnapshotManager
+from .TimerService import TimerService
+from .UrlShortener import UrlShortener
 from .Webhooks import FroggeHookManager
 from .XIVVenues import XIVVenuesClient
 from Utilities import Utilities
@@ -32,6 +38,12 @@ class StaffPartyBot(Bot):
         "_xiv_client",
         "_webhooks",
         "_report_mgr",
+        "_snapshots",
+        "_timers",
+        "_images",
+        "_shortener",
+        "_transfer",
+        "_bulk_jobs",
     )
 
 ################################################################################
@@ -46,12 +58,26 @@ class StaffPartyBot(Bot):
         self._xiv_client: XIVVenuesClient = XIVVenuesClient(self)
         self._webhooks: FroggeHookManager = FroggeHookManager(self)
         self._report_mgr: ReportManager = ReportManager(self)
+        self._snapshots: SnapshotManager = SnapshotManager(self)
+        self._timers: TimerService = TimerService(self)
+        self._images: ImagePipeline = ImagePipeline(self)
+        self._shortener: UrlShortener = UrlShortener(self)
+        self._transfer: DataTransfer = DataTransfer(self)
+        self._bulk_jobs: BulkJobRunner = BulkJobRunner(self)
+        
+        Metrics.instrument_http(self.http)
 
 ################################################################################
     def __getitem__(self, guild_id: int) -> GuildData:
         
         return self._guild_mgr[guild_id]
     
+################################################################################
+    async def invoke_application_command(self, ctx: ApplicationContext) -> None:
+        
+        async with Metrics.track(f"/{ctx.command.qualified_name}"):
+            await super().invoke_application_command(ctx)
+    
 ################################################################################    
     @property
     def database(self) -> Database:
@@ -70,12 +96,54 @@ class StaffPartyBot(Bot):
         
         return self._xiv_client
     
+################################################################################
+    @property
+    def webhooks(self) -> FroggeHookManager:
+        
+        return self._webhooks
+    
 ################################################################################
     @property
     def report_manager(self) -> ReportManager:
         
         return self._report_mgr
     
+################################################################################
+    @property
+    def snapshots(self) -> SnapshotManager:
+        
+        return self._snapshots
+    
+################################################################################
+    @property
+    def timers(self) -> TimerService:
+        
+        return self._timers
+    
+################################################################################
+    @property
+    def images(self) -> ImagePipeline:
+        
+        return self._images
+    
+################################################################################
+    @property
+    def shortener(self) -> UrlShortener:
+        
+        return self._shortener
+    
+################################################################################
+    @property
+    def data_transfer(self) -> DataTransfer:
+        
+        return self._transfer
+    
+################################################################################
+    @property
+    def bulk_jobs(self) -> BulkJobRunner:
+        
+        return self._bulk_jobs
+    
 ################################################################################
     async def load_all(self) -> None:
 
@@ -90,18 +158,42 @@ class StaffPartyBot(Bot):
         print("Asserting database structure...")
         # Create the database structure if it doesn't exist.
         self._db._assert_structure()
+        self._images.load(self._img_dump)
 
-        print("Loading data from database...")
-        # Load all the data from the database.
-        payload = self._db._load_all()
-        data = self._parse_data(payload)
+        # Boot from the on-disk snapshot if we have a usable one, otherwise
+        # fall back to a full read of the database.
+        data = self._snapshots.load()
+        from_snapshot = data is not None
+        if not from_snapshot:
+            print("Loading data from database...")
+            payload = self._db._load_all()
+            data = self._parse_data(payload)
+        else:
+            print("Loaded data from snapshot...")
+            
+        # Restore pending timers before the guilds load so anything they
+        # schedule replaces the persisted copy rather than duplicating it.
+        self._timers.load()
         
         for frogge in self._guild_mgr.fguilds:
-            await frogge.load_all(data[frogge.guild_id])
+            await frogge.load_all(data[frogge.guild_id], self._snapshots.missing(frogge.guild_id))
+            
+        # Written now rather than straight after the read so it includes
+        # whatever failed to resolve while the guilds loaded.
+        if not from_snapshot:
+            self._snapshots.save(data)
+            
+        self._timers.start()
+        # Pick up any bulk updates a restart interrupted.
+        self._bulk_jobs.resume()
             
-        # Start receiving webhooks.
-        # self._webhooks.run()
-        # print("Webhooks initialized...")
+        # Check the snapshot against the database in the background and
+        # reload any guilds that have drifted since it was written.
+        if self._snapshots.created_at is not None:
+            self.loop.create_task(self._snapshots.reconcile())
+            
+        # Start receiving FFXIV Venues webhooks.
+        await self._webhooks.start()
 
         print("Done!")
 
@@ -245,16 +337,9 @@ class StaffPartyBot(Bot):
         return ret
     
 ################################################################################
-    async def dump_image(self, image: Attachment) -> str:
-        
-        log.info("Core", "Dumping image to image dump...")
-        
-        file = await image.to_file()
-        post = await self._img_dump.send(file=file)
-        
-        log.info("Core", "Image dumped!")
+    async def dump_image(self, image: Attachment, square: bool = False) -> str:
         
-        return post.attachments[0].url
+        return await self._images.dump(image, square)
 
 ################################################################################
     async def get_or_fetch_channel(self, channel_id: int) -> Optional[GuildChannel]:
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from discord import Embed, Interaction, PartialMessage
+from dotenv import load_dotenv
+
+from UI.Guild import BulkJobProgressView
+from Utilities import Utilities as U, log
+
+if TYPE_CHECKING:
+    from Classes import GuildData, StaffPartyBot
+################################################################################
+
+__all__ = ("BulkJobRunner", "BulkJob", "RateBudget")
+
+################################################################################
+class RateBudget:
+    """A token bucket: ``acquire`` waits until one of ``rate`` tokens per
+    second (up to ``burst`` saved up) is available."""
+
+    __slots__ = (
+        "_rate",
+        "_burst",
+        "_tokens",
+        "_updated",
+    )
+
+################################################################################
+    def __init__(self, rate: float, burst: int) -> None:
+
+        self._rate: float = rate
+        self._burst: int = burst
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+
+################################################################################
+    async def acquire(self) -> None:
+
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+################################################################################
+class BulkJob:
+    """One run of a bulk operation over a fixed list of target IDs."""
+
+    __slots__ = (
+        "id",
+        "guild_id",
+        "kind",
+        "user_id",
+        "channel_id",
+        "message_id",
+        "targets",
+        "done",
+        "outcomes",
+        "status",
+        "cancelled",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        _id: str,
+        guild_id: int,
+        kind: str,
+        user_id: int,
+        channel_id: Optional[int],
+        message_id: Optional[int],
+        targets: List[str],
+        done: Optional[Set[str]] = None,
+        outcomes: Optional[Dict[str, int]] = None
+    ) -> None:
+
+        self.id: str = _id
+        self.guild_id: int = guild_id
+        self.kind: str = kind
+        self.user_id: int = user_id
+        self.channel_id: Optional[int] = channel_id
+        self.message_id: Optional[int] = message_id
+
+        self.targets: List[str] = targets
+        self.done: Set[str] = done or set()
+        # Outcome label (e.g. "updated") -> count, as returned by ``bulk_apply``.
+        self.outcomes: Dict[str, int] = outcomes or {}
+
+        self.status: str = "running"
+        self.cancelled: bool = False
+
+################################################################################
+    @classmethod
+    def load(cls, data: Tuple[Any, ...]) -> BulkJob:
+
+        return cls(
+            data[0], data[1], data[2], data[3], data[4], data[5],
+            list(data[6]), set(data[7] or ()), json.loads(data[8] or "{}")
+        )
+
+################################################################################
+    @property
+    def remaining(self) -> List[str]:
+
+        return [t for t in self.targets if t not in self.done]
+
+################################################################################
+class BulkJobRunner:
+    """Runs admin bulk operations in the background.
+
+    A job is the list of IDs the operation targets, fixed when it starts.
+    Each target is handed to the owning manager's ``bulk_apply``, a few at a
+    time (``CONCURRENCY``) and never faster than a bot-wide ``RateBudget``
+    shared by every running job, so a bulk update can't eat the REST budget
+    the rest of the bot needs. A progress message with a Cancel button is
+    kept up to date in the channel the job was started from.
+
+    The finished IDs are checkpointed to ``bulk_jobs`` every
+    ``CHECKPOINT_EVERY`` targets, and jobs still marked running are picked
+    back up by ``resume`` at startup, redoing at most the targets finished
+    since their last checkpoint. ``bulk_apply`` must therefore be safe to
+    repeat.
+
+    Managers taking part provide ``bulk_targets()``, ``bulk_prepare()`` (run
+    once per start or resume; its result is passed to every ``bulk_apply``)
+    and ``bulk_apply(target_id, context)``, which returns an outcome label.
+    """
+
+    __slots__ = (
+        "_state",
+        "_jobs",
+        "_tasks",
+        "_budget",
+    )
+
+    # Kind -> (title, the guild manager that runs it)
+    KINDS = {
+        "profiles": ("Staff Profiles", lambda g: g.profile_manager),
+        "venues": ("Venue Profiles", lambda g: g.venue_manager),
+        "jobs": ("Temporary Job Postings", lambda g: g.jobs_manager),
+    }
+
+    CONCURRENCY = 4
+    CHECKPOINT_EVERY = 25
+    PROGRESS_INTERVAL = 5.0  # seconds
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot):
+
+        self._state: StaffPartyBot = bot
+
+        self._jobs: Dict[str, BulkJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        # Targets per second across every running job. Each target usually
+        # costs one to three REST calls.
+        load_dotenv()
+        rate = float(os.getenv("BULK_RATE") or 5)
+        self._budget: RateBudget = RateBudget(rate, max(1, int(rate)))
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    @property
+    def jobs(self) -> List[BulkJob]:
+
+        return list(self._jobs.values())
+
+################################################################################
+    async def start(self, interaction: Interaction, guild: GuildData, kind: str) -> None:
+
+        title, manager = self.KINDS[kind]
+
+        if any(j.guild_id == guild.guild_id and j.kind == kind for j in self._jobs.values()):
+            error = U.make_embed(
+                title="Bulk Update Running",
+                description=f"A bulk update of {title} is already running in this server."
+            )
+            await interaction.respond(embed=error, ephemeral=True)
+            return
+
+        targets = manager(guild).bulk_targets()
+        job = BulkJob(
+            self.bot.database.insert.bulk_job(
+                guild.guild_id, kind, interaction.user.id, interaction.channel_id, None, targets
+            ),
+            guild.guild_id, kind, interaction.user.id, interaction.channel_id, None, targets
+        )
+
+        message = await interaction.channel.send(
+            embed=self._progress(job), view=BulkJobProgressView(job.id)
+        )
+        job.message_id = message.id
+        self.bot.database.update.bulk_job(job)
+
+        log.info(
+            "Core",
+            f"Started bulk job {job.id} ({kind}, {len(targets)} targets) in guild {guild.guild_id}"
+        )
+
+        self._launch(job)
+
+################################################################################
+    def resume(self) -> None:
+
+        for data in self.bot.database._load_bulk_jobs():
+            job = BulkJob.load(data)
+            if self.bot[job.guild_id] is None:
+                log.warning("Core", f"Not resuming bulk job {job.id}: guild {job.guild_id} is gone")
+                continue
+
+            log.info(
+                "Core",
+                f"Resuming bulk job {job.id} ({job.kind}) at {len(job.done)}/{len(job.targets)}"
+            )
+            self._launch(job)
+
+################################################################################
+    async def cancel(self, interaction: Interaction, job_id: str) -> bool:
+
+        job = self._jobs.get(job_id)
+        if job is None:
+            await interaction.respond("That bulk update has already finished.", ephemeral=True)
+            return True
+
+        if interaction.user.id != job.user_id and not interaction.user.guild_permissions.administrator:
+            await interaction.respond(
+                "Only whoever started this bulk update or an administrator can cancel it.",
+                ephemeral=True
+            )
+            return True
+
+        log.info("Core", f"User {interaction.user.id} cancelled bulk job {job.id}")
+
+        job.cancelled = True
+        await interaction.respond("Cancelling - targets already in progress will finish.", ephemeral=True)
+        return True
+
+################################################################################
+    def _launch(self, job: BulkJob) -> None:
+
+        self._jobs[job.id] = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job))
+
+################################################################################
+    async def _run(self, job: BulkJob) -> None:
+
+        guild = self.bot[job.guild_id]
+        manager = self.KINDS[job.kind][1](guild)
+        message = await self._message(guild, job)
+
+        semaphore = asyncio.Semaphore(self.CONCURRENCY)
+        since_checkpoint = 0
+        last_progress = time.monotonic()
+
+        async def work(target: str) -> None:
+            nonlocal since_checkpoint, last_progress
+
+            async with semaphore:
+                if job.cancelled:
+                    return
+                await self._budget.acquire()
+                try:
+                    outcome = await manager.bulk_apply(target, context)
+                except Exception as ex:
+                    log.error("Core", f"Bulk job {job.id} failed on {target}: {ex}")
+                    outcome = "failed"
+
+            job.done.add(target)
+            job.outcomes[outcome] = job.outcomes.get(outcome, 0) + 1
+
+            since_checkpoint += 1
+            if since_checkpoint >= self.CHECKPOINT_EVERY:
+                since_checkpoint = 0
+                self.bot.database.update.bulk_job(job)
+
+            if message is not None and time.monotonic() - last_progress >= self.PROGRESS_INTERVAL:
+                last_progress = time.monotonic()
+                await self._edit(message, embed=self._progress(job))
+
+        try:
+            context = await manager.bulk_prepare()
+            await asyncio.gather(*(work(t) for t in job.remaining))
+        except Exception as ex:
+            log.error("Core", f"Bulk job {job.id} stopped: {ex}")
+            job.status = "failed"
+        else:
+            job.status = "cancelled" if job.cancelled else "complete"
+        finally:
+            self._jobs.pop(job.id, None)
+            self._tasks.pop(job.id, None)
+
+        self.bot.database.update.bulk_job(job)
+        if message is not None:
+            await self._edit(message, embed=self._progress(job), view=None)
+
+        log.info(
+            "Core",
+            f"Bulk job {job.id} {job.status} at {len(job.done)}/{len(job.targets)}: {job.outcomes}"
+        )
+
+################################################################################
+    async def _message(self, guild: GuildData, job: BulkJob) -> Optional[PartialMessage]:
+
+        if job.message_id is None:
+            return None
+
+        channel = await guild.get_or_fetch_channel(job.channel_id)
+        return channel.get_partial_message(job.message_id) if channel is not None else None
+
+################################################################################
+    @staticmethod
+    async def _edit(message: PartialMessage, **kwargs) -> None:
+
+        # The progress message is a courtesy; never let it stop the job.
+        try:
+            await message.edit(**kwargs)
+        except Exception as ex:
+            log.warning("Core", f"Unable to update bulk job progress message: {ex}")
+
+################################################################################
+    def _progress(self, job: BulkJob) -> Embed:
+
+        total = len(job.targets)
+        done = len(job.done)
+        filled = round(20 * done / total) if total else 20
+
+        status = {
+            "running": "Cancelling..." if job.cancelled else "Running...",
+            "complete": "Complete!",
+            "cancelled": "Cancelled.",
+            "failed": "Stopped by an error - see the logs.",
+        }[job.status]
+
+        return U.make_embed(
+            title=f"Bulk Update: {self.KINDS[job.kind][0]}",
+            description=(
+                f"`{'█' * filled}{'░' * (20 - filled)}` **{done}/{total}**\n"
+                f"{status}\n\n"
+                + "\n".join(f"**{k.capitalize()}**: {v}" for k, v in sorted(job.outcomes.items()))
+            ),
+            footer_text=f"Job ID: {job.id}"
+        )
+
+################################################################################
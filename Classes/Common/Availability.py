@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import time
-from typing import TYPE_CHECKING, List, Type, TypeVar, Any, Tuple, Union
+from typing import TYPE_CHECKING, List, Type, TypeVar, Any, Tuple, Union, Optional
 
 from Utilities import Utilities as U, Weekday
+from .WeeklySchedule import WeeklySchedule
 
 if TYPE_CHECKING:
     from Classes import Profile, ServiceProfile, TUser
@@ -22,6 +23,7 @@ class Availability(ABC):
         "_day",
         "_start",
         "_end",
+        "_schedule",
     )
 
 ################################################################################
@@ -38,6 +40,8 @@ class Availability(ABC):
         self._day: Weekday = day
         self._start: time = start
         self._end: time = end
+        
+        self._schedule: Optional[WeeklySchedule] = None
 
 ################################################################################
     @classmethod
@@ -93,6 +97,21 @@ class Availability(ABC):
 
         return self._end
 
+################################################################################
+    @property
+    def schedule(self) -> WeeklySchedule:
+        
+        if self._schedule is None:
+            self._schedule = WeeklySchedule.from_range(self._day.value, self._start, self._end)
+            
+        return self._schedule
+    
+################################################################################
+    @staticmethod
+    def combined_schedule(availability: List[Availability]) -> WeeklySchedule:
+        
+        return WeeklySchedule.union(a.schedule for a in availability)
+    
 ################################################################################
     @property
     def start_timestamp(self) -> str:
@@ -151,7 +170,9 @@ class Availability(ABC):
 ################################################################################
     def contains(self, range_start: time, range_end: time) -> bool:
 
-        return self._start <= range_start and self._end >= range_end
+        return self.schedule.contains(
+            WeeklySchedule.from_range(self._day.value, range_start, range_end)
+        )
 
 ################################################################################
     
\ No newline at end of file
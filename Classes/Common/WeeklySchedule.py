@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from datetime import datetime, time
+from typing import Dict, Iterable, List, Tuple, Type, TypeVar
+
+################################################################################
+
+__all__ = ("WeeklySchedule",)
+
+WS = TypeVar("WS", bound="WeeklySchedule")
+
+MINUTES_PER_DAY = 1440
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+FULL_WEEK = (1 << MINUTES_PER_WEEK) - 1
+
+################################################################################
+class WeeklySchedule:
+    """A week of availability stored as a 7x1440 minute bitmap.
+
+    Bit ``n`` is set when minute ``n`` of the week (counted from midnight at
+    the start of day 0) is covered, so intersection, containment and overlap
+    length are all single integer operations.
+    """
+
+    __slots__ = (
+        "_mask",
+    )
+
+################################################################################
+    def __init__(self, mask: int = 0) -> None:
+
+        self._mask: int = mask & FULL_WEEK
+
+################################################################################
+    @classmethod
+    def from_range(cls: Type[WS], day: int, start: time, end: time) -> WS:
+
+        start_min = start.hour * 60 + start.minute
+        end_min = end.hour * 60 + end.minute
+
+        # An end at or before the start runs past midnight into the next day.
+        # That also covers a close time of 00:00, which means "end of day".
+        length = end_min - start_min
+        if length <= 0:
+            length += MINUTES_PER_DAY
+
+        return cls.from_minutes(day * MINUTES_PER_DAY + start_min, length)
+
+################################################################################
+    @classmethod
+    def from_datetimes(cls: Type[WS], day: int, start: datetime, end: datetime) -> WS:
+
+        start_min = day * MINUTES_PER_DAY + start.hour * 60 + start.minute
+        length = int((end - start).total_seconds() // 60)
+
+        return cls.from_minutes(start_min, length)
+
+################################################################################
+    @classmethod
+    def from_minutes(cls: Type[WS], start: int, length: int) -> WS:
+
+        if length <= 0:
+            return cls()
+        if length >= MINUTES_PER_WEEK:
+            return cls(FULL_WEEK)
+
+        start %= MINUTES_PER_WEEK
+        mask = ((1 << length) - 1) << start
+
+        # Fold anything that ran past the end of the week back to the start.
+        return cls((mask & FULL_WEEK) | (mask >> MINUTES_PER_WEEK))
+
+################################################################################
+    @classmethod
+    def union(cls: Type[WS], schedules: Iterable[WeeklySchedule]) -> WS:
+
+        mask = 0
+        for s in schedules:
+            mask |= s._mask
+
+        return cls(mask)
+
+################################################################################
+    @property
+    def mask(self) -> int:
+
+        return self._mask
+
+################################################################################
+    @property
+    def minutes(self) -> int:
+
+        return self._mask.bit_count()
+
+################################################################################
+    def __bool__(self) -> bool:
+
+        return self._mask != 0
+
+################################################################################
+    def __eq__(self, other: WeeklySchedule) -> bool:
+
+        return isinstance(other, WeeklySchedule) and self._mask == other._mask
+
+################################################################################
+    def __hash__(self) -> int:
+
+        return hash(self._mask)
+
+################################################################################
+    def __and__(self, other: WeeklySchedule) -> WeeklySchedule:
+
+        return WeeklySchedule(self._mask & other._mask)
+
+################################################################################
+    def __or__(self, other: WeeklySchedule) -> WeeklySchedule:
+
+        return WeeklySchedule(self._mask | other._mask)
+
+################################################################################
+    def contains(self, other: WeeklySchedule) -> bool:
+
+        return bool(other._mask) and (self._mask & other._mask) == other._mask
+
+################################################################################
+    def overlaps(self, other: WeeklySchedule) -> bool:
+
+        return (self._mask & other._mask) != 0
+
+################################################################################
+    def overlap_minutes(self, other: WeeklySchedule) -> int:
+
+        return (self._mask & other._mask).bit_count()
+
+################################################################################
+    def runs(self) -> List[Tuple[int, int]]:
+
+        ret = []
+        mask = self._mask
+        while mask:
+            start = (mask & -mask).bit_length() - 1
+            shifted = mask >> start
+            # Count trailing ones to get the length of this run.
+            length = (shifted ^ (shifted + 1)).bit_length() - 1
+            ret.append((start, start + length))
+            mask &= ~(((1 << length) - 1) << start)
+
+        return ret
+
+################################################################################
+    def by_day(self, min_length: int = 0) -> Dict[int, List[Tuple[time, time]]]:
+
+        ret = {}
+        for start, end in self.runs():
+            if end - start < min_length:
+                continue
+
+            day = start // MINUTES_PER_DAY
+            start_min = start % MINUTES_PER_DAY
+            end_min = end % MINUTES_PER_DAY
+
+            ret.setdefault(day, []).append(
+                (
+                    time(hour=start_min // 60, minute=start_min % 60),
+                    time(hour=end_min // 60, minute=end_min % 60),
+                )
+            )
+
+        return ret
+
+################################################################################
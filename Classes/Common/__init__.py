@@ -1,3 +1,4 @@
 from .AdditionalImage import AdditionalImage
 from .Availability import Availability
+from .WeeklySchedule import WeeklySchedule
 ################################################################################
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from collections import defaultdict
+from datetime import datetime, time
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Tuple
+from uuid import uuid4
+
+from discord import Attachment, File, Interaction
+
+from Utilities import Utilities as U, log, ProfileImportError
+
+if TYPE_CHECKING:
+    from Classes import GuildData, StaffPartyBot
+################################################################################
+
+__all__ = ("DataTransfer",)
+
+################################################################################
+class DataTransfer:
+    """Bulk export and import of a guild's data as JSON Lines.
+
+    An export is a header line followed by one ``{"kind": ..., "data": ...}``
+    line per database row. Rows are read through server-side cursors, so
+    only the finished (optionally gzipped) file is held in memory, never the
+    raw result sets as well. That's done on a worker thread over its own
+    connection, leaving the event loop - and the shared connection - free
+    while a big guild exports. Profiles are always included; training
+    records, venues and job postings on request.
+
+    Import restores profiles, with their additional images and availability.
+    Everything gets a new ID, users who already have a profile in the target
+    guild are skipped, positions that don't exist there are dropped, and
+    profile posts made in another guild are forgotten. The rows go in as
+    batched inserts inside a single transaction.
+    """
+
+    __slots__ = ("_state",)
+
+    VERSION = 1
+    SECTIONS = {
+        "profiles": ("profile", "additional_image", "profile_availability"),
+        "tusers": ("tuser", "tuser_availability", "qualification"),
+        "venues": ("venue", "venue_hours"),
+        "jobs": ("job_posting", "job_hours"),
+    }
+    # ``profile_master`` column order, as ``Profile.load`` expects it.
+    PROFILE_COLUMNS = (
+        "_id", "user_id", "guild_id", "char_name", "custom_url", "color",
+        "jobs", "rates", "post_url", "positions", "dm_preference", "likes",
+        "dislikes", "personality", "aboutme", "gender", "pronouns", "race",
+        "clan", "orientation", "height", "age", "mare", "data_centers",
+        "thumbnail", "main_image",
+    )
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot):
+
+        self._state: StaffPartyBot = bot
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    async def export(
+        self,
+        interaction: Interaction,
+        guild: GuildData,
+        sections: List[str],
+        compress: bool = True
+    ) -> None:
+
+        log.info(
+            "Core",
+            f"User {interaction.user.name} ({interaction.user.id}) is exporting "
+            f"guild {guild.guild_id} data: profiles {' '.join(sections)}"
+        )
+
+        await interaction.response.defer()
+
+        kinds = [k for s in ("profiles", *sections) for k in self.SECTIONS[s]]
+
+        buffer = BytesIO()
+        out = gzip.GzipFile(fileobj=buffer, mode="wb") if compress else buffer
+
+        out.write(self._line({
+            "kind": "header",
+            "version": self.VERSION,
+            "guild_id": guild.guild_id,
+            "exported_at": datetime.now().isoformat(),
+            "sections": ["profiles", *sections],
+        }))
+        counts = await asyncio.to_thread(self._write_rows, out, guild.guild_id, kinds)
+
+        if compress:
+            out.close()
+        buffer.seek(0)
+
+        filename = f"export-{guild.guild_id}-{datetime.now():%Y%m%d-%H%M}.jsonl"
+        if compress:
+            filename += ".gz"
+
+        confirm = U.make_embed(
+            title="Data Exported",
+            description=(
+                "Keep the attached file somewhere safe. Profiles can be "
+                "restored from it with `/admin import_profiles`, in this or "
+                "any other server.\n\n"
+                + "\n".join(f"**{k}**: {counts[k]}" for k in kinds)
+            )
+        )
+        await interaction.followup.send(embed=confirm, file=File(buffer, filename=filename))
+
+        log.info("Core", f"Exported {sum(counts.values())} records for guild {guild.guild_id}")
+
+################################################################################
+    def _write_rows(self, out: BinaryIO, guild_id: int, kinds: List[str]) -> Dict[str, int]:
+        """Runs on the worker thread. Returns how many rows of each kind were
+        written."""
+
+        counts: Dict[str, int] = defaultdict(int)
+
+        database = self.bot.database
+        with database.detached():
+            for kind, row in database._stream_export(guild_id, kinds):
+                out.write(self._line({"kind": kind, "data": row}))
+                counts[kind] += 1
+
+        return counts
+
+################################################################################
+    async def import_profiles(self, interaction: Interaction, guild: GuildData, file: Attachment) -> None:
+
+        log.info(
+            "Core",
+            f"User {interaction.user.name} ({interaction.user.id}) is importing "
+            f"profiles into guild {guild.guild_id} from {file.filename}"
+        )
+
+        await interaction.response.defer()
+
+        try:
+            header, records = self._parse(await file.read())
+            profiles, images, hours, payloads, skipped = self._prepare(guild, header, records)
+        except (ValueError, KeyError, TypeError) as ex:
+            reason = str(ex) if isinstance(ex, ValueError) else f"a record is malformed ({ex!r})."
+            log.warning("Core", f"Rejected profile import file: {reason}")
+            await interaction.followup.send(embed=ProfileImportError(reason))
+            return
+
+        database = self.bot.database
+        with database.transaction():
+            database.insert.profile_batch(profiles, images, hours)
+            failed = database.transaction_failed
+
+        if failed:
+            log.error("Core", f"Profile import into guild {guild.guild_id} failed and was rolled back")
+            await interaction.followup.send(
+                embed=ProfileImportError("the database rejected it, so nothing was imported.")
+            )
+            return
+
+        loaded = await guild.profile_manager.load_profiles(payloads)
+
+        confirm = U.make_embed(
+            title="Profiles Imported",
+            description=(
+                f"**Imported**: {len(profiles)}\n"
+                f"**Skipped** (user already has a profile here): {skipped}\n"
+                f"**Users no longer on Discord**: {len(profiles) - loaded}"
+            )
+        )
+        await interaction.followup.send(embed=confirm)
+
+        log.info("Core", f"Imported {len(profiles)} profiles into guild {guild.guild_id}")
+
+################################################################################
+    def _prepare(
+        self,
+        guild: GuildData,
+        header: Dict[str, Any],
+        records: Dict[str, List[Dict[str, Any]]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]], int]:
+        """Re-keys the exported profiles for ``guild``. Returns the rows to
+        insert, the payloads to load them from afterwards, and how many were
+        skipped."""
+
+        same_guild = header.get("guild_id") == guild.guild_id
+        positions = {p.id for p in guild.position_manager.positions}
+
+        images_of = defaultdict(list)
+        for img in records["additional_image"]:
+            images_of[img["profile_id"]].append(img)
+        hours_of = defaultdict(list)
+        for h in records["profile_availability"]:
+            hours_of[h["profile_id"]].append(h)
+
+        profiles, images, hours, payloads = [], [], [], []
+        seen, skipped = set(), 0
+
+        for p in records["profile"]:
+            user_id = p["user_id"]
+            if user_id in seen or guild.profile_manager[user_id] is not None:
+                skipped += 1
+                continue
+            seen.add(user_id)
+
+            new_id = uuid4().hex
+            profile = {
+                **p,
+                "_id": new_id,
+                "guild_id": guild.guild_id,
+                "positions": [pos for pos in p["positions"] or [] if pos in positions],
+                "post_url": p["post_url"] if same_guild else None,
+            }
+            p_images = [
+                {**img, "_id": uuid4().hex, "profile_id": new_id}
+                for img in images_of[p["_id"]]
+            ]
+            p_hours = [
+                {
+                    **h,
+                    "profile_id": new_id,
+                    "start_time": time.fromisoformat(h["start_time"]),
+                    "end_time": time.fromisoformat(h["end_time"]),
+                }
+                for h in hours_of[p["_id"]]
+            ]
+
+            profiles.append(profile)
+            images.extend(p_images)
+            hours.extend(p_hours)
+            payloads.append({
+                "profile": tuple(profile[c] for c in self.PROFILE_COLUMNS),
+                "additional_images": [
+                    (i["_id"], i["profile_id"], i["url"], i["caption"]) for i in p_images
+                ],
+                "availability": [
+                    (h["profile_id"], h["day"], h["start_time"], h["end_time"]) for h in p_hours
+                ],
+            })
+
+        return profiles, images, hours, payloads, skipped
+
+################################################################################
+    def _parse(self, data: bytes) -> Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]:
+
+        if data[:2] == b"\x1f\x8b":
+            try:
+                data = gzip.decompress(data)
+            except (OSError, EOFError) as ex:
+                raise ValueError(f"it isn't a valid gzip file ({ex}).")
+
+        lines = iter(data.decode("utf-8").splitlines())
+        try:
+            header = json.loads(next(lines))
+        except StopIteration:
+            raise ValueError("it's empty.")
+
+        if not isinstance(header, dict) or header.get("kind") != "header":
+            raise ValueError("it isn't a data export.")
+        if header.get("version") != self.VERSION:
+            raise ValueError(f"it's from an unsupported export version ({header.get('version')}).")
+
+        records: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for line in lines:
+            if line:
+                record = json.loads(line)
+                records[record["kind"]].append(record["data"])
+
+        return header, records
+
+################################################################################
+    @staticmethod
+    def _line(record: Dict[str, Any]) -> bytes:
+
+        return json.dumps(record, default=DataTransfer._encode).encode() + b"\n"
+
+################################################################################
+    @staticmethod
+    def _encode(value: Any) -> Any:
+
+        # Dates and times from the database.
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+
+        raise TypeError(f"Can't export a value of type {type(value).__name__}")
+
+################################################################################
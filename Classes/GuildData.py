@@ -1,24 +1,24 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Union, List
 
-import discord.utils
 from discord import Guild, User, Interaction, Message, NotFound, Member, Role
 from discord.abc import GuildChannel
-from discord.ext import tasks
 
 from Classes.Itinerary.ItineraryManager import ItineraryManager
 from Classes.ChannelManager import ChannelManager
 from Classes.Jobs.JobsManager import JobsManager
 from Classes.Logger import Logger
+from Classes.OwnershipIndex import OwnershipIndex
 from Classes.Positions.PositionManager import PositionManager
 from Classes.Profiles.ProfileManager import ProfileManager
 from Classes.RoleManager import RoleManager
 from Classes.Services.ServicesManager import ServicesManager
+from Classes.ThreadIndex import ThreadIndex
 from Classes.Training.TrainingManager import TrainingManager
 from Classes.Venues.VenueManager import VenueManager
+from Classes.WelcomePipeline import WelcomePipeline
 from UI.Guild import ReportMenuView, BulkUpdateView
 from Utilities import Utilities as U, log
 
@@ -32,25 +32,29 @@ __all__ = ("GuildData",)
 class GuildData:
     """A container for bot-specific guild data and settings."""
 
-    # Can't have slots if we're going to do the member_welcome task as 
-    # the presence of __slots__ will prevent writing to this class.
-    
-    # __slots__ = (
-    #     "_state",
-    #     "_parent",
-    #     "_pos_mgr",
-    #     "_training_mgr",
-    #     "_logger",
-    #     "_profile_mgr",
-    #     "_venue_mgr",
-    #     "_job_mgr",
-    #     "_role_mgr",
-    #     "_channel_mgr",
-    #     "_service_mgr",
-    #     "_itinerary_mgr",
-    # )
+    __slots__ = (
+        "_state",
+        "_parent",
+        "_pos_mgr",
+        "_training_mgr",
+        "_logger",
+        "_profile_mgr",
+        "_venue_mgr",
+        "_job_mgr",
+        "_role_mgr",
+        "_channel_mgr",
+        "_service_mgr",
+        "_itinerary_mgr",
+        "_welcome",
+        "_ownership",
+        "_threads",
+        "_missing",
+    )
     
     RESTART_TIME = 6  # minutes
+    
+    # Kinds of Discord entity tracked in _missing.
+    MISSING_KINDS = ("channels", "messages", "users", "roles")
 
 ################################################################################
     def __init__(self, bot: StaffPartyBot, parent: Guild):
@@ -58,6 +62,10 @@ class GuildData:
         self._state: StaffPartyBot = bot
         self._parent: Guild = parent
         
+        # Created first; the managers register records in it as they load.
+        self._ownership: OwnershipIndex = OwnershipIndex()
+        self._threads: ThreadIndex = ThreadIndex()
+        
         self._logger: Logger = Logger(self)
         
         self._pos_mgr: PositionManager = PositionManager(self)
@@ -70,14 +78,27 @@ class GuildData:
         self._channel_mgr: ChannelManager = ChannelManager(self)
         self._service_mgr: ServicesManager = ServicesManager(self)
         self._itinerary_mgr: ItineraryManager = ItineraryManager(self)
+        self._welcome: WelcomePipeline = WelcomePipeline(self)
+        
+        # Kind -> IDs (message URLs for messages) Discord said don't exist,
+        # so we don't keep asking. Seeded from the warm-restart snapshot.
+        self._missing: Dict[str, Set[Any]] = {k: set() for k in self.MISSING_KINDS}
 
 ################################################################################
-    async def load_all(self, data: Dict[str, Any]) -> None:
+    async def load_all(
+        self,
+        data: Dict[str, Any],
+        missing: Optional[Dict[str, List[Any]]] = None,
+        notify: bool = True
+    ) -> None:
+        
+        for kind, ids in (missing or {}).items():
+            self._missing[kind].update(ids)
         
         await self._logger.load()
         await self._channel_mgr._load_all(data["channels"])
         
-        msgs = await self.begin_notify_of_bot_restart()
+        msgs = await self.begin_notify_of_bot_restart() if notify else []
         
         await self._role_mgr._load_all(data["roles"])
         await self._pos_mgr._load_all(data)
@@ -87,7 +108,41 @@ class GuildData:
         await self._job_mgr._load_all(data)
         await self._service_mgr._load_all(data)
         
-        await self.end_notify_of_bot_restart(msgs)
+        if notify:
+            await self.end_notify_of_bot_restart(msgs)
+        
+################################################################################
+    def close(self) -> None:
+        """Stops this instance's background tasks, for when a reload has
+        replaced it."""
+        
+        self._job_mgr.expiry.stop()
+        self._welcome.stop()
+        self._training_mgr.signup_message.stop()
+        
+################################################################################
+    def missing_ids(self) -> Dict[str, List[Any]]:
+        
+        return {kind: list(ids) for kind, ids in self._missing.items()}
+        
+################################################################################
+    async def recheck_missing(self) -> int:
+        """Asks Discord again about everything in ``_missing``. Returns how
+        many of them exist after all."""
+        
+        missing, self._missing = self._missing, {k: set() for k in self.MISSING_KINDS}
+        
+        found = 0
+        for channel_id in missing["channels"]:
+            found += await self.get_or_fetch_channel(channel_id) is not None
+        for message_url in missing["messages"]:
+            found += await self.get_or_fetch_message(message_url) is not None
+        for user_id in missing["users"]:
+            found += await self.get_or_fetch_user(user_id) is not None
+        for role_id in missing["roles"]:
+            found += await self.get_or_fetch_role(role_id) is not None
+        
+        return found
         
 ################################################################################
     @property
@@ -113,6 +168,24 @@ class GuildData:
         
         return self._logger
     
+################################################################################
+    @property
+    def ownership(self) -> OwnershipIndex:
+        
+        return self._ownership
+    
+################################################################################
+    @property
+    def thread_index(self) -> ThreadIndex:
+        
+        return self._threads
+    
+################################################################################
+    @property
+    def welcome(self) -> WelcomePipeline:
+        
+        return self._welcome
+    
 ################################################################################
     @property
     def position_manager(self) -> PositionManager:
@@ -213,10 +286,15 @@ class GuildData:
             log.info("Core", "Channel found in cache.")
             return channel
         
+        if channel_id in self._missing["channels"]:
+            log.info("Core", "Channel is known not to exist.")
+            return
+        
         try:
             ret = await self._parent.fetch_channel(channel_id)
         except NotFound:
             log.warning("Core", f"Channel {channel_id} not found.")
+            self._missing["channels"].add(channel_id)
             return
         except Exception as ex:
             log.critical(
@@ -245,6 +323,10 @@ class GuildData:
             log.info("Core", "Message found in cache.")
             return msg
         
+        if message_url in self._missing["messages"]:
+            log.info("Core", "Message is known not to exist.")
+            return
+        
         channel = await self.get_or_fetch_channel(int(url_parts[-2]))
         if channel is None:
             log.info("Core", "Message channel not found.")
@@ -254,6 +336,7 @@ class GuildData:
             ret = await channel.fetch_message(int(url_parts[-1]))  # type: ignore
         except NotFound:
             log.warning("Core", f"Message {message_url} not found.")
+            self._missing["messages"].add(message_url)
             return
         except Exception as ex:
             log.critical(
@@ -280,6 +363,10 @@ class GuildData:
             log.info("Core", "Member found in cache.")
             return user
         
+        if user_id in self._missing["users"]:
+            log.info("Core", "User is known not to exist.")
+            return
+        
         try:
             member = await self._parent.fetch_member(user_id)
         except NotFound:
@@ -298,6 +385,7 @@ class GuildData:
             ret = await self.bot.get_or_fetch_user(user_id)
         except NotFound:
             log.warning("Core", f"User {user_id} not found.")
+            self._missing["users"].add(user_id)
             return
         except Exception as ex:
             log.critical(
@@ -306,6 +394,11 @@ class GuildData:
             )
             return
         else:
+            if ret is None:
+                # py-cord returns None rather than raising NotFound here.
+                log.warning("Core", f"User {user_id} not found.")
+                self._missing["users"].add(user_id)
+                return
             log.info("Core", "User fetched from Discord.")
             return ret
             
@@ -321,10 +414,15 @@ class GuildData:
             log.info("Core", "Role found in cache.")
             return role
         
+        if role_id in self._missing["roles"]:
+            log.info("Core", "Role is known not to exist.")
+            return
+        
         try:
             ret = await self._parent._fetch_role(role_id)
         except NotFound:
             log.warning("Core", f"Role {role_id} not found.")
+            self._missing["roles"].add(role_id)
             return
         except Exception as ex:
             log.critical(
@@ -339,10 +437,14 @@ class GuildData:
 ################################################################################
     async def on_member_leave(self, member: Member) -> None:
         
-        venue_deleted = await self.venue_manager.on_member_leave(member)
-        profile_deleted = await self.profile_manager.on_member_leave(member)
-        num_modified, num_deleted = await self.training_manager.on_member_leave(member)
-        jobs_deleted, jobs_canceled = await self.jobs_manager.on_member_leave(member)
+        self._welcome.remove(member.id)
+        
+        # The whole cascade for this member commits (or rolls back) together.
+        with self.bot.database.deferred():
+            venue_deleted = await self.venue_manager.on_member_leave(member)
+            profile_deleted = await self.profile_manager.on_member_leave(member)
+            num_modified, num_deleted = await self.training_manager.on_member_leave(member)
+            jobs_deleted, jobs_canceled = await self.jobs_manager.on_member_leave(member)
         
         await self.log.member_left(
             member=member,
@@ -357,74 +459,30 @@ class GuildData:
 ################################################################################
     async def on_member_join(self, member: Member) -> None:
         
-        log.info("Core", f"Member joined! Sending welcome message in t-minus 60 seconds...")
+        log.info("Core", f"Member joined! Queueing welcome message until they pick their roles...")
         
         await self.log.member_join(member)
-        self.member_welcome.start(member)
+        self.training_manager.on_member_join(member)
+        self._welcome.add(member)
         
 ################################################################################
-    @tasks.loop(count=1)
-    async def member_welcome(self, member: Member) -> None:
+    def on_member_update(self, before: Member, after: Member) -> None:
         
-        if not self.channel_manager.welcome_channel:
-            return
-    
-        welcome_message = (
-            "# __Welcome to the <a:party_bus:1225557207836393645> "
-            "Staff Party Bus!! <a:party_bus:1225557207836393645>__\n\n"
-    
-            f"Hiya, {member.mention}! I'm the Staff Party Bot, and I'm going to be "
-            f"your best friend throughout your time here at the Staff Party Bus!\n\n"
-        )
+        self._welcome.on_member_update(before, after)
         
-        flag = False
-        attempts = 0
-        target_dt = member.joined_at
-        while attempts < 5:
-            target_dt += timedelta(minutes=1)
-            # One minute for role selection
-            await discord.utils.sleep_until(target_dt)
-            
-            # Get updated member object
-            if get_member := self.parent.get_member(member.id):
-                member = get_member
-            
-            if self.role_manager.venue_management in member.roles:
-                welcome_message += (
-                    "It looks like you've selected the Venue Management role!\n"
-                    "You can follow the instructions <#1220087653815291954> to set up "
-                    "your venue profile \\o/ <a:bartender:1168135253387378748> \n\n"
-                )
-                flag = True
-            if self.role_manager.staff_unvalidated in member.roles:
-                welcome_message += (
-                    "I see you've picked the Staff Pending role!\n"
-                    "You can follow the instructions here <#1104515062636478643> to do "
-                    "your staff validation and you'll be able to create your staff "
-                    "profile afterwards! <a:dancer:1168134583158575175>\n\n"
-                )
-                flag = True
-            if "trainee" in [r.name.lower() for r in member.roles]:
-                welcome_message += (
-                    "I see you've selected the Trainee role!\n"
-                    "You can follow the instructions here <#1219488746664230974> to "
-                    "set up your profile and receive training! <a:greeter:1168134573926912071>"
-                )
-                flag = True
-                
-            if flag:
-                break
-            else:
-                attempts += 1
-                
-        if not flag:
-            welcome_message += (
-                "It looks like you haven't selected any roles yet! You can do so "
-                "in <#1104515062636478638> to get started! <a:host:1168134582000943124>"
+################################################################################
+    async def on_timer(self, kind: str, payload: Dict[str, Any]) -> None:
+        
+        if kind == "group_reminder":
+            group = next(
+                (g for g in self.training_manager.groups if g.id == payload["group_id"]),
+                None
             )
-            
-        await self.channel_manager.welcome_channel.send(welcome_message)
-    
+            if group is not None:
+                await group.reminder()
+        else:
+            log.warning("Core", f"Unknown timer type '{kind}' fired, ignoring.")
+        
 ################################################################################
     async def bulk_update_menu(self, interaction: Interaction) -> None:
         
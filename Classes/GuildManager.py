@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from discord import Guild
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
+from UI.Common import FroggeView
+from Utilities import RenderCache
 from .GuildData import GuildData
 
 if TYPE_CHECKING:
@@ -46,4 +48,32 @@ class GuildManager:
         if g is None:
             self._fguilds.append(GuildData(self._state, guild))
         
+################################################################################
+    async def build_guild(self, guild: Guild, data: Dict[str, Any]) -> GuildData:
+        """Loads a replacement for the guild's data without putting it in
+        use - see ``replace_guild``."""
+        
+        frogge = GuildData(self._state, guild)
+        # Not a restart, so don't announce one.
+        await frogge.load_all(data, notify=False)
+        
+        return frogge
+        
+################################################################################
+    def replace_guild(self, frogge: GuildData) -> None:
+        
+        # Swapped in only once it has fully loaded so the guild is never left
+        # half-populated.
+        old = self[frogge.guild_id]
+        if old is not None:
+            old.close()
+            frogge.welcome.adopt(old.welcome)
+            self._fguilds.remove(old)
+        self._fguilds.append(frogge)
+        
+        # Nothing cached for the old objects is any use now, and menus still
+        # open on them would write stale values back over the new ones.
+        RenderCache.clear()
+        FroggeView.expire_guild(frogge.guild_id)
+        
 ################################################################################
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from discord import Attachment, File
+from dotenv import load_dotenv
+
+from Utilities import log
+
+if TYPE_CHECKING:
+    from discord import TextChannel
+    from PIL import Image
+
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("ImagePipeline",)
+
+################################################################################
+class ImagePipeline:
+    """Normalizes images and stores them in the image dump channel, once.
+
+    Decoding, cropping and re-encoding run on a small thread pool (Pillow
+    releases the GIL for the heavy lifting) so the event loop never blocks on
+    them. Every stored image is keyed by the SHA-256 of its original bytes
+    plus the variant it was processed into, and that key -> dump URL table is
+    kept in the database, so uploading the same picture again - from any
+    user, in any guild - just returns the existing URL.
+
+    Normalization: images are EXIF-rotated, scaled down to fit
+    ``MAX_DIMENSION`` (or ``THUMBNAIL_DIMENSION`` for square thumbnails), and
+    re-encoded as JPEG, or PNG if they have transparency. The original is
+    kept instead if it's already small enough and in a format Discord
+    renders, and animated images are passed through untouched.
+
+    Pillow itself is only imported by the first image processed.
+    """
+
+    __slots__ = (
+        "_state",
+        "_channel",
+        "_urls",
+        "_inflight",
+        "_executor",
+    )
+
+    MAX_DIMENSION = 2048
+    THUMBNAIL_DIMENSION = 512
+    JPEG_QUALITY = 85
+    PASSTHROUGH_BYTES = 1024 * 1024
+    PASSTHROUGH_FORMATS = ("JPEG", "PNG", "WEBP", "GIF")
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot):
+
+        self._state: StaffPartyBot = bot
+        self._channel: Optional[TextChannel] = None
+
+        # Variant key -> dump URL
+        self._urls: Dict[str, str] = {}
+        # Uploads in progress, so simultaneous copies only upload once.
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        load_dotenv()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("IMAGE_WORKERS") or 2),
+            thread_name_prefix="images"
+        )
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    def load(self, channel: TextChannel) -> None:
+
+        self._channel = channel
+        self._urls = {key: url for key, url in self.bot.database._load_image_hashes()}
+
+        log.info("Core", f"Loaded {len(self._urls)} stored image hashes.")
+
+################################################################################
+    async def dump(self, image: Attachment, square: bool = False) -> str:
+        """Returns a permanent URL for ``image``, uploading a normalized copy
+        only if this exact image hasn't been stored before. ``square``
+        center-crops it into a thumbnail."""
+
+        data = await image.read()
+
+        variant = f"sq{self.THUMBNAIL_DIMENSION}" if square else f"max{self.MAX_DIMENSION}"
+        key = f"{hashlib.sha256(data).hexdigest()}:{variant}"
+
+        if url := self._urls.get(key):
+            log.info("Core", "Image already stored, reusing its URL.")
+            return url
+
+        if pending := self._inflight.get(key):
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            url = await self._store(key, data, image.filename, square)
+        except Exception as ex:
+            future.set_exception(ex)
+            # Nobody else may be waiting on it.
+            future.exception()
+            raise
+        else:
+            future.set_result(url)
+            return url
+        finally:
+            del self._inflight[key]
+
+################################################################################
+    async def _store(self, key: str, data: bytes, filename: str, square: bool) -> str:
+
+        loop = asyncio.get_running_loop()
+        try:
+            data, ext = await loop.run_in_executor(self._executor, self._normalize, data, square)
+        except OSError as ex:  # Includes PIL.UnidentifiedImageError
+            # Not something Pillow can read - store it exactly as it came.
+            log.warning("Core", f"Unable to process image {filename}, storing as-is: {ex}")
+            ext = os.path.splitext(filename)[1].lstrip(".") or "png"
+
+        log.info("Core", "Dumping image to image dump...")
+
+        post = await self._channel.send(file=File(BytesIO(data), filename=f"{key[:16]}.{ext}"))
+        url = post.attachments[0].url
+
+        self._urls[key] = url
+        self.bot.database.insert.image_hash(key, url)
+
+        log.info("Core", "Image dumped!")
+
+        return url
+
+################################################################################
+    @classmethod
+    def _normalize(cls, data: bytes, square: bool) -> Tuple[bytes, str]:
+        """Runs on the worker pool. Returns the bytes to upload and their
+        file extension."""
+
+        from PIL import Image, ImageOps
+
+        with Image.open(BytesIO(data)) as img:
+            fmt = img.format or ""
+            limit = cls.THUMBNAIL_DIMENSION if square else cls.MAX_DIMENSION
+
+            if getattr(img, "is_animated", False):
+                return data, fmt.lower() or "gif"
+
+            if (
+                not square
+                and fmt in cls.PASSTHROUGH_FORMATS
+                and len(data) <= cls.PASSTHROUGH_BYTES
+                and max(img.size) <= limit
+            ):
+                return data, "jpg" if fmt == "JPEG" else fmt.lower()
+
+            img = ImageOps.exif_transpose(img)
+
+            if square:
+                img = cls._crop_square(img)
+            img.thumbnail((limit, limit), Image.LANCZOS)
+
+            has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+            out = BytesIO()
+            if has_alpha:
+                img.convert("RGBA").save(out, "PNG", optimize=True)
+                ext = "png"
+            else:
+                img.convert("RGB").save(out, "JPEG", quality=cls.JPEG_QUALITY, optimize=True)
+                ext = "jpg"
+
+        return out.getvalue(), ext
+
+################################################################################
+    @staticmethod
+    def _crop_square(img: Image.Image) -> Image.Image:
+
+        width, height = img.size
+        size = min(width, height)
+
+        left = (width - size) // 2
+        top = (height - size) // 2
+
+        return img.crop((left, top, left + size, top + size))
+
+################################################################################
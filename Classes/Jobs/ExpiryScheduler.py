@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+from datetime import datetime
+from itertools import count
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from Utilities import log
+
+if TYPE_CHECKING:
+    from Classes import JobsManager, JobPosting
+################################################################################
+
+__all__ = ("ExpiryScheduler",)
+
+################################################################################
+class ExpiryScheduler:
+    """Expires job postings at their end time rather than on a fixed poll.
+
+    Postings are kept in a min-heap keyed on their end timestamp and a single
+    task sleeps until the earliest one is due. Rescheduling a posting simply
+    pushes a fresh entry; entries that no longer match the posting (deleted or
+    rescheduled since) are discarded when they reach the top of the heap.
+    """
+
+    __slots__ = (
+        "_mgr",
+        "_heap",
+        "_counter",
+        "_wakeup",
+        "_task",
+    )
+
+################################################################################
+    def __init__(self, mgr: JobsManager) -> None:
+
+        self._mgr: JobsManager = mgr
+
+        self._heap: List[Tuple[float, int, JobPosting]] = []
+        # Tie-breaker so two postings ending at the same moment never get
+        # compared against each other.
+        self._counter = count()
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._heap)
+
+################################################################################
+    def schedule(self, posting: JobPosting) -> None:
+
+        if posting.end_time is None:
+            return
+
+        entry = (posting.end_time.timestamp(), next(self._counter), posting)
+        heapq.heappush(self._heap, entry)
+
+        # Only a new earliest deadline changes how long the runner sleeps.
+        if self._heap[0] is entry:
+            self._wakeup.set()
+
+################################################################################
+    def start(self) -> None:
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+################################################################################
+    def stop(self) -> None:
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+################################################################################
+    async def _run(self) -> None:
+
+        while True:
+            self._wakeup.clear()
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - datetime.now().timestamp()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            timestamp, _, posting = heapq.heappop(self._heap)
+            if not self._is_current(posting, timestamp):
+                continue
+
+            try:
+                await self._expire(posting)
+            except Exception as ex:
+                log.error("Jobs", f"Failed to expire job posting {posting.id}:\n{ex}")
+
+################################################################################
+    def _is_current(self, posting: JobPosting, timestamp: float) -> bool:
+
+        return (
+            posting in self._mgr.all_postings
+            and posting.end_time is not None
+            and posting.end_time.timestamp() == timestamp
+        )
+
+################################################################################
+    async def _expire(self, posting: JobPosting) -> None:
+
+        thread = (
+            posting.post_message.channel
+            if posting.post_message is not None
+            else None
+        )
+
+        await posting.expiration_check()
+
+        if thread is not None:
+            await self._mgr.cull_empty_thread(thread)
+
+################################################################################
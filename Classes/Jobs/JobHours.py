@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import pytz
 from datetime import datetime
 from typing import TYPE_CHECKING, TypeVar, Optional
 
 from discord import Embed
 
+from Classes.Common import WeeklySchedule
+
 if TYPE_CHECKING:
     from Classes import JobPosting
 ################################################################################
@@ -20,6 +23,7 @@ class JobHours:
         "_parent",
         "_start",
         "_end",
+        "_schedule",
     )
 
 ################################################################################
@@ -34,6 +38,8 @@ class JobHours:
 
         self._start: Optional[datetime] = start
         self._end: Optional[datetime] = end
+        
+        self._schedule: Optional[WeeklySchedule] = None
 
 ################################################################################
     @property
@@ -59,6 +65,23 @@ class JobHours:
 
         return self._end
 
+################################################################################
+    @property
+    def schedule(self) -> WeeklySchedule:
+        
+        if self._schedule is None:
+            if self._start is None or self._end is None:
+                self._schedule = WeeklySchedule()
+            else:
+                # Availability is stored in UTC, so line the job up with it.
+                start, end = self._start, self._end
+                if start.tzinfo is not None:
+                    start = start.astimezone(pytz.utc)
+                    end = end.astimezone(pytz.utc)
+                self._schedule = WeeklySchedule.from_datetimes(start.weekday(), start, end)
+            
+        return self._schedule
+    
 ################################################################################
     def status(self) -> Embed:
         
@@ -29,12 +29,14 @@ from Utilities import (
     DateTimeBeforeNowError,
     IneligibleForJobError,
     CannotEditPostingError,
-    log
+    log,
+    RenderCache,
 )
+from .JobHours import JobHours
 from .PayRate import PayRate
 
 if TYPE_CHECKING:
-    from Classes import JobsManager, Position, Venue, StaffPartyBot, TUser
+    from Classes import JobsManager, Position, Venue, StaffPartyBot, TUser, WeeklySchedule
 ################################################################################
 
 __all__ = ("JobPosting",)
@@ -59,6 +61,9 @@ class JobPosting:
         "_candidate",
         "_rejections",
         "_schedule_updated",
+        "_hours",
+        # RenderCache only holds weak references
+        "__weakref__",
     )
     
 ################################################################################
@@ -82,6 +87,7 @@ class JobPosting:
         self._end: Optional[datetime] = kwargs.pop("end", None)
         
         self._schedule_updated: bool = False
+        self._hours: Optional[JobHours] = None
         
 ################################################################################
     @classmethod
@@ -117,6 +123,7 @@ class JobPosting:
         self._end = data[12]
         
         self._schedule_updated = False
+        self._hours = None
 
         await self._update_post_components()
         
@@ -248,6 +255,15 @@ class JobPosting:
         
         return self._end
         
+################################################################################
+    @property
+    def schedule(self) -> WeeklySchedule:
+        
+        if self._hours is None:
+            self._hours = JobHours(self, self._start, self._end)
+            
+        return self._hours.schedule
+        
 ################################################################################
     @property
     def complete(self) -> bool:
@@ -278,6 +294,17 @@ class JobPosting:
     def update(self) -> None:
 
         self.bot.database.update.job_posting(self)
+        RenderCache.invalidate(self)
+        self.track_users()
+        
+################################################################################
+    def track_users(self) -> None:
+        
+        self._mgr.guild.ownership.track(
+            self,
+            self._user.id,
+            self._candidate.user_id if self._candidate is not None else None
+        )
         
 ################################################################################
     async def delete(self) -> None:
@@ -314,7 +341,9 @@ class JobPosting:
             log.debug("Jobs", f"Sent job posting cancellation message to candidate")
         
         self._mgr._postings.remove(self)
+        self._mgr.guild.ownership.forget(self)
         self.bot.database.delete.job_posting(self)
+        RenderCache.invalidate(self)
         
         log.info("Jobs", f"Job posting {self._id} deleted successfully")
         
@@ -347,6 +376,7 @@ class JobPosting:
         await view.wait()
     
 ################################################################################
+    @RenderCache.cached
     def status(self) -> Embed:
 
         job_desc = "`No description provided.`"
@@ -381,6 +411,7 @@ class JobPosting:
         )
     
 ################################################################################
+    @RenderCache.cached
     def compile(self) -> Embed:
         
         job_desc = "`No description provided.`"
@@ -758,8 +789,10 @@ class JobPosting:
         self._start = start_time
         self._end = end_time
         self._schedule_updated = True
+        self._hours = None
         
         self.update()
+        self._mgr.expiry.schedule(self)
         
         log.info(
             "Jobs",
@@ -825,15 +858,14 @@ class JobPosting:
             return
     
         post_view = JobPostingPickupView(self)
-        self.bot.add_view(post_view)
         
         channel = (
             self._mgr.temporary_jobs_channel 
             if self.post_type == JobPostingType.Temporary 
             else self._mgr.permanent_jobs_channel
         )
-        pos_thread = next(
-            (t for t in channel.threads if t.name == self.position.name), None
+        pos_thread = await self._mgr.guild.thread_index.get(
+            channel, self.position.name
         ) if channel is not None else None
     
         try:
@@ -841,6 +873,7 @@ class JobPosting:
                 self.post_message = await pos_thread.send(embed=self.compile(), view=post_view)
             else:
                 pos_thread = await channel.create_thread(name=self.position.name, embed=self.compile(), view=post_view)
+                self._mgr.guild.thread_index.add(pos_thread)
                 self.post_message = pos_thread.last_message
                 
             log.debug(
@@ -895,7 +928,6 @@ class JobPosting:
         
         try:
             view = JobPostingPickupView(self)
-            self.bot.add_view(view, message_id=self._post_msg.id)
             await self._post_msg.edit(embed=self.compile(), view=view)
         except NotFound as ex:
             log.error(
@@ -7,7 +7,10 @@ from discord import (
     Interaction,
     ForumChannel,
     Member,
-    EmbedField
+    EmbedField,
+    Thread,
+    NotFound,
+    HTTPException,
 )
 from discord.ext.pages import Page
 
@@ -21,6 +24,7 @@ from Utilities import (
     DateTimeMismatchError,
 )
 from Utilities import log
+from .ExpiryScheduler import ExpiryScheduler
 from .JobPosting import JobPosting
 
 if TYPE_CHECKING:
@@ -35,6 +39,7 @@ class JobsManager:
     __slots__ = (
         "_guild",
         "_postings",
+        "_expiry",
     )
     
 ################################################################################
@@ -43,12 +48,20 @@ class JobsManager:
         self._guild: GuildData = guild
         
         self._postings: List[JobPosting] = []
+        self._expiry: ExpiryScheduler = ExpiryScheduler(self)
         
 ################################################################################
     async def _load_all(self, data: Dict[str, Any]) -> None:
 
         for _, posting in data["job_postings"].items():
             self._postings.append(await JobPosting.load(self, posting))
+            self._postings[-1].track_users()
+            
+        for posting in self._postings:
+            self._expiry.schedule(posting)
+        
+        self._expiry.start()
+        await self.cull_empty_threads()
             
 ################################################################################
     def get_posting(self, post_id: str) -> Optional[JobPosting]:
@@ -89,6 +102,12 @@ class JobsManager:
         
         return self._postings
     
+################################################################################
+    @property
+    def expiry(self) -> ExpiryScheduler:
+        
+        return self._expiry
+    
 ################################################################################
     @property
     def temporary_jobs_channel(self) -> Optional[ForumChannel]:
@@ -125,6 +144,7 @@ class JobsManager:
         
         posting = JobPosting.new(self, venue, interaction.user)
         self._postings.append(posting)
+        posting.track_users()
         
         log.info("Jobs", f"Job posting created with ID {posting.id}")
         
@@ -145,23 +165,53 @@ class JobsManager:
         await posting.menu(interaction)
         
 ################################################################################
-    async def cull_job_postings(self) -> None:
+    async def cull_empty_threads(self) -> None:
         
         if self.temporary_jobs_channel is None:
             return
         
-        log.info("Jobs", "Culling job postings")
+        log.info("Jobs", "Culling empty job threads")
         
+        for thread in self.temporary_jobs_channel.threads:
+            await self.cull_empty_thread(thread)
+            
+################################################################################
+    async def cull_empty_thread(self, thread: Thread) -> None:
+        
+        channel = self.temporary_jobs_channel
+        if channel is None or thread.parent_id != channel.id:
+            return
+        
+        # A thread still holding one of our postings is in use no matter
+        # what its counters say.
         for posting in self._postings:
-            await posting.expiration_check()
+            if posting.post_message is not None and posting.post_message.channel.id == thread.id:
+                return
             
-        for thread in self.temporary_jobs_channel.threads:
-            count = 0
-            async for _ in thread.history():
-                count += 1
-            if count == 0:
-                log.debug("Jobs", f"Deleting empty thread {thread.name}")
-                await thread.delete()
+        # The cached thread's counters are only as fresh as the last gateway
+        # event we saw for it, so get the current state before trusting them.
+        try:
+            thread = await self.bot.fetch_channel(thread.id)
+        except NotFound:
+            return
+        except HTTPException as ex:
+            log.warning("Jobs", f"Unable to fetch thread {thread.name}, not culling it: {ex}")
+            return
+        
+        # message_count excludes the starter message and anything deleted.
+        if thread.message_count:
+            return
+        
+        # It isn't tracked for threads older than the counter itself though,
+        # so a zero next to a last message needs confirming. A forum post's
+        # starter message shares the thread's ID and doesn't count.
+        if thread.last_message_id is not None:
+            async for message in thread.history(limit=2):
+                if message.id != thread.id:
+                    return
+                
+        log.debug("Jobs", f"Deleting empty thread {thread.name}")
+        await thread.delete()
         
 ################################################################################
     async def temp_job_report(self, interaction: Interaction) -> None:
@@ -311,12 +361,13 @@ class JobsManager:
         delete_count = 0
         cancel_count = 0
         
-        for posting in self._postings:
+        for posting in self.guild.ownership.owned(member.id, JobPosting):
             if posting.user.id == member.id:
                 await posting.delete()
                 delete_count += 1
-            if posting.candidate is not None and posting.candidate.user_id == member.id:
+            elif posting.candidate is not None and posting.candidate.user_id == member.id:
                 await posting.cancel()
+                cancel_count += 1
                 
         log.info("Jobs", f"Deleted {delete_count} job postings and cancelled {cancel_count}.")
         return delete_count, cancel_count
@@ -344,22 +395,27 @@ class JobsManager:
             log.debug("Jobs", "Bulk update cancelled")
             return
         
-        msg = await interaction.followup.send("Please wait...")
+        await self.bot.bulk_jobs.start(interaction, self.guild, "jobs")
         
-        count = 0
-        for posting in self._postings:
-            await posting._update_post_components()
-            count += 1
+################################################################################
+    def bulk_targets(self) -> List[str]:
         
-        await msg.delete()
+        return [p.id for p in self._postings]
+    
+################################################################################
+    async def bulk_prepare(self) -> None:
         
-        confirm = U.make_embed(
-            title="Bulk Update Complete",
-            description=f"Successfully updated {count} job postings."
-        )
-        await interaction.respond(embed=confirm)
+        return None
+    
+################################################################################
+    async def bulk_apply(self, posting_id: str, _context: None) -> str:
+        
+        posting = self.get_posting(posting_id)
+        if posting is None:
+            return "gone"
         
-        log.info("Jobs", f"Bulk update complete. Updated {count} job postings.")
+        await posting._update_post_components()
+        return "updated"
         
 ################################################################################
         
\ No newline at end of file
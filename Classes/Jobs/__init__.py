@@ -1,3 +1,4 @@
+from .ExpiryScheduler import ExpiryScheduler
 from .JobHours import JobHours
 from .JobPosting import JobPosting
 from .JobsManager import JobsManager
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Set, Type, TypeVar
+
+################################################################################
+
+__all__ = ("OwnershipIndex",)
+
+T = TypeVar("T")
+
+################################################################################
+class OwnershipIndex:
+    """Maps each user to every record in the guild they're attached to.
+
+    Records are tracked whenever a user becomes attached to them (venue
+    managers, profile and TUser owners, trainees and trainers, job posters
+    and candidates, group training signups) and forgotten when the record is
+    deleted. Relationships that are later removed aren't untracked, so callers
+    must re-check the relationship on whatever they get back; the index only
+    guarantees it never *misses* anything.
+    """
+
+    __slots__ = (
+        "_owned",
+        "_owners",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        # user_id -> {id(entity): entity}
+        self._owned: Dict[int, Dict[int, Any]] = {}
+        # id(entity) -> user_ids, so a deleted record can be dropped everywhere
+        self._owners: Dict[int, Set[int]] = {}
+
+################################################################################
+    def track(self, entity: Any, *user_ids: int) -> None:
+
+        key = id(entity)
+        for user_id in user_ids:
+            if user_id is None:
+                continue
+            self._owned.setdefault(user_id, {})[key] = entity
+            self._owners.setdefault(key, set()).add(user_id)
+
+################################################################################
+    def forget(self, entity: Any) -> None:
+
+        key = id(entity)
+        for user_id in self._owners.pop(key, ()):
+            owned = self._owned.get(user_id)
+            if owned is not None:
+                owned.pop(key, None)
+                if not owned:
+                    del self._owned[user_id]
+
+################################################################################
+    def owned(self, user_id: int, cls: Type[T]) -> List[T]:
+
+        return [
+            e for e in self._owned.get(user_id, {}).values()
+            if isinstance(e, cls)
+        ]
+
+################################################################################
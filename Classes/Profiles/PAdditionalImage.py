@@ -7,7 +7,7 @@ from discord.ext.pages import Page
 
 from Classes.Common import AdditionalImage
 from UI.Profiles import AdditionalImageView
-from Utilities import Utilities as U
+from Utilities import Utilities as U, RenderCache
 from Utilities import log
 
 if TYPE_CHECKING:
@@ -35,6 +35,7 @@ class PAdditionalImage(AdditionalImage):
     def update(self) -> None:
         
         self._parent.parent.bot.database.update.profile_addl_image(self)
+        RenderCache.invalidate(self._parent.parent)
     
 ################################################################################
     def delete(self) -> None:
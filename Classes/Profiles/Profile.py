@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+from io import BytesIO
 from typing import TYPE_CHECKING, Optional, Any, Type, TypeVar, Dict, Tuple, List
 
 from discord import (
@@ -14,7 +15,6 @@ from discord import (
     Forbidden,
     EmbedField,
     Message,
-    Thread,
     File,
     SelectOption,
     HTTPException,
@@ -47,6 +47,7 @@ from Utilities import (
     NoVenuesFoundError,
     GlobalDataCenter,
     ProfileIncompleteError,
+    RenderCache,
 )
 from Utilities import log
 
@@ -56,7 +57,7 @@ from .ProfileImages import ProfileImages
 from .ProfilePersonality import ProfilePersonality
 
 if TYPE_CHECKING:
-    from Classes import ProfileManager, StaffPartyBot, PAvailability, Position
+    from Classes import ProfileManager, StaffPartyBot, PAvailability, Position, WeeklySchedule
 ################################################################################
 
 __all__ = ("Profile",)
@@ -74,6 +75,8 @@ class Profile:
         "_aag",
         "_personality",
         "_images",
+        # RenderCache only holds weak references
+        "__weakref__",
     )
 
     MAX_ADDL_IMAGES = 3
@@ -193,6 +196,12 @@ class Profile:
         
         return self._details.availability
     
+################################################################################
+    @property
+    def schedule(self) -> WeeklySchedule:
+        
+        return self._details.schedule
+    
 ################################################################################
     @property
     def aboutme(self) -> Optional[str]:
@@ -264,9 +273,7 @@ class Profile:
                 log.debug("Profiles", "User cancelled additional image assignment")
                 return
 
-            image_url = await self.bot.dump_image(file)
-            # if shortened_url := U.shorten_url(image_url):
-            #     image_url = shortened_url
+            image_url = await self.bot.shortener.shorten(await self.bot.dump_image(file))
             
             await self._images.add_additional(interaction, image_url, modal.value)
             
@@ -274,7 +281,7 @@ class Profile:
             return
         
         await interaction.response.defer()
-        image_url = await self.bot.dump_image(file)
+        image_url = await self.bot.dump_image(file, square=img_type is ImageType.Thumbnail)
         
         if img_type is ImageType.Thumbnail:
             log.info("Profiles", "User is assigning a thumbnail image")
@@ -434,7 +441,8 @@ class Profile:
     
         # Handling threads
         channel = self.manager.guild.channel_manager.profiles_channel
-        matching_thread = next((t for t in channel.threads if t.name.lower() == self.char_name.lower()), None)
+        thread_index = self.manager.guild.thread_index
+        matching_thread = await thread_index.get(channel, self.char_name)
         
         log.debug(
             "Profiles",
@@ -445,24 +453,29 @@ class Profile:
         )
         
         if matching_thread:
-            # Clear the matching thread
-            await matching_thread.edit(applied_tags=self.get_tags())
-            async for m in matching_thread.history():
-                await m.delete()
-            action = matching_thread.send  # type: ignore
-        else:
-            # Or create a new thread if no matching one
-            action = lambda **kw: channel.create_thread(name=self.char_name, applied_tags=self.get_tags(), **kw)
-    
-        self.bot.add_view(view)
+            try:
+                await matching_thread.edit(applied_tags=self.get_tags(), archived=False)
+            except NotFound:
+                thread_index.discard(channel.id, matching_thread.id)
+                matching_thread = None
         
         # Post or create thread and handle permissions error
         try:
-            result = await action(embeds=embeds, view=view)
-            if isinstance(result, Thread):
-                self.post_message = await result.fetch_message(result.last_message_id)
+            if matching_thread:
+                # Reuse the matching thread's starter message
+                try:
+                    self.post_message = await thread_index.starter_message(matching_thread).edit(
+                        embeds=embeds, view=view
+                    )
+                except NotFound:
+                    self.post_message = await matching_thread.send(embeds=embeds, view=view)
             else:
-                self.post_message = result
+                # Or create a new thread if no matching one
+                thread = await channel.create_thread(
+                    name=self.char_name, applied_tags=self.get_tags(), embeds=embeds, view=view
+                )
+                thread_index.add(thread)
+                self.post_message = await thread.fetch_message(thread.last_message_id)
             await interaction.respond(embed=self.success_message())
         except Forbidden:
             log.warning(
@@ -536,7 +549,6 @@ class Profile:
             return False
         
         view = ProfileUserMuteView(self)
-        self.bot.add_view(view, message_id=self.post_message.id)
 
         main_profile, availability, aboutme = self.compile()
         embeds = [main_profile, availability] + ([aboutme] if aboutme else [])
@@ -569,6 +581,7 @@ class Profile:
             return True
         
 ################################################################################
+    @RenderCache.cached
     def compile(self) -> Tuple[Embed, Embed, Optional[Embed]]:
         
         log.debug("Profiles", f"Compiling profile embeds for {self._user.name} ({self._user.id})")
@@ -684,9 +697,11 @@ class Profile:
             log.debug("Profiles", "User cancelled profile export")
             return
         
-        with open("profile.json", "w") as f:
-            f.write(json.dumps(self._to_dict(), indent=4))
-        file = File("profile.json")
+        # Built in memory so simultaneous exports can't overwrite each other.
+        file = File(
+            BytesIO(json.dumps(self._to_dict(), indent=4).encode()),
+            filename="profile.json"
+        )
         
         confirm = U.make_embed(
             title="Profile Exported",
@@ -709,8 +724,6 @@ class Profile:
         else:
             log.info("Profiles", "Profile exported successfully")
             await interaction.respond(embed=confirm, ephemeral=True)
-        finally:
-            os.remove("profile.json")
         
 ################################################################################
     async def main_menu(self, interaction: Interaction) -> None:
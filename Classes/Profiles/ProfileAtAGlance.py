@@ -27,7 +27,8 @@ from Utilities import (
     HeightInputError,
     NS,
     FroggeEnum,
-    GlobalDataCenter
+    GlobalDataCenter,
+    RenderCache,
 )
 from Utilities import log
 from .ProfileSection import ProfileSection
@@ -210,6 +211,7 @@ class ProfileAtAGlance(ProfileSection):
     def update(self) -> None:
 
         self.parent.bot.database.update.profile_ataglance(self)
+        RenderCache.invalidate(self.parent)
     
 ################################################################################
     async def menu(self, interaction: Interaction) -> None:
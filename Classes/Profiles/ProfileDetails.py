@@ -25,13 +25,13 @@ from UI.Profiles import (
 )
 from UI.Training import TimeSelectView, WeekdayTZSelectView
 from UI.Venues import PositionSelectView
-from Utilities import Utilities as U, NS, MalformedURLError
+from Utilities import Utilities as U, NS, MalformedURLError, RenderCache
 from Utilities import log, DTOperations
 from .PAvailability import PAvailability
 from .ProfileSection import ProfileSection
 
 if TYPE_CHECKING:
-    from Classes import Profile, Position
+    from Classes import Profile, Position, WeeklySchedule
 ################################################################################
 
 __all__ = ("ProfileDetails",)
@@ -193,6 +193,12 @@ class ProfileDetails(ProfileSection):
         self._availability.sort(key=lambda x: x.day.value)
         return self._availability
     
+################################################################################
+    @property
+    def schedule(self) -> WeeklySchedule:
+        
+        return PAvailability.combined_schedule(self._availability)
+    
 ################################################################################
     @property
     def dm_preference(self) -> bool:
@@ -209,6 +215,7 @@ class ProfileDetails(ProfileSection):
     def update(self) -> None:
         
         self.parent.bot.database.update.profile_details(self)
+        RenderCache.invalidate(self.parent)
         
 ################################################################################
     async def menu(self, interaction: Interaction) -> None:
@@ -569,6 +576,8 @@ class ProfileDetails(ProfileSection):
             if a.day == weekday:
                 self._availability.pop(i).delete()
 
+        RenderCache.invalidate(self.parent)
+
         if start_time is not None:
             availability = PAvailability.new(self.parent, weekday, start_time, end_time)
             self._availability.append(availability)
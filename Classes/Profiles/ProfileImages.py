@@ -10,7 +10,7 @@ from UI.Profiles import (
     ProfileImageStatusView,
     AdditionalImageSelectView
 )
-from Utilities import Utilities as U, NS
+from Utilities import Utilities as U, NS, RenderCache
 from Utilities import log
 from .PAdditionalImage import PAdditionalImage
 from .ProfileSection import ProfileSection
@@ -99,6 +99,7 @@ class ProfileImages(ProfileSection):
     def update(self) -> None:
         
         self.parent.bot.database.update.profile_images(self)
+        RenderCache.invalidate(self.parent)
         
 ################################################################################
     async def menu(self, interaction: Interaction) -> None:
@@ -364,6 +365,7 @@ class ProfileImages(ProfileSection):
 
         self.additional.remove(additional)
         additional.delete()
+        RenderCache.invalidate(self.parent)
         
         log.info("Profiles", "Additional Image removed successfully")
 
@@ -391,6 +393,7 @@ class ProfileImages(ProfileSection):
         self.additional.append(
             PAdditionalImage.new(parent=self, url=url, caption=caption)
         )
+        RenderCache.invalidate(self.parent)
 
         confirm = U.make_embed(
             title="Image Assigned",
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, List, Optional, Any, Dict
 from discord import User, Member, Interaction
 
 from UI.Common import ConfirmCancelView
-from Utilities import Utilities as U, log
+from Utilities import Utilities as U, log, RenderCache
 from .Profile import Profile
 
 if TYPE_CHECKING:
@@ -31,16 +31,26 @@ class ProfileManager:
 ################################################################################
     async def _load_all(self, payload: Dict[str, Any]) -> None:
         
-        profiles = []
-        for p in payload["profiles"]:       
-            if profile := await Profile.load(self, p):
-                profiles.append(profile)
-                
-        self._profiles = profiles
+        self._profiles = []
+        await self.load_profiles(payload["profiles"])
         
         for p in self._profiles:
             await p._update_post_components()
         
+################################################################################
+    async def load_profiles(self, payloads: List[Dict[str, Any]]) -> int:
+        """Adds already-stored profiles to this guild. Returns how many
+        could be loaded."""
+        
+        count = 0
+        for p in payloads:
+            if profile := await Profile.load(self, p):
+                self._profiles.append(profile)
+                self.guild.ownership.track(profile, profile.user_id)
+                count += 1
+                
+        return count
+    
 ################################################################################
     def __getitem__(self, user_id: int) -> Optional[Profile]:
         
@@ -48,6 +58,13 @@ class ProfileManager:
             if p.user.id == user_id:
                 return p
     
+################################################################################
+    def get_profile(self, profile_id: str) -> Optional[Profile]:
+        
+        for p in self._profiles:
+            if p.id == profile_id:
+                return p
+    
 ################################################################################
     @property
     def bot(self) -> StaffPartyBot:
@@ -82,6 +99,7 @@ class ProfileManager:
         
         profile = Profile.new(self, user)
         self._profiles.append(profile)
+        self.guild.ownership.track(profile, profile.user_id)
         
         log.info("Profiles", f"Profile created successfully for {user.id} ({user.name})")
         
@@ -90,10 +108,14 @@ class ProfileManager:
 ################################################################################
     async def on_member_leave(self, member: Member) -> bool:
         
-        for profile in self._profiles:
+        for profile in self.guild.ownership.owned(member.id, Profile):
             if profile.user.id == member.id:
                 self._profiles.remove(profile)
+                self.guild.ownership.forget(profile)
+                RenderCache.invalidate(profile)
                 return True
+            
+        return False
 
 ################################################################################
     async def bulk_update(self, interaction: Interaction) -> None:
@@ -122,24 +144,26 @@ class ProfileManager:
             log.debug("Profiles", "Bulk update cancelled.")
             return
 
-        msg = await interaction.followup.send("Please wait...")
-
-        count = 0
-        for profile in self._profiles:
-            await profile._update_post_components()
-            count += 1
-
-        await msg.delete()
+        await self.bot.bulk_jobs.start(interaction, self.guild, "profiles")
 
-        confirm = U.make_embed(
-            title="Bulk Update Complete",
-            description=f"Successfully updated {count} profiles."
-        )
-        await interaction.respond(embed=confirm)
+################################################################################
+    def bulk_targets(self) -> List[str]:
         
-        log.info(
-            "Profiles",
-            f"Bulk update completed for {count} profiles in guild {self.guild_id}"
-        )
+        return [p.id for p in self._profiles]
+    
+################################################################################
+    async def bulk_prepare(self) -> None:
+        
+        return None
+    
+################################################################################
+    async def bulk_apply(self, profile_id: str, _context: None) -> str:
+        
+        profile = self.get_profile(profile_id)
+        if profile is None:
+            return "gone"
+        
+        await profile._update_post_components()
+        return "updated"
 
 ################################################################################
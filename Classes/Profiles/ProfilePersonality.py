@@ -11,7 +11,7 @@ from UI.Profiles import (
     ProfilePersonalityModal,
     ProfileAboutMeModal
 )
-from Utilities import Utilities as U, NS, log
+from Utilities import Utilities as U, NS, log, RenderCache
 from .ProfileSection import ProfileSection
 
 if TYPE_CHECKING:
@@ -110,6 +110,7 @@ class ProfilePersonality(ProfileSection):
     def update(self) -> None:
         
         self.parent.bot.database.update.profile_personality(self)
+        RenderCache.invalidate(self.parent)
         
 ################################################################################
     async def menu(self, interaction: Interaction) -> None:
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import os
+from io import BytesIO
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, List, Optional
 
-import pandas as pd
 from discord import Interaction, Member, Role, File
 
-from Utilities import log, GlobalDataCenter
+from Utilities import log, GlobalDataCenter, Metrics
 
 if TYPE_CHECKING:
     from Classes import StaffPartyBot, XIVVenue
@@ -69,6 +70,7 @@ class ReportManager:
                 data[role.name].append('Yes' if role in member_roles else 'No')
     
         # Create a DataFrame
+        import pandas as pd
         df = pd.DataFrame(data)
     
         # Write the DataFrame to an Excel file
@@ -86,6 +88,27 @@ class ReportManager:
         
         log.info("Core", "Roles report created and sent!")
         
+################################################################################
+    @staticmethod
+    async def metrics_report(interaction: Interaction) -> None:
+        
+        log.info("Core", "Creating interaction metrics report.")
+        
+        report = Metrics.render()
+        # Keep the message under Discord's 2000 character limit; the full
+        # breakdown is always in the attached file.
+        if len(report) > 1900:
+            report = report[:1900] + "\n..."
+        
+        data = json.dumps(Metrics.snapshot(), indent=2).encode()
+        await interaction.respond(
+            f"```\n{report}\n```",
+            file=File(BytesIO(data), filename="metrics.json"),  # type: ignore
+            ephemeral=True
+        )
+        
+        log.info("Core", "Metrics report sent!")
+        
 ################################################################################
     @staticmethod
     async def itinerary_report(
@@ -171,6 +194,7 @@ class ReportManager:
                     data["Itinerary String"].append(venue.to_itinerary_string())
 
         # Create a DataFrame
+        import pandas as pd
         df = pd.DataFrame(data)
 
         date_str = start_limit.strftime("%Y-%m-%d")
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import pytz
+
+from Utilities import log
+
+if TYPE_CHECKING:
+    from discord import Guild
+
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("SnapshotManager",)
+
+################################################################################
+class SnapshotManager:
+    """Persists the parsed per-guild payload for fast warm restarts.
+
+    The snapshot is a pickle (protocol 5) of the parsed payload plus, per
+    guild, the Discord IDs that failed to resolve last time, so a restart
+    doesn't spend a REST call on each of them again. It's kept in the
+    ``snapshots`` table rather than on disk because the dyno's filesystem
+    doesn't survive a restart. Bulk reads and writes run on a worker thread
+    over their own connection, never on the event loop.
+    """
+
+    __slots__ = (
+        "_state",
+        "_snapshot",
+    )
+
+    # Bump this whenever the layout of the parsed payload changes so that
+    # stale snapshots are discarded rather than loaded.
+    VERSION = 3
+    PROTOCOL = 5
+    # Reads of the database a guild's reload may take before giving up.
+    RELOAD_ATTEMPTS = 5
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot):
+
+        self._state: StaffPartyBot = bot
+        self._snapshot: Optional[Dict[str, Any]] = None
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    @property
+    def enabled(self) -> bool:
+
+        return os.getenv("DISABLE_SNAPSHOT") != "True"
+
+################################################################################
+    @property
+    def created_at(self) -> Optional[datetime]:
+
+        return self._snapshot["created_at"] if self._snapshot is not None else None
+
+################################################################################
+    def load(self) -> Optional[Dict[int, Dict[str, Any]]]:
+
+        if not self.enabled:
+            return
+
+        log.info("Core", "Loading snapshot...")
+
+        try:
+            row = self.bot.database._load_snapshot()
+            if row is None:
+                return
+            if row[0] != self.VERSION:
+                log.warning("Core", "Snapshot version mismatch, ignoring it.")
+                return
+            snapshot = pickle.loads(bytes(row[2]))
+        except Exception as ex:
+            log.warning("Core", f"Unable to read snapshot, ignoring it: {ex}")
+            return
+
+        guild_ids = {g.id for g in self.bot.guilds}
+        if not guild_ids.issubset(snapshot["guilds"].keys()):
+            log.warning("Core", "Snapshot is missing one or more guilds, ignoring it.")
+            return
+
+        self._snapshot = snapshot
+
+        log.info(
+            "Core",
+            f"Snapshot loaded! (Created {snapshot['created_at']:%Y-%m-%d %H:%M:%S})"
+        )
+
+        return snapshot["guilds"]
+
+################################################################################
+    def missing(self, guild_id: int) -> Dict[str, List[Any]]:
+        """Discord IDs, by kind, that didn't resolve for the guild when the
+        loaded snapshot was written."""
+
+        if self._snapshot is None:
+            return {}
+
+        return self._snapshot["missing"].get(guild_id, {})
+
+################################################################################
+    def save(self, data: Dict[int, Dict[str, Any]]) -> None:
+
+        if self.enabled:
+            self._write(self._build(data))
+
+################################################################################
+    async def save_in_background(self, data: Dict[int, Dict[str, Any]]) -> None:
+
+        if self.enabled:
+            # Built here, on the loop, which is the only thing that touches
+            # the guilds; only the pickling and the write go to the thread.
+            snapshot = self._build(data)
+            await asyncio.to_thread(self._detached, self._write, snapshot)
+
+################################################################################
+    def _build(self, data: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+
+        return {
+            "version": self.VERSION,
+            "created_at": datetime.now(pytz.utc),
+            "guilds": data,
+            "missing": {g.guild_id: g.missing_ids() for g in self.bot.guild_manager.fguilds},
+        }
+
+################################################################################
+    def _write(self, snapshot: Dict[str, Any]) -> None:
+
+        log.info("Core", "Writing snapshot...")
+
+        try:
+            self.bot.database.insert.snapshot(
+                self.VERSION,
+                snapshot["created_at"],
+                pickle.dumps(snapshot, protocol=self.PROTOCOL)
+            )
+        except Exception as ex:
+            log.error("Core", f"Unable to write snapshot: {ex}")
+            return
+
+        self._snapshot = snapshot
+
+        log.info("Core", "Snapshot written!")
+
+################################################################################
+    def drifted_guilds(self, fresh: Dict[int, Dict[str, Any]]) -> List[int]:
+
+        if self._snapshot is None:
+            return list(fresh.keys())
+
+        stale = self._snapshot["guilds"]
+        return [
+            guild_id for guild_id, data in fresh.items()
+            if self._canonical(stale.get(guild_id)) != self._canonical(data)
+        ]
+
+################################################################################
+    async def reconcile(self) -> None:
+        """Reloads every guild whose data has changed in Postgres since the
+        snapshot was written, or which has had an entity it couldn't
+        resolve come back on Discord."""
+
+        log.info("Core", "Reconciling snapshot against the database and Discord...")
+
+        writes = self.bot.database.writes
+        fresh = await self._read_database()
+
+        drifted = await asyncio.to_thread(self.drifted_guilds, fresh)
+        for frogge in list(self.bot.guild_manager.fguilds):
+            if frogge.guild_id not in drifted and await frogge.recheck_missing():
+                drifted.append(frogge.guild_id)
+
+        for guild_id in drifted:
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                continue
+
+            log.warning("Core", f"Snapshot drift detected for guild {guild_id}, reloading.")
+            fresh, writes = await self._reload(guild, fresh, writes)
+
+        await self.save_in_background(fresh)
+
+        log.info("Core", f"Snapshot reconciled! ({len(drifted)} guild(s) reloaded)")
+
+################################################################################
+    async def _reload(
+        self,
+        guild: Guild,
+        fresh: Dict[int, Dict[str, Any]],
+        writes: int
+    ) -> Tuple[Dict[int, Dict[str, Any]], int]:
+        """Rebuilds the guild from ``fresh`` - read when the database's
+        write count was ``writes`` - and swaps it in. Returns the latest read
+        and the write count it was taken at."""
+
+        manager = self.bot.guild_manager
+        data = fresh[guild.id]
+        frogge = None
+
+        for _ in range(self.RELOAD_ATTEMPTS):
+            if frogge is None:
+                frogge = await manager.build_guild(guild, data)
+
+            # Building awaits Discord while the bot keeps serving the old
+            # objects, and whatever they've written since the read isn't in
+            # the new ones. Swap only if nothing has been written, with no
+            # await in between - otherwise read again and rebuild if this
+            # guild's rows changed.
+            if self.bot.database.writes == writes:
+                manager.replace_guild(frogge)
+                return fresh, writes
+
+            writes = self.bot.database.writes
+            fresh = await self._read_database()
+            if self._canonical(fresh[guild.id]) != self._canonical(data):
+                frogge.close()
+                frogge, data = None, fresh[guild.id]
+
+        if frogge is not None:
+            frogge.close()
+
+        log.warning(
+            "Core",
+            f"Guild {guild.id} kept changing while it reloaded, leaving its current data in place."
+        )
+
+        return fresh, writes
+
+################################################################################
+    async def refresh(self) -> None:
+
+        await self.save_in_background(await self._read_database())
+
+################################################################################
+    async def _read_database(self) -> Dict[int, Dict[str, Any]]:
+
+        payload = await asyncio.to_thread(self._detached, self.bot.database._load_all)
+        return await asyncio.to_thread(self.bot._parse_data, payload)
+
+################################################################################
+    def _detached(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Runs on the worker thread."""
+
+        with self.bot.database.detached():
+            return func(*args)
+
+################################################################################
+    @staticmethod
+    def _canonical(value: Any) -> Any:
+
+        # Row order out of Postgres isn't stable, so compare rows as sorted
+        # collections rather than in the order they happen to arrive.
+        if isinstance(value, dict):
+            return {k: SnapshotManager._canonical(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return sorted((SnapshotManager._canonical(v) for v in value), key=repr)
+
+        return value
+
+################################################################################
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from discord import ForumChannel, PartialMessage, Thread
+################################################################################
+
+__all__ = ("ThreadIndex",)
+
+################################################################################
+class ThreadIndex:
+    """Maps each forum channel's thread names to their threads.
+
+    A channel is indexed the first time it's looked up - its active threads
+    from the cache plus its archived ones, paged once from the API - and kept
+    current from thread create/update/delete events from then on, so posting
+    never has to scan ``channel.threads`` or page a thread's history. Names
+    match case-insensitively, ignoring surrounding whitespace.
+
+    A forum thread's starter message shares the thread's ID, so it can be
+    reached without fetching anything (see ``starter_message``).
+    """
+
+    __slots__ = (
+        "_channels",
+        "_loading",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        # Forum channel ID -> normalized name -> thread. Channels that are
+        # still being indexed are in here too, so events aren't lost.
+        self._channels: Dict[int, Dict[str, Thread]] = {}
+        self._loading: Dict[int, asyncio.Future] = {}
+
+################################################################################
+    @staticmethod
+    def normalize(name: str) -> str:
+
+        return name.strip().casefold()
+
+################################################################################
+    @staticmethod
+    def starter_message(thread: Thread) -> PartialMessage:
+
+        return thread.get_partial_message(thread.id)
+
+################################################################################
+    async def get(self, channel: ForumChannel, name: str) -> Optional[Thread]:
+
+        if channel.id not in self._channels or channel.id in self._loading:
+            await self._index(channel)
+
+        return self._channels[channel.id].get(self.normalize(name))
+
+################################################################################
+    async def _index(self, channel: ForumChannel) -> None:
+
+        if pending := self._loading.get(channel.id):
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[channel.id] = future
+
+        threads = self._channels.setdefault(channel.id, {})
+        try:
+            # Newest first, so the most recent of any same-named threads wins,
+            # and anything the events have added meanwhile is left alone.
+            async for thread in channel.archived_threads(limit=None):
+                threads.setdefault(self.normalize(thread.name), thread)
+            for thread in channel.threads:
+                threads[self.normalize(thread.name)] = thread
+        except BaseException as ex:
+            # Try again on the next lookup.
+            del self._channels[channel.id]
+            future.set_exception(ex)
+            future.exception()
+            raise
+        else:
+            future.set_result(None)
+        finally:
+            del self._loading[channel.id]
+
+################################################################################
+    def add(self, thread: Thread) -> None:
+
+        if (threads := self._channels.get(thread.parent_id)) is not None:
+            threads[self.normalize(thread.name)] = thread
+
+################################################################################
+    def rename(self, parent_id: int, thread_id: int, name: str, thread: Optional[Thread] = None) -> None:
+        """``thread`` replaces the indexed object if given; otherwise the one
+        already indexed is moved to its new name."""
+
+        if (threads := self._channels.get(parent_id)) is None:
+            return
+
+        for key, t in list(threads.items()):
+            if t.id == thread_id:
+                del threads[key]
+                thread = thread or t
+
+        if thread is not None:
+            threads[self.normalize(name)] = thread
+
+################################################################################
+    def discard(self, parent_id: int, thread_id: int) -> None:
+
+        if (threads := self._channels.get(parent_id)) is None:
+            return
+
+        for key, t in list(threads.items()):
+            if t.id == thread_id:
+                del threads[key]
+
+################################################################################
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+from datetime import datetime
+from itertools import count
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from Utilities import log
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("TimerService", "Timer")
+
+# (guild_id, kind, key)
+TimerID = Tuple[int, str, str]
+
+################################################################################
+class Timer:
+    """A single pending delayed action."""
+
+    __slots__ = (
+        "guild_id",
+        "kind",
+        "key",
+        "due",
+        "payload",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        guild_id: int,
+        kind: str,
+        key: str,
+        due: float,
+        payload: Dict[str, Any]
+    ) -> None:
+
+        self.guild_id: int = guild_id
+        self.kind: str = kind
+        self.key: str = key
+        self.due: float = due
+        self.payload: Dict[str, Any] = payload
+
+################################################################################
+    @property
+    def id(self) -> TimerID:
+
+        return self.guild_id, self.kind, self.key
+
+################################################################################
+    @classmethod
+    def load(cls, data: Tuple[Any, ...]) -> Timer:
+
+        return cls(data[0], data[1], data[2], data[3], json.loads(data[4]))
+
+################################################################################
+class TimerService:
+    """One heap-driven timer for every delayed action the bot needs.
+
+    Timers are identified by ``(guild_id, kind, key)``; scheduling the same
+    identity again replaces the pending timer. When a timer comes due it's
+    handed to ``GuildData.on_timer`` for that guild. Each pending timer is
+    a row in the ``timers`` table, written as it's scheduled and deleted as
+    it's cancelled or fires, so they survive a restart.
+    """
+
+    __slots__ = (
+        "_state",
+        "_timers",
+        "_heap",
+        "_counter",
+        "_wakeup",
+        "_task",
+    )
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot):
+
+        self._state: StaffPartyBot = bot
+
+        self._timers: Dict[TimerID, Timer] = {}
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._counter = count()
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._timers)
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    def load(self) -> None:
+
+        for record in self.bot.database._load_timers():
+            self._push(Timer.load(record))
+
+        log.info("Core", f"Restored {len(self._timers)} pending timer(s).")
+
+################################################################################
+    def start(self) -> None:
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+################################################################################
+    def schedule(self, guild_id: int, kind: str, key: Any, when: datetime, **payload) -> None:
+
+        timer = Timer(guild_id, kind, str(key), when.timestamp(), payload)
+
+        # Guilds reschedule everything they own on load - don't rewrite rows
+        # that haven't changed.
+        current = self._timers.get(timer.id)
+        if current is not None and current.due == timer.due and current.payload == payload:
+            return
+
+        self._push(timer)
+        self.bot.database.insert.timer(
+            guild_id, kind, timer.key, timer.due, json.dumps(payload)
+        )
+
+################################################################################
+    def cancel(self, guild_id: int, kind: str, key: Any) -> None:
+
+        # The heap entry stays put and is skipped once it reaches the top.
+        if self._timers.pop((guild_id, kind, str(key)), None) is not None:
+            self.bot.database.delete.timer(guild_id, kind, str(key))
+
+################################################################################
+    def pending(self, guild_id: int, kind: str, key: Any) -> bool:
+
+        return (guild_id, kind, str(key)) in self._timers
+
+################################################################################
+    def _push(self, timer: Timer) -> None:
+
+        self._timers[timer.id] = timer
+
+        entry = (timer.due, next(self._counter), timer)
+        heapq.heappush(self._heap, entry)
+
+        if self._heap[0] is entry:
+            self._wakeup.set()
+
+################################################################################
+    async def _run(self) -> None:
+
+        while True:
+            self._wakeup.clear()
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - datetime.now().timestamp()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, timer = heapq.heappop(self._heap)
+            # Cancelled or replaced since this entry was pushed.
+            if self._timers.get(timer.id) is not timer:
+                continue
+
+            del self._timers[timer.id]
+            self.bot.database.delete.timer(*timer.id)
+
+            await self._fire(timer)
+
+################################################################################
+    async def _fire(self, timer: Timer) -> None:
+
+        guild = self.bot[timer.guild_id]
+        if guild is None:
+            log.warning("Core", f"Dropping {timer.kind} timer for unknown guild {timer.guild_id}.")
+            return
+
+        try:
+            await guild.on_timer(timer.kind, timer.payload)
+        except Exception as ex:
+            log.error("Core", f"{timer.kind} timer ({timer.key}) failed: {ex}")
+
+################################################################################
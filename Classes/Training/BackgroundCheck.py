@@ -95,7 +95,6 @@ class BackgroundCheck:
         if self._post_msg is not None:
             view = BGCheckApprovalView(self)
             await self.post_message.edit(view=view)
-            parent.bot.add_view(view, message_id=self._post_msg.id)
             
         self._submitted = data[10]
         self._approved_at = data[11]
@@ -16,7 +16,7 @@ from UI.Training import (
     GroupTrainingPickupView,
     GroupTrainingNoShowView
 )
-from Utilities import Utilities as U, log, SignupLevel, RoleType
+from Utilities import Utilities as U, log, SignupLevel, RoleType, RenderCache
 from Utilities.Errors import (
     DateTimeFormatError,
     DateTimeMismatchError,
@@ -53,6 +53,8 @@ class GroupTraining:
         "_completed",
         "_paid",
         "_attended",
+        # RenderCache only holds weak references
+        "__weakref__",
     )
     
     REMINDER_THRESHOLD = 30
@@ -138,6 +140,9 @@ class GroupTraining:
             )
             for s in data["signups"]
         ]
+        for s in self._signups:
+            if s.user is not None:
+                mgr.guild.ownership.track(s, s.user.user_id)
         
         self._completed = data["training"][9]
         self._paid = data["training"][10]
@@ -153,6 +158,12 @@ class GroupTraining:
         
         return self._mgr.bot
     
+################################################################################
+    @property
+    def manager(self) -> TrainingManager:
+        
+        return self._mgr
+    
 ################################################################################
     @property
     def id(self) -> str:
@@ -193,7 +204,9 @@ class GroupTraining:
     def start_time(self, value: Optional[datetime]) -> None:
         
         self._start = value
+        self._reminder_sent = False
         self.update()
+        self.schedule_reminder()
         
 ################################################################################
     @property
@@ -316,12 +329,15 @@ class GroupTraining:
     def update(self) -> None:
         
         self._mgr.bot.database.update.group_training(self)
+        RenderCache.invalidate(self)
         
 ################################################################################
     def delete(self) -> None:
         
         self._mgr.bot.database.delete.group_training(self)
         self._mgr.groups.remove(self)
+        self.bot.timers.cancel(self._mgr.guild_id, "group_reminder", self._id)
+        RenderCache.invalidate(self)
         
 ################################################################################
     def get_signup_by_user(self, user: TUser) -> Optional[GroupTrainingSignup]:
@@ -340,6 +356,7 @@ class GroupTraining:
         await view.wait()
     
 ################################################################################
+    @RenderCache.cached
     def status(self) -> Embed:
         
         return U.make_embed(
@@ -570,7 +587,9 @@ class GroupTraining:
 
         self._start = start_time
         self._end = end_time
+        self._reminder_sent = False
         self.update()
+        self.schedule_reminder()
         
         if prev_start is not None:
             notification = U.make_embed(
@@ -657,7 +676,6 @@ class GroupTraining:
             return
 
         post_view = GroupTrainingPickupView(self)
-        self.bot.add_view(post_view)
 
         channel = self._mgr.guild.channel_manager.group_training_channel
 
@@ -711,7 +729,6 @@ class GroupTraining:
 
         try:
             view = GroupTrainingPickupView(self)
-            self.bot.add_view(view, message_id=self.post_message.id)
             await self.post_message.edit(embed=self.status(), view=view)
         except NotFound as ex:
             log.error(
@@ -788,6 +805,8 @@ class GroupTraining:
                 confirm_str = "Your signup has been changed to confirmed."
         else:
             self._signups.append(GroupTrainingSignup.new(self, trainee, SignupLevel.Accepted))
+            self._mgr.guild.ownership.track(self._signups[-1], trainee.user_id)
+            RenderCache.invalidate(self)
             confirm_str = "You have successfully signed up for this group training."
             
         confirm = U.make_embed(
@@ -815,6 +834,8 @@ class GroupTraining:
                 confirm_str = "Your signup has been changed to tentative."
         else:
             self._signups.append(GroupTrainingSignup.new(self, trainee, SignupLevel.Tentative))
+            self._mgr.guild.ownership.track(self._signups[-1], trainee.user_id)
+            RenderCache.invalidate(self)
             confirm_str = "You have tentatively signed up for this group training."
 
         confirm = U.make_embed(
@@ -823,16 +844,37 @@ class GroupTraining:
         )
         await interaction.respond(embed=confirm, ephemeral=True)
     
+################################################################################
+    def schedule_reminder(self, skip_past: bool = False) -> None:
+        
+        if self.is_completed or self.start_time is None:
+            self.bot.timers.cancel(self._mgr.guild_id, "group_reminder", self._id)
+            return
+        
+        remind_at = self.start_time - timedelta(minutes=self.REMINDER_THRESHOLD)
+        # When loading, a reminder whose time has already come has either been
+        # sent before the restart or is still pending in the timer service.
+        if skip_past and U.compare_datetimes(remind_at, datetime.now()) != 1:
+            return
+        
+        self.bot.timers.schedule(
+            self._mgr.guild_id, "group_reminder", self._id, remind_at, group_id=self._id
+        )
+        
 ################################################################################
     async def reminder(self) -> None:
         
         if self.is_completed or self.start_time is None or self._reminder_sent:
             return
+        
+        # Don't bother anyone about a training that's already started.
+        if U.compare_datetimes(self.start_time, datetime.now()) != 1:
+            return
     
         if U.compare_datetimes(
             self.start_time - timedelta(minutes=self.REMINDER_THRESHOLD),
             datetime.now()
-        ) == 1:
+        ) != 1:
             notification = U.make_embed(
                 title="Group Training Reminder",
                 description=(
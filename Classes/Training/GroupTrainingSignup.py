@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Type, TypeVar
 
-from Utilities import SignupLevel
+from Utilities import SignupLevel, RenderCache
 
 if TYPE_CHECKING:
     from Classes import TUser, GroupTraining
@@ -67,10 +67,13 @@ class GroupTrainingSignup:
         
         self._parent.bot.database.delete.group_training_signup(self)
         self._parent.signups.remove(self)
+        self._parent.manager.guild.ownership.forget(self)
+        RenderCache.invalidate(self._parent)
         
 ################################################################################
     def update(self) -> None:
         
         self._parent.bot.database.update.group_training_signup(self)
+        RenderCache.invalidate(self._parent)
         
 ################################################################################
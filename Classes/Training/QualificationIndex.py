@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Set
+
+if TYPE_CHECKING:
+    from Classes import TUser
+################################################################################
+
+__all__ = ("QualificationIndex",)
+
+################################################################################
+class QualificationIndex:
+    """Maps each position to the trainers qualified for it.
+
+    A second map tracks the subset of those trainers that should be pinged
+    about new trainings (i.e. not on hiatus and accepting trainee pings), so
+    both lookups are O(k) in the number of trainers returned.
+
+    ``version`` goes up on every change, so anything derived from the index
+    can tell when it's out of date.
+    """
+
+    __slots__ = (
+        "_qualified",
+        "_notifiable",
+        "_positions",
+        "_version",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._qualified: Dict[str, Dict[int, TUser]] = {}
+        self._notifiable: Dict[str, Dict[int, TUser]] = {}
+        self._positions: Dict[int, Set[str]] = {}
+        self._version: int = 0
+
+################################################################################
+    @property
+    def version(self) -> int:
+
+        return self._version
+
+################################################################################
+    def rebuild(self, tusers: List[TUser]) -> None:
+
+        self._qualified.clear()
+        self._notifiable.clear()
+        self._positions.clear()
+        self._version += 1
+
+        for tuser in tusers:
+            self.update_user(tuser)
+
+################################################################################
+    def update_user(self, tuser: TUser) -> None:
+
+        self.remove_user(tuser.user_id)
+
+        position_ids = {q.position.id for q in tuser.qualifications}
+        if not position_ids:
+            return
+
+        notify = not tuser.on_hiatus and tuser.accepting_trainee_pings()
+        for pos_id in position_ids:
+            self._qualified.setdefault(pos_id, {})[tuser.user_id] = tuser
+            if notify:
+                self._notifiable.setdefault(pos_id, {})[tuser.user_id] = tuser
+
+        self._positions[tuser.user_id] = position_ids
+
+################################################################################
+    def remove_user(self, user_id: int) -> None:
+
+        self._version += 1
+        for pos_id in self._positions.pop(user_id, ()):
+            self._qualified.get(pos_id, {}).pop(user_id, None)
+            self._notifiable.get(pos_id, {}).pop(user_id, None)
+
+################################################################################
+    def qualified(self, position_id: str) -> List[TUser]:
+
+        return list(self._qualified.get(position_id, {}).values())
+
+################################################################################
+    def notifiable(self, position_id: str) -> List[TUser]:
+
+        return list(self._notifiable.get(position_id, {}).values())
+
+################################################################################
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Optional, Tuple, Any, List
 
 from discord import (
@@ -30,7 +31,13 @@ class SignUpMessage:
         "_manager",
         "_channel",
         "_message",
+        "_view",
+        "_dirty",
+        "_render_task",
     )
+    
+    # Minimum number of seconds between edits of the sign-up message.
+    RENDER_WINDOW = 5
 
 ################################################################################
     def __init__(self, mgr: TrainingManager):
@@ -39,6 +46,10 @@ class SignUpMessage:
 
         self._channel: Optional[TextChannel] = None
         self._message: Optional[Message] = None
+        
+        self._view: Optional[TrainerMessageButtonView] = None
+        self._dirty: bool = False
+        self._render_task: Optional[asyncio.Task] = None
 
 ################################################################################
     async def load(self, data: Tuple[Any, ...]) -> None:
@@ -68,6 +79,7 @@ class SignUpMessage:
             self.update(guild_id)
             return
 
+        self._build_view()
         await self.update_components()
 
 ################################################################################
@@ -176,10 +188,9 @@ class SignUpMessage:
             log.info("Training", f"SignupMessage already exists, deleting.")
             await self._message.delete()
 
-        view = TrainerMessageButtonView(self)
+        self._view = TrainerMessageButtonView(self)
     
-        self._message = await self._channel.send(embed=self.status(), view=view)
-        self.bot.add_view(view, message_id=self._message.id)
+        self._message = await self._channel.send(embed=self.status(), view=self._view)
         
         self.update(interaction.guild_id)
         
@@ -193,9 +204,46 @@ class SignUpMessage:
             )
         )
         
+################################################################################
+    def _build_view(self) -> None:
+        
+        self._view = TrainerMessageButtonView(self)
+        
 ################################################################################
     async def update_components(self) -> None:
         
+        if self._channel is None or self._message is None:
+            return
+        
+        # Mark the board dirty and let a single render task coalesce any
+        # further updates that land within the render window.
+        self._dirty = True
+        if self._render_task is None or self._render_task.done():
+            self._render_task = asyncio.create_task(self._render_loop())
+        
+################################################################################
+    def stop(self) -> None:
+        
+        if self._render_task is not None:
+            self._render_task.cancel()
+            self._render_task = None
+        
+################################################################################
+    async def _render_loop(self) -> None:
+        
+        while self._dirty:
+            self._dirty = False
+            
+            try:
+                await self._render()
+            except Exception as ex:
+                log.error("Training", f"Failed to update SignupMessage: {ex}")
+                
+            await asyncio.sleep(self.RENDER_WINDOW)
+        
+################################################################################
+    async def _render(self) -> None:
+        
         if self._channel is None or self._message is None:
             return
         
@@ -207,10 +255,12 @@ class SignUpMessage:
             )
         )
         
-        view = TrainerMessageButtonView(self)
-        self.bot.add_view(view, message_id=self._message.id)
+        if self._view is None:
+            self._build_view()
+        else:
+            self._view.set_disabled()
         
-        await self._message.edit(embed=self.status(), view=view)
+        await self._message.edit(embed=self.status(), view=self._view)
         
         log.info("Training", "SignupMessage components updated.")
 
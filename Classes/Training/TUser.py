@@ -24,11 +24,13 @@ from Utilities import (
     Utilities as U,
     TrainingLevel,
     GlobalDataCenter,
+    GameData,
     log,
     Weekday,
     RoleType,
     DTOperations,
-    PayAlreadyRequestedError
+    PayAlreadyRequestedError,
+    RenderCache,
 )
 from .BackgroundCheck import BackgroundCheck
 from .Qualification import Qualification
@@ -47,7 +49,8 @@ if TYPE_CHECKING:
         JobPosting,
         Profile,
         Venue,
-        GroupTraining
+        GroupTraining,
+        WeeklySchedule,
     )
 ################################################################################
 
@@ -69,6 +72,8 @@ class TUser:
         "_bg_check",
         "_mutes",
         "_pay_requested",
+        # RenderCache only holds weak references
+        "__weakref__",
     )
 
 ################################################################################
@@ -242,11 +247,17 @@ class TUser:
         self._availability.sort(key=lambda a: a.day.value)
         return self._availability
 
+################################################################################
+    @property
+    def schedule(self) -> WeeklySchedule:
+        
+        return TAvailability.combined_schedule(self._availability)
+    
 ################################################################################
     @property
     def trainings_as_trainee(self) -> List[Training]:
 
-        ret = [t for t in self.training_manager.all_trainings if t.trainee == self]
+        ret = [t for t in self.guild.ownership.owned(self.user_id, Training) if t.trainee == self]
         ret.sort(key=lambda t: t.position.name)
         return ret
 
@@ -254,7 +265,7 @@ class TUser:
     @property
     def trainings_as_trainer(self) -> List[Training]:
         
-        ret = [t for t in self.training_manager.all_trainings if t.trainer == self]
+        ret = [t for t in self.guild.ownership.owned(self.user_id, Training) if t.trainer == self]
         ret.sort(key=lambda t: t.position.name)
         return ret
     
@@ -322,6 +333,7 @@ class TUser:
         return any(q.position.id == position_id for q in self.qualifications)
     
 ################################################################################
+    @RenderCache.cached
     def admin_status(self) -> Embed:
 
         return U.make_embed(
@@ -433,6 +445,7 @@ class TUser:
         )
     
 ################################################################################
+    @RenderCache.cached
     def user_status(self) -> Embed:
 
         fields = [
@@ -497,6 +510,7 @@ class TUser:
     async def set_data_centers(self, interaction: Interaction) -> None:
 
         await self._details.set_data_centers(interaction)
+        self.training_manager.ranker.invalidate()
         
 ################################################################################
     async def set_availability(self, interaction: Interaction) -> None:
@@ -520,6 +534,8 @@ class TUser:
             availability = TAvailability.new(self, weekday, start_time, end_time)
             self._availability.append(availability)
 
+        self._manager.ranker.invalidate()
+        RenderCache.invalidate(self)
         await self._manager.notify_of_availability_change(self)
         
         log.info("Training", f"Availability setup complete for {weekday.proper_name}.")
@@ -572,6 +588,9 @@ class TUser:
         for position in positions:
             qualification = Qualification.new(self.training_manager, self.user, position, level)
             self._qualifications.append(qualification)
+            
+        self.training_manager.qualification_index.update_user(self)
+        RenderCache.invalidate(self)
 
 ################################################################################
     async def modify_qualification(self, interaction: Interaction) -> None:
@@ -609,6 +628,9 @@ class TUser:
         for pos in positions:
             qualification = self.get_qualification(pos.id)
             qualification.update(TrainingLevel(int(view.value[1])))
+            
+        self.training_manager.qualification_index.update_user(self)
+        RenderCache.invalidate(self)
 
 ################################################################################
     def qualification_options(self) -> List[SelectOption]:
@@ -694,6 +716,9 @@ class TUser:
             qualification.delete()
             self._qualifications.remove(qualification)
             
+        self.training_manager.qualification_index.update_user(self)
+        RenderCache.invalidate(self)
+            
         log.info("Training", "Qualification removal complete.")
 
 ################################################################################
@@ -906,6 +931,8 @@ class TUser:
     def toggle_pings(self) -> None:
         
         self._config.toggle_trainee_pings()
+        self.training_manager.qualification_index.update_user(self)
+        RenderCache.invalidate(self)
         
         log.info(
             "Training",
@@ -932,10 +959,7 @@ class TUser:
             )
         )
 
-        pages = [
-            t.status_page(interaction.user) for t in self.trainings_as_trainer
-            if not t.is_complete
-        ]
+        pages = self.dashboard_pages(interaction.user)
         if not pages:
             error = U.make_embed(
                 title="No Trainings Found",
@@ -955,6 +979,42 @@ class TUser:
         await frogginator.goto_page(cur_page)
         await frogginator.wait()
     
+################################################################################
+    def dashboard_pages(self, owner: User) -> List[Page]:
+        
+        pages = [
+            t.status_page(owner) for t in self.trainings_as_trainer
+            if not t.is_complete
+        ]
+        
+        recommendations = self.training_manager.ranker.recommendations_for(self)
+        if recommendations:
+            pages.append(Page(embeds=[self._recommendations_status(recommendations)]))
+            
+        return pages
+    
+################################################################################
+    @staticmethod
+    def _recommendations_status(recommendations: List[Tuple[Training, Any]]) -> Embed:
+        
+        value = ""
+        for training, (_, score, minutes, _) in recommendations:
+            value += (
+                f"* `{training.trainee.name}` - {training.position.name} "
+                f"*(Score: {score}, {minutes // 60}h common)*\n"
+            )
+            
+        return U.make_embed(
+            title="Recommended Trainees",
+            description=(
+                "You're one of the best-fit trainers for the following\n"
+                "unmatched trainings. You can pick them up from the\n"
+                "sign-up message.\n"
+                f"{U.draw_line(extra=25)}\n"
+                f"{value}"
+            )
+        )
+    
 ################################################################################
     async def refresh_dashboard(self, interaction: Interaction, cur_page: int) -> None:
 
@@ -1042,6 +1102,8 @@ class TUser:
                 t.reset()
                 
         self._details.toggle_hiatus()
+        self.training_manager.qualification_index.update_user(self)
+        RenderCache.invalidate(self)
         
         log.info(
             "Training",
@@ -1138,7 +1200,8 @@ class TUser:
     
         # Check if job's data center is in the user's data centers list
         if compare_data_centers and len(self.profile.data_centers) > 0:
-            if not any(dc.contains(job.venue.location.data_center) for dc in self.profile.data_centers):
+            regions = GameData.region_mask(self.profile.data_centers)
+            if not regions & GameData.dc_bit(job.venue.location.data_center):
                 log.debug("Training", "User does not have the required data center.")
                 return False
     
@@ -1160,14 +1223,9 @@ class TUser:
 
         # If comparing schedules, check if the user is available during the job's times
         if compare_schedule and check_profile:
-            # Adjust for 0-indexed weekday where 0 is Monday, to match your custom 0-indexed day where 0 is Sunday
-            job_day = (job.start_time.weekday() + 1) % 7 
-            for availability in self.profile.availability:
-                if availability.day.value == job_day:
-                    start_time, end_time = job.start_time.time(), job.end_time.time()
-                    if availability.contains(start_time, end_time):
-                        log.debug("Training", "User is available for the job.")
-                        return True
+            if self.profile.schedule.contains(job.schedule):
+                log.debug("Training", "User is available for the job.")
+                return True
             log.debug("Training", "User is not available for the job.")
             return False  # If no matching availability was found
     
@@ -1434,9 +1492,18 @@ class TUser:
             modified += 1
             
         for t in self.trainings_as_trainee:
-            await self.training_manager.remove_training(t.id)
+            await self.guild.log.training_removed(t)
+            t.delete()
             deleted += 1
             
+        if deleted:
+            await self.training_manager.signup_message.update_components()
+        
+        # They stay registered in case they come back, but mustn't be
+        # offered as a trainer in the meantime.
+        self.training_manager.qualification_index.remove_user(self.user_id)
+        RenderCache.invalidate(self)
+            
         log.info(
             "Training",
             (
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from Classes import TrainingManager, Training, TUser, WeeklySchedule
+################################################################################
+
+__all__ = ("TrainerRanker",)
+
+# (trainer, score, minutes of common availability, open trainings)
+Recommendation = Tuple["TUser", float, int, int]
+
+################################################################################
+class TrainerRanker:
+    """Scores qualified trainers against every unmatched training.
+
+    The last ranking is kept until the qualification index changes or
+    ``invalidate`` is called - by whatever changes a training or a user's
+    data centers or availability - so repeated dashboard and report views
+    don't re-score the whole backlog. Callers mustn't modify what's returned.
+    """
+
+    __slots__ = (
+        "_mgr",
+        "_cache",
+        "_cache_key",
+    )
+
+    DC_WEIGHT = 40
+    AVAILABILITY_WEIGHT = 40
+    WORKLOAD_WEIGHT = 20
+
+    # Ten hours a week of common time earns the full availability score.
+    FULL_OVERLAP = 600
+
+################################################################################
+    def __init__(self, mgr: TrainingManager) -> None:
+
+        self._mgr: TrainingManager = mgr
+
+        self._cache: Dict[str, List[Recommendation]] = {}
+        self._cache_key: Optional[Tuple[Any, ...]] = None
+
+################################################################################
+    def invalidate(self) -> None:
+
+        self._cache_key = None
+
+################################################################################
+    def rank_all(self, k: int = 5) -> Dict[str, List[Recommendation]]:
+
+        key = (k, self._mgr.qualification_index.version)
+        if self._cache_key != key:
+            self._cache = self._rank_all(k)
+            self._cache_key = key
+
+        return self._cache
+
+################################################################################
+    def _rank_all(self, k: int) -> Dict[str, List[Recommendation]]:
+
+        # Everything that doesn't depend on the trainee is computed once up
+        # front so the whole backlog is ranked in a single pass.
+        workload = Counter(
+            t.trainer.user_id for t in self._mgr.all_trainings
+            if t.trainer is not None and not t.is_complete
+        )
+        schedules: Dict[int, WeeklySchedule] = {}
+
+        def _schedule(tuser: TUser) -> WeeklySchedule:
+            if tuser.user_id not in schedules:
+                schedules[tuser.user_id] = tuser.schedule
+            return schedules[tuser.user_id]
+
+        ret = {}
+        for training in self._mgr.unmatched_trainings:
+            trainee = training.trainee
+            trainee_schedule = _schedule(trainee)
+
+            scored = []
+            for trainer in self._mgr.qualification_index.qualified(training.position.id):
+                if trainer.on_hiatus or trainer.user_id == trainee.user_id:
+                    continue
+
+                minutes = trainee_schedule.overlap_minutes(_schedule(trainer))
+                open_count = workload[trainer.user_id]
+                score = self._score(trainee, trainer, minutes, open_count)
+                if score is not None:
+                    scored.append((trainer, score, minutes, open_count))
+
+            ret[training.id] = heapq.nlargest(k, scored, key=lambda r: r[1])
+
+        return ret
+
+################################################################################
+    def recommendations_for(self, trainer: TUser, k: int = 5) -> List[Tuple[Training, Recommendation]]:
+
+        ret = []
+        for training_id, ranked in self.rank_all(k).items():
+            for rec in ranked:
+                if rec[0].user_id == trainer.user_id:
+                    ret.append((self._mgr.get_training(training_id), rec))
+                    break
+
+        ret.sort(key=lambda r: r[1][1], reverse=True)
+        return ret
+
+################################################################################
+    def _score(self, trainee: TUser, trainer: TUser, minutes: int, open_count: int) -> Optional[float]:
+
+        trainee_dcs = set(trainee.data_centers)
+        trainer_dcs = set(trainer.data_centers)
+
+        if trainee_dcs and trainer_dcs:
+            common = trainee_dcs & trainer_dcs
+            # Same rule as signup notifications: no shared DC, no match.
+            if not common:
+                return
+            dc_score = self.DC_WEIGHT * len(common) / len(trainee_dcs)
+        else:
+            dc_score = self.DC_WEIGHT / 2
+
+        availability_score = (
+            self.AVAILABILITY_WEIGHT * min(minutes, self.FULL_OVERLAP) / self.FULL_OVERLAP
+        )
+        workload_score = self.WORKLOAD_WEIGHT / (1 + open_count)
+
+        return round(dc_score + availability_score + workload_score, 1)
+
+################################################################################
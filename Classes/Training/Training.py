@@ -8,7 +8,7 @@ from discord.ext.pages import Page
 from Assets import BotEmojis
 from UI.Common import ConfirmCancelView
 from UI.Training import TrainerDashboardButtonView, TrainingUpdateView
-from Utilities import Utilities as U, RequirementLevel, log, RoleType
+from Utilities import Utilities as U, RequirementLevel, log, RoleType, RenderCache
 
 if TYPE_CHECKING:
     from Classes import Position, TUser, StaffPartyBot, Requirement, TrainingManager
@@ -157,11 +157,33 @@ class Training:
 
         self.bot.database.delete.training(self)
         self.manager._trainings.remove(self)
+        self.manager.guild.ownership.forget(self)
+        self.manager.ranker.invalidate()
+        self._invalidate_users()
 
 ################################################################################
     def update(self) -> None:
 
         self.bot.database.update.training(self)
+        self.manager.ranker.invalidate()
+        self._invalidate_users()
+        self.track_users()
+
+################################################################################
+    def track_users(self) -> None:
+
+        self.manager.guild.ownership.track(
+            self,
+            self._trainee.user_id,
+            self._trainer.user_id if self._trainer is not None else None
+        )
+
+################################################################################
+    def _invalidate_users(self) -> None:
+
+        RenderCache.invalidate(self._trainee)
+        if self._trainer is not None:
+            RenderCache.invalidate(self._trainer)
 
 ################################################################################
     async def set_trainer(self, trainer: Optional[TUser], send_confirmation: bool = True) -> None:
@@ -172,6 +194,8 @@ class Training:
         )
 
         prev_trainer = self.trainer
+        if prev_trainer is not None:
+            RenderCache.invalidate(prev_trainer)
         
         self.reset()
         self._trainer = trainer
@@ -18,6 +18,7 @@ from discord import (
 from discord.ext.pages import Page, PageGroup
 
 from .GroupTraining import GroupTraining
+from .GroupTrainingSignup import GroupTrainingSignup
 from UI.Common import ConfirmCancelView, Frogginator
 from UI.Training import (
     TUserAdminStatusView,
@@ -40,8 +41,11 @@ from Utilities import (
     log,
     InvalidPositionSelectionError,
     NoTrainingsError,
+    RenderCache,
 )
+from .QualificationIndex import QualificationIndex
 from .SignUpMessage import SignUpMessage
+from .TrainerRanker import TrainerRanker
 from .TUser import TUser
 from .Training import Training
 
@@ -60,6 +64,8 @@ class TrainingManager:
         "_trainings",
         "_message",
         "_groups",
+        "_qual_index",
+        "_ranker",
     )
 
 ################################################################################
@@ -72,6 +78,8 @@ class TrainingManager:
         self._groups: List[GroupTraining] = []
         
         self._message: SignUpMessage = SignUpMessage(self)
+        self._qual_index: QualificationIndex = QualificationIndex()
+        self._ranker: TrainerRanker = TrainerRanker(self)
 
 ################################################################################
     async def _load_all(self, data: Dict[str, Any]) -> None:
@@ -86,6 +94,9 @@ class TrainingManager:
                 
             tuser = await TUser.load(self, user, record)
             self._tusers.append(tuser)
+            self._guild.ownership.track(tuser, tuser.user_id)
+            
+        self._qual_index.rebuild(self._tusers)
                 
         overrides = payload["overrides"]
         trainings = data["trainings"]
@@ -93,6 +104,7 @@ class TrainingManager:
             training = Training.load(self[t[2]], t, overrides.get(t[0], []))
             if training is not None:
                 self._trainings.append(training)
+                training.track_users()
                 
         await self._message.load(payload["signup_message"])
         
@@ -102,6 +114,7 @@ class TrainingManager:
         ]
         for g in self._groups:
             await g._update_post_components()
+            g.schedule_reminder(skip_past=True)
 
 ################################################################################
     @staticmethod    
@@ -184,6 +197,18 @@ class TrainingManager:
         
         return self._message
     
+################################################################################
+    @property
+    def qualification_index(self) -> QualificationIndex:
+        
+        return self._qual_index
+    
+################################################################################
+    @property
+    def ranker(self) -> TrainerRanker:
+        
+        return self._ranker
+    
 ################################################################################
     @property
     def groups(self) -> List[GroupTraining]:
@@ -241,6 +266,7 @@ class TrainingManager:
 
         tuser = TUser.new(self, user)
         self._tusers.append(tuser)
+        self._guild.ownership.track(tuser, tuser.user_id)
         
         confirm = U.make_embed(
             title="User Added",
@@ -280,13 +306,15 @@ class TrainingManager:
         )
 
         self._trainings.append(training)
+        training.track_users()
+        self._ranker.invalidate()
+        RenderCache.invalidate(training.trainee)
         
         await self._message.update_components()
         await self._guild.log.training_signup(training)
 
-        for t in self.get_qualified_trainers(training.position.id):
-            if t.accepting_trainee_pings():
-                await t.notify_of_training_signup(training)
+        for t in self._qual_index.notifiable(training.position.id):
+            await t.notify_of_training_signup(training)
         
 ################################################################################ 
     @staticmethod
@@ -306,7 +334,7 @@ class TrainingManager:
 ################################################################################
     def get_qualified_trainers(self, position_id: str) -> List[TUser]:
         
-        return [t for t in self._tusers if t.is_qualified(position_id)]
+        return self._qual_index.qualified(position_id)
 
 ################################################################################
     async def remove_training(self, training_id: str) -> None:
@@ -517,32 +545,7 @@ class TrainingManager:
         tags: List[VenueForumTag]
     ) -> List[Tuple[str, float]]:
 
-        venue_scores = {}
-    
-        for venue in self.guild.venue_manager.venues:
-            if venue.post_url is None or venue.rp_level is None:
-                continue
-                
-            score = 0
-            
-            rp_score = 50 - 10 * abs(rp_level.value - venue.rp_level.value)
-            score += rp_score
-            
-            if nsfw_pref == venue.nsfw:
-                score += 30
-                
-            matching_tags = set(
-                [t.proper_name.lower() for t in tags]).intersection(
-                set([v.tag_text.lower() for v in venue.tags])
-            )
-            tag_score = (len(matching_tags) / len(tags)) * 20 if tags else 0
-            score += tag_score
-    
-            venue_scores[venue.id] = score
-    
-        # Sort venues by score, if more than 5, then slice the first 5
-        max_results = 5 if len(venue_scores) >= 5 else len(venue_scores)    
-        return sorted(venue_scores.items(), key=lambda x: x[1], reverse=True)[:max_results]
+        return self.guild.venue_manager.match_index.top(rp_level, nsfw_pref, tags)
     
 ################################################################################
     @staticmethod
@@ -565,6 +568,7 @@ class TrainingManager:
         if tuser is None:
             tuser = TUser.new(self, interaction.user)
             self._tusers.append(tuser)
+            self._guild.ownership.track(tuser, tuser.user_id)
 
         await tuser.start_bg_check(interaction)
 
@@ -683,6 +687,60 @@ class TrainingManager:
         frogginator = Frogginator(pages=pages)
         await frogginator.respond(interaction)
 
+################################################################################
+    async def recommendation_report(self, interaction: Interaction) -> None:
+        
+        log.info("Training", "Requesting trainer recommendation report.")
+        
+        rankings = self._ranker.rank_all()
+        
+        embed = U.make_embed(
+            title="Trainer Recommendation Report",
+            description=(
+                "Best-fit trainers for each unmatched training, ranked by\n"
+                "data center overlap, common availability and workload.\n"
+                f"{U.draw_line(extra=27)}\n"
+            )
+        )
+        
+        pages = []
+        fields = []
+        
+        if not rankings:
+            embed.description += "`No unmatched trainings found.`"
+            pages.append(Page(embeds=[embed]))
+            
+        for training_id, ranked in rankings.items():
+            training = self.get_training(training_id)
+            if not ranked:
+                value = "`No qualified trainers available.`"
+            else:
+                value = "\n".join(
+                    f"{i}. `{trainer.name}` - **{score}** "
+                    f"*({minutes // 60}h common, {open_count} open)*"
+                    for i, (trainer, score, minutes, open_count) in enumerate(ranked, start=1)
+                )
+                
+            fields.append(
+                EmbedField(
+                    name=f"__{training.trainee.name}__ - {training.position.name}",
+                    value=value,
+                    inline=False
+                )
+            )
+            if len(fields) >= 5:
+                embed_copy = embed.copy()
+                embed_copy.fields = fields
+                pages.append(Page(embeds=[embed_copy]))
+                fields = []
+                
+        if fields:
+            embed.fields = fields
+            pages.append(Page(embeds=[embed]))
+        
+        frogginator = Frogginator(pages=pages)
+        await frogginator.respond(interaction)
+
 ################################################################################
     async def staff_experience(self, interaction: Interaction, user: User) -> None:
         
@@ -746,12 +804,29 @@ class TrainingManager:
 ################################################################################
     async def on_member_leave(self, member: Member) -> Tuple[int, int]:
 
-        tuser = self[member.id]
+        ownership = self._guild.ownership
+        
+        for signup in ownership.owned(member.id, GroupTrainingSignup):
+            if signup.user is not None and signup.user.user_id == member.id:
+                signup.delete()
+        
+        tuser = next(
+            (t for t in ownership.owned(member.id, TUser) if t.user_id == member.id),
+            None
+        )
         if tuser is None:
             return 0, 0
         
         return await tuser.on_server_leave()
 
+################################################################################
+    def on_member_join(self, member: Member) -> None:
+
+        # Put a returning trainer back where on_server_leave took them out.
+        tuser = self[member.id]
+        if tuser is not None:
+            self._qual_index.update_user(tuser)
+
 ################################################################################
     async def group_training_menu(self, interaction: Interaction) -> None:
         
@@ -6,7 +6,7 @@ from discord import Embed
 from discord import EmbedField
 
 from Assets import BotEmojis
-from Utilities import Utilities as U, log
+from Utilities import Utilities as U, log, RenderCache
 
 if TYPE_CHECKING:
     from Classes import TUser
@@ -97,5 +97,6 @@ class UserConfiguration:
     def update(self) -> None:
 
         self._parent.bot.database.update.tuser_config(self)
+        RenderCache.invalidate(self._parent)
 
 ################################################################################
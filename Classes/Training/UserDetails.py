@@ -6,7 +6,7 @@ from discord import Interaction
 
 from UI.Common import YesNoView
 from UI.Training import TUserNameModal, TUserNotesModal, DataCenterSelectView
-from Utilities import Utilities as U, GlobalDataCenter, log
+from Utilities import Utilities as U, GlobalDataCenter, log, RenderCache
 
 if TYPE_CHECKING:
     from Classes import TUser, StaffPartyBot
@@ -127,6 +127,7 @@ class UserDetails:
     def update(self) -> None:
         
         self.bot.database.update.tuser_details(self)
+        RenderCache.invalidate(self._parent)
         
 ################################################################################
     async def set_name(self, interaction: Interaction) -> None:
@@ -6,8 +6,10 @@ if TYPE_CHECKING:
     from .GroupTraining import GroupTraining
     from .GroupTrainingSignup import GroupTrainingSignup
     from .Qualification import Qualification
+    from .QualificationIndex import QualificationIndex
     from .SignUpMessage import SignUpMessage
     from .TAvailability import TAvailability
+    from .TrainerRanker import TrainerRanker
     from .Training import Training
     from .TrainingManager import TrainingManager
     from .TUser import TUser
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+import os
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional
+
+import aiohttp
+from dotenv import load_dotenv
+
+from Utilities import log
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = (
+    "UrlShortener",
+    "ShortenerBackend",
+    "CuttlyBackend",
+    "LocalBackend",
+)
+
+################################################################################
+class ShortenerBackend(ABC):
+    """Turns a long URL into a short one, or returns None if it can't."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def shorten(self, long_url: str) -> Optional[str]:
+
+        raise NotImplementedError
+
+    async def close(self) -> None:
+
+        pass
+
+################################################################################
+class CuttlyBackend(ShortenerBackend):
+
+    __slots__ = (
+        "_key",
+        "_session",
+    )
+
+    URL = "https://cutt.ly/api/api.php"
+    OK = 7
+
+################################################################################
+    def __init__(self, api_key: str) -> None:
+
+        self._key: str = api_key
+        self._session: Optional[aiohttp.ClientSession] = None
+
+################################################################################
+    async def shorten(self, long_url: str) -> Optional[str]:
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+
+        async with self._session.get(self.URL, params={"key": self._key, "short": long_url}) as r:
+            data = await r.json(content_type=None)
+
+        result = data.get("url", {})
+        return result.get("shortLink") if result.get("status") == self.OK else None
+
+################################################################################
+    async def close(self) -> None:
+
+        if self._session is not None:
+            await self._session.close()
+
+################################################################################
+class LocalBackend(ShortenerBackend):
+    """Deterministic, offline stand-in for local runs and benchmarks."""
+
+    __slots__ = ("_base",)
+
+    def __init__(self, base: str = "https://short.local") -> None:
+
+        self._base: str = base
+
+    async def shorten(self, long_url: str) -> Optional[str]:
+
+        return f"{self._base}/{hashlib.sha256(long_url.encode()).hexdigest()[:8]}"
+
+################################################################################
+class UrlShortener:
+    """Shortens URLs without ever holding up the caller for long.
+
+    Lookups go LRU -> ``short_urls`` table -> backend, and whatever the
+    backend returns is written back to both. Simultaneous requests for the
+    same URL share one backend call. If the backend is slow (past
+    ``TIMEOUT``) or failing, the long URL is handed back unchanged and the
+    backend is left alone for ``BACKOFF`` seconds, so a cutt.ly outage costs
+    one timeout rather than one per call.
+
+    The backend is cutt.ly when ``CUTTLY_API_KEY`` is set, or the local
+    stand-in when ``URL_SHORTENER=local``. With neither, URLs are returned
+    as they are.
+    """
+
+    __slots__ = (
+        "_state",
+        "_backend",
+        "_cache",
+        "_inflight",
+        "_disabled_until",
+    )
+
+    MAX_CACHED = 1024
+    TIMEOUT = 3.0  # seconds
+    BACKOFF = 60.0  # seconds
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot, backend: Optional[ShortenerBackend] = None):
+
+        self._state: StaffPartyBot = bot
+        self._backend: Optional[ShortenerBackend] = backend or self._default_backend()
+
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._disabled_until: float = 0.0
+
+################################################################################
+    @staticmethod
+    def _default_backend() -> Optional[ShortenerBackend]:
+
+        load_dotenv()
+        if os.getenv("URL_SHORTENER") == "local":
+            return LocalBackend()
+        if key := os.getenv("CUTTLY_API_KEY"):
+            return CuttlyBackend(key)
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    @property
+    def backend(self) -> Optional[ShortenerBackend]:
+
+        return self._backend
+
+################################################################################
+    async def shorten(self, long_url: str) -> str:
+        """Returns the short URL, or ``long_url`` itself if none could be had."""
+
+        if self._backend is None:
+            return long_url
+
+        if short := self._cache.get(long_url):
+            self._cache.move_to_end(long_url)
+            return short
+
+        if short := self.bot.database._lookup_short_url(long_url):
+            self._remember(long_url, short)
+            return short
+
+        if pending := self._inflight.get(long_url):
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[long_url] = future
+        try:
+            short = await self._fetch(long_url)
+        except BaseException:
+            # Cancelled - don't leave anyone waiting on us forever.
+            future.cancel()
+            raise
+        else:
+            future.set_result(short)
+            return short
+        finally:
+            del self._inflight[long_url]
+
+################################################################################
+    async def _fetch(self, long_url: str) -> str:
+
+        if time.monotonic() < self._disabled_until:
+            return long_url
+
+        try:
+            short = await asyncio.wait_for(self._backend.shorten(long_url), self.TIMEOUT)
+        except Exception as ex:
+            self._disabled_until = time.monotonic() + self.BACKOFF
+            log.warning(
+                "Core",
+                f"URL shortener unavailable ({type(ex).__name__}: {ex}), "
+                f"using long URLs for {self.BACKOFF:.0f}s."
+            )
+            return long_url
+
+        if not short:
+            log.warning("Core", f"URL shortener declined to shorten {long_url}.")
+            return long_url
+
+        self._remember(long_url, short)
+        self.bot.database.insert.short_url(long_url, short)
+
+        return short
+
+################################################################################
+    def _remember(self, long_url: str, short_url: str) -> None:
+
+        self._cache[long_url] = short_url
+        self._cache.move_to_end(long_url)
+        if len(self._cache) > self.MAX_CACHED:
+            self._cache.popitem(last=False)
+
+################################################################################
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional, Any, Dict, Type, TypeVar
 
 from discord import (
@@ -37,6 +38,7 @@ from Utilities import (
     VenueChannelNotSetError,
     VenueImportNotFoundError,
     VenueProfileNotCompleteError,
+    RenderCache,
 )
 from .VenueAtAGlance import VenueAtAGlance
 from .VenueHours import VenueHours
@@ -45,7 +47,9 @@ from .VenueTag import VenueTag
 from .VenueURLs import VenueURLs
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot, VenueManager, Position, GuildData, XIVVenue
+    from Classes import (
+        StaffPartyBot, VenueManager, Position, GuildData, XIVVenue, XIVScheduleComponent
+    )
 ################################################################################
 
 __all__ = ("Venue",)
@@ -73,6 +77,9 @@ class Venue:
         "_mare_pass",
         "_mutes",
         "_xiv_id",
+        "_xiv_modified",
+        # RenderCache only holds weak references
+        "__weakref__",
     )
 
 ################################################################################
@@ -81,6 +88,7 @@ class Venue:
         self._mgr: VenueManager = mgr
         self._id: str = venue_id
         self._xiv_id: Optional[str] = kwargs.get("xiv_id", None)
+        self._xiv_modified: Optional[datetime] = None
         
         self._name: str = name
         self._description: List[str] = kwargs.get("description", [])
@@ -130,6 +138,7 @@ class Venue:
         self._mgr = mgr
         self._id = venue[0]
         self._xiv_id = venue[12]
+        self._xiv_modified = venue[30]
 
         self._name = venue[6]
         self._description = venue[7]
@@ -191,6 +200,12 @@ class Venue:
         
         return self._mgr.bot
     
+################################################################################
+    @property
+    def manager(self) -> VenueManager:
+        
+        return self._mgr
+    
 ################################################################################
     @property
     def guild(self) -> GuildData:
@@ -435,6 +450,7 @@ class Venue:
         ])
     
 ################################################################################
+    @RenderCache.cached
     def status(self, post: bool = False) -> Embed:
 
         fields = [
@@ -599,6 +615,8 @@ class Venue:
     def update(self) -> None:
         
         self.bot.database.update.venue(self)
+        RenderCache.invalidate(self)
+        self.guild.ownership.track(self, *[u.id for u in self._users])
         
 ################################################################################
     async def delete(self) -> None:
@@ -622,12 +640,17 @@ class Venue:
         await self.guild.jobs_manager.delete_all_by_venue(self)
         
         self._mgr._venues.remove(self)
+        self._mgr.match_index.remove(self.id)
+        self.guild.ownership.forget(self)
         self.bot.database.delete.venue(self)
+        RenderCache.invalidate(self)
         
         log.info("Venues", f"Venue {self.name} ({self.id}) has been deleted.")
         
 ################################################################################
-    async def update_from_xiv_venue(self, interaction: Interaction, venue: Optional[XIVVenue] = None) -> None:
+    async def update_from_xiv_venue(self, interaction: Optional[Interaction], venue: Optional[XIVVenue] = None) -> bool:
+        """Syncs this venue to its FFXIV Venues record, only writing the parts
+        that differ. Returns True if anything changed."""
         
         log.info(
             "Venues",
@@ -647,37 +670,96 @@ class Venue:
                 )
                 error = VenueImportNotFoundError()
                 await interaction.respond(embed=error, ephemeral=True)
-                return
+                return False
             venue = results[0]
 
-        self._xiv_id = venue.id
-        self._name: str = venue.name
-        self._description: List[str] = venue.description.copy() if venue.description else []
-
-        self._mare_id: Optional[str] = venue.mare_id
-        self._mare_pass: Optional[str] = venue.mare_pass
-        self._hiring: bool = venue.hiring
-        self._pending: bool = False
-
-        self._location.update_from_xiv_venue(venue.location)
-        self._aag.update_from_xiv_venue(venue)
-        self._urls.update_from_xiv_venue(venue)
-
-        self._users: List[User] = [
-            await self.guild.get_or_fetch_user(user_id) 
-            for user_id in venue.managers
-        ]
+        changed = False
         
+        # Sub-sections write themselves, and only if they differ.
+        changed |= self._location.update_from_xiv_venue(venue.location)
+        changed |= self._aag.update_from_xiv_venue(venue)
+        changed |= self._urls.update_from_xiv_venue(venue)
+        
+        changed |= self._sync_schedule(venue.schedule)
+        
+        description = venue.description.copy() if venue.description else []
+        values = (
+            venue.id, venue.name, description, venue.mare_id, venue.mare_pass, 
+            venue.hiring, False, venue.modified
+        )
+        current = (
+            self._xiv_id, self._name, self._description, self._mare_id, 
+            self._mare_pass, self._hiring, self._pending, self._xiv_modified
+        )
+        users_changed = venue.managers != [u.id for u in self._users]
+        
+        if values != current or users_changed:
+            (
+                self._xiv_id, self._name, self._description, self._mare_id,
+                self._mare_pass, self._hiring, self._pending, self._xiv_modified
+            ) = values
+            
+            if users_changed:
+                self._users = [
+                    await self.guild.get_or_fetch_user(user_id) 
+                    for user_id in venue.managers
+                ]
+            
+            self.update()
+            changed = True
+        
+        if changed:
+            log.info("Venues", f"Venue {self.name} ({self.id}) has been updated.")
+        else:
+            log.debug("Venues", f"Venue {self.name} ({self.id}) is already up to date.")
+            
+        return changed
+    
+################################################################################
+    def _sync_schedule(self, schedule: List[XIVScheduleComponent]) -> bool:
+        
+        # Hours are stored one row per weekday, so diff by day: drop days that
+        # are gone, adjust days whose times moved and insert the new ones.
+        incoming = {}
+        for h in schedule:
+            hours = VenueHours.from_xiv_schedule_values(h)
+            incoming[hours[0]] = hours
+        
+        changed = False
+        kept = []
         for s in self._schedule:
-            s.delete()
-        self._schedule = [
-            VenueHours.from_xiv_schedule(self, h) 
-            for h in venue.schedule
-        ]
+            target = incoming.pop(s.day, None)
+            if target is None:
+                s.delete()
+                changed = True
+                continue
+            
+            _, open_time, close_time = target
+            if (s.open_time.hour, s.open_time.minute, s.close_time.hour, s.close_time.minute) != (
+                open_time.hour, open_time.minute, close_time.hour, close_time.minute
+            ):
+                s.set_times(open_time, close_time)
+                changed = True
+            kept.append(s)
+            
+        for day, open_time, close_time in incoming.values():
+            kept.append(VenueHours.new(self, day, open_time, close_time))
+            changed = True
         
-        self.update()
+        self._schedule = kept
+        return changed
+    
+################################################################################
+    def is_current(self, venue: XIVVenue) -> bool:
+        """True if we've already synced this (or a later) revision of the
+        FFXIV Venues record."""
         
-        log.info("Venues", f"Venue {self.name} ({self.id}) has been updated.")
+        return (
+            self._xiv_id == venue.id
+            and self._xiv_modified is not None
+            and venue.modified is not None
+            and U.compare_datetimes(venue.modified, self._xiv_modified) != 1
+        )
     
 ################################################################################
     async def approve(self, interaction: Interaction) -> None:
@@ -959,22 +1041,25 @@ class Venue:
             await interaction.respond(embed=error, ephemeral=True)
             return
         
-        # Find threads with a matching name
-        target_threads = [t for t in channel.threads if t.name.lower() == self.name.lower()]
-        thread = target_threads[0] if target_threads else None
+        thread_index = self._mgr.guild.thread_index
+        thread = await thread_index.get(channel, self.name)
         
         # Prepare the persistent view
         view = VenuePostingMuteView(self)
-        self.bot.add_view(view)
     
-        # If there's a thread, update it and clear bot messages if _post_msg is None
+        # If there's a thread, update it and pick its post back up if we lost track of it
         if thread:
-            await thread.edit(name=self.name, applied_tags=self.thread_tags)
-            # If _post_msg is None, assume we might need to clear old messages from the bot
-            if self._post_msg is None:
-                async for msg in thread.history():
-                    if msg.author == self.bot.user:
-                        await msg.delete()
+            try:
+                await thread.edit(name=self.name, applied_tags=self.thread_tags, archived=False)
+            except NotFound:
+                thread_index.discard(channel.id, thread.id)
+                thread = None
+            else:
+                if self._post_msg is None:
+                    try:
+                        self._post_msg = await thread_index.starter_message(thread).fetch()
+                    except NotFound:
+                        pass
     
         # Attempt to edit the existing message if it exists
         if self._post_msg is not None:
@@ -982,6 +1067,7 @@ class Venue:
                 await self._post_msg.edit(embed=self.status(post=True), view=view)
             except NotFound:
                 self._post_msg = None  # Reset if the message was not found
+                RenderCache.invalidate(self)
             except Exception as ex:
                 log.critical(
                     "Venues",
@@ -993,15 +1079,20 @@ class Venue:
     
         # If no existing message or thread, create or post as necessary
         if not self._post_msg:
-            if not thread:
+            if thread:
+                # The thread's starter message is gone - post a fresh one
+                await thread.send(embed=self.status(post=True), view=view)
+            else:
                 # If no existing thread, create a new one
                 thread = await channel.create_thread(
                     name=self.name, embed=self.status(post=True),
                     applied_tags=self.thread_tags, view=view
                 )
+                thread_index.add(thread)
             # Grab the message we just posted
             try:
                 self._post_msg = await thread.fetch_message(thread.last_message_id)
+                RenderCache.invalidate(self)
             except NotFound:
                 self._post_msg = None
                 self.update()
@@ -1122,7 +1213,6 @@ class Venue:
         )
 
         view = VenuePostingMuteView(self)
-        self.bot.add_view(view, message_id=self._post_msg.id)
 
         try:
             await self._post_msg.edit(view=view)
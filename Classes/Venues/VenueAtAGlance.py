@@ -10,6 +10,7 @@ from Utilities import (
     RPLevel,
     VenueForumTag,
     log,
+    RenderCache,
 )
 from .VenueTag import VenueTag
 
@@ -79,6 +80,8 @@ class VenueAtAGlance:
     def update(self) -> None:
         
         self.bot.database.update.venue_aag(self)
+        self._parent.manager.match_index.refresh(self._parent)
+        RenderCache.invalidate(self._parent)
         
 ################################################################################
     @property
@@ -183,15 +186,21 @@ class VenueAtAGlance:
         )
         
 ################################################################################
-    def update_from_xiv_venue(self, venue: XIVVenue) -> None:
+    def update_from_xiv_venue(self, venue: XIVVenue) -> bool:
+        """Returns True if anything changed (and was written)."""
         
-        self._nsfw = not venue.sfw
-        self._tags = [
-            VenueTag(t) for t in venue.tags
-            if t.lower() in [tag.proper_name.lower() for tag in VenueForumTag]
-        ]
+        valid_tags = {tag.proper_name.lower() for tag in VenueForumTag}
+        nsfw = not venue.sfw
+        tags = [t for t in venue.tags if t.lower() in valid_tags]
+        
+        if nsfw == self._nsfw and tags == [t.tag_text for t in self._tags]:
+            return False
+        
+        self._nsfw = nsfw
+        self._tags = [VenueTag(t) for t in tags]
         
         self.update()
+        return True
 
 ################################################################################
     async def set_tags(self, interaction: Interaction) -> None:
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import pytz
 from datetime import time
-from typing import TYPE_CHECKING, TypeVar, Any, Tuple, Type
+from typing import TYPE_CHECKING, TypeVar, Any, Tuple, Type, Optional
 
-from Utilities import Utilities as U, Weekday
+from Classes.Common import WeeklySchedule
+from Utilities import Utilities as U, Weekday, RenderCache
 
 if TYPE_CHECKING:
     from Classes import Venue, XIVScheduleComponent
@@ -22,6 +23,7 @@ class VenueHours:
         "_day",
         "_open",
         "_close",
+        "_schedule",
     )
 
 ################################################################################
@@ -32,12 +34,15 @@ class VenueHours:
         self._day: Weekday = kwargs.pop("day")
         self._open: time = kwargs.pop("open")
         self._close: time = kwargs.pop("close")
+        
+        self._schedule: Optional[WeeklySchedule] = None
     
 ################################################################################
     @classmethod
     def new(cls: Type[VH], parent: Venue, day: Weekday, open_time: time, close_time: time) -> VH:
         
         parent.bot.database.insert.venue_hours(parent, day, open_time, close_time)
+        RenderCache.invalidate(parent)
         return cls(parent, day=day, open=open_time, close=close_time)
     
 ################################################################################
@@ -55,11 +60,17 @@ class VenueHours:
     @classmethod
     def from_xiv_schedule(cls: Type[VH], parent: Venue, xiv: XIVScheduleComponent) -> VH:
    
+        return VenueHours.new(parent, *cls.from_xiv_schedule_values(xiv))
+    
+################################################################################
+    @staticmethod
+    def from_xiv_schedule_values(xiv: XIVScheduleComponent) -> Tuple[Weekday, time, time]:
+        
         day = Weekday(xiv.day)
         open_time = time(hour=xiv.utc.start.hour, minute=xiv.utc.start.minute, tzinfo=pytz.utc)
         close_time = time(hour=xiv.utc.end.hour, minute=xiv.utc.end.minute, tzinfo=pytz.utc)
         
-        return VenueHours.new(parent, day, open_time, close_time)
+        return day, open_time, close_time
     
 ################################################################################
     @property
@@ -85,6 +96,15 @@ class VenueHours:
         
         return self._close
     
+################################################################################
+    @property
+    def schedule(self) -> WeeklySchedule:
+        
+        if self._schedule is None:
+            self._schedule = WeeklySchedule.from_range(self._day.value, self._open, self._close)
+            
+        return self._schedule
+    
 ################################################################################
     @property
     def open_ts(self) -> str: 
@@ -97,15 +117,26 @@ class VenueHours:
         
         return U.format_dt(U.time_to_datetime(self.close_time), "t")
     
+################################################################################
+    def set_times(self, open_time: time, close_time: time) -> None:
+        
+        self._open = open_time
+        self._close = close_time
+        self._schedule = None
+        
+        self.update()
+        
 ################################################################################
     def update(self) -> None:
         
         self._parent.bot.database.update.venue_hours(self)
+        RenderCache.invalidate(self._parent)
         
 ################################################################################
     def delete(self) -> None:
         
         self._parent.bot.database.delete.venue_hours(self)
+        RenderCache.invalidate(self._parent)
 
 ################################################################################
     def format(self) -> str:
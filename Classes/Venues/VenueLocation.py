@@ -18,6 +18,7 @@ from Utilities import (
     GameWorld,
     HousingZone,
     InvalidLocationValueError,
+    RenderCache,
 )
 
 if TYPE_CHECKING:
@@ -185,6 +186,7 @@ class VenueLocation:
     def update(self) -> None:
         
         self.bot.database.update.venue_location(self)
+        RenderCache.invalidate(self._parent)
 
 ################################################################################
     def format(self) -> str:
@@ -214,18 +216,33 @@ class VenueLocation:
         return ret
 
 ################################################################################
-    def update_from_xiv_venue(self, xiv: XIVLocation) -> None:
+    def update_from_xiv_venue(self, xiv: XIVLocation) -> bool:
+        """Returns True if anything changed (and was written)."""
+        
+        values = (
+            DataCenter.from_xiv(xiv.data_center),
+            GameWorld.from_xiv(xiv.world),
+            HousingZone.from_xiv(xiv.district),
+            xiv.ward,
+            xiv.plot,
+            xiv.apartment if xiv.apartment != 0 else None,
+            xiv.room if xiv.room != 0 else None,
+            xiv.subdivision,
+        )
+        current = (
+            self._dc, self._world, self._zone, self._ward, self._plot,
+            self._apartment, self._room, self._subdivision,
+        )
+        if values == current:
+            return False
         
-        self._dc = DataCenter.from_xiv(xiv.data_center)
-        self._world = GameWorld.from_xiv(xiv.world)
-        self._zone = HousingZone.from_xiv(xiv.district)
-        self._ward = xiv.ward
-        self._plot = xiv.plot
-        self._apartment = xiv.apartment if xiv.apartment != 0 else None
-        self._room = xiv.room if xiv.room != 0 else None
-        self._subdivision = xiv.subdivision
+        (
+            self._dc, self._world, self._zone, self._ward, self._plot,
+            self._apartment, self._room, self._subdivision,
+        ) = values
         
         self.update()
+        return True
 
 ################################################################################
     def status(self) -> Embed:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Any, Dict, Optional
+import asyncio
+from typing import TYPE_CHECKING, List, Any, Dict, Optional, Tuple
 
 from discord import Interaction, User, ForumChannel, Member, File
 from discord.ext.pages import Page, PageGroup
@@ -19,10 +20,11 @@ from Utilities import (
     VenueImportError,
 )
 from .Venue import Venue
+from .VenueMatchIndex import VenueMatchIndex
 from .VenueTag import VenueTag
 
 if TYPE_CHECKING:
-    from Classes import GuildData, StaffPartyBot
+    from Classes import GuildData, StaffPartyBot, XIVVenue
 ################################################################################
 
 __all__ = ("VenueManager",)
@@ -34,6 +36,7 @@ class VenueManager:
         "_guild",
         "_venues",
         "_tags",
+        "_match_index",
         "__etiquette_file",
     )
     
@@ -45,6 +48,9 @@ class VenueManager:
         "https://canary.discord.com/channels/955933227372122173/"
         "957656105092272208/1244338542029832333"
     )
+    
+    # Concurrent post edits during an incremental sync.
+    POST_CONCURRENCY = 5
 
 ################################################################################
     def __init__(self, guild: GuildData) -> None:
@@ -53,13 +59,16 @@ class VenueManager:
         
         self._venues: List[Venue] = []
         self._tags: List[VenueTag] = []
+        self._match_index: VenueMatchIndex = VenueMatchIndex(self)
         self.__etiquette_file: Optional[File] = None
         
 ################################################################################
     async def _load_all(self, data: Dict[str, Any]) -> None:
 
         for vdata in data["venues"]:
-            self._venues.append(await Venue.load(self, vdata))
+            venue = await Venue.load(self, vdata)
+            self._venues.append(venue)
+            self.guild.ownership.track(venue, *[u.id for u in venue.authorized_users])
             
         for venue in self._venues:
             await venue._update_post_components()
@@ -95,6 +104,12 @@ class VenueManager:
         
         return self.guild.channel_manager.venues_channel
     
+################################################################################
+    @property
+    def match_index(self) -> VenueMatchIndex:
+        
+        return self._match_index
+    
 ################################################################################
     @property
     def venues(self) -> List[Venue]:
@@ -706,15 +721,17 @@ class VenueManager:
     async def on_member_leave(self, member: Member) -> bool:
         """Returns True if a venue was deleted as a result of the member leaving."""
         
-        for v in self.venues:
-            if member in v.authorized_users:
-                if len(v.authorized_users) == 1:
-                    await v.delete()
-                    return True
-                else:
-                    v.remove_user(member._user)
+        deleted = False
+        for v in self.guild.ownership.owned(member.id, Venue):
+            if not any(u.id == member.id for u in v.authorized_users):
+                continue
+            if len(v.authorized_users) == 1:
+                await v.delete()
+                deleted = True
+            else:
+                v.remove_user(member._user)
         
-        return False
+        return deleted
 
 ################################################################################
     async def venue_etiquette(self, interaction: Interaction) -> None:
@@ -774,46 +791,112 @@ class VenueManager:
             log.debug("Venues", "User cancelled bulk update.")
             return
         
-        msg = await interaction.followup.send("Please wait...")
-        payload = await self.bot.veni_client.get_all_venues()
+        await self.bot.bulk_jobs.start(interaction, self.guild, "venues")
         
-        payload_ids = [v.id for v in payload]
-        venue_ids = { v.id: v._xiv_id for v in self.venues }
+################################################################################
+    def bulk_targets(self) -> List[str]:
         
-        for _id, venue_id in venue_ids.items():
-            if venue_id not in payload_ids:
-                log.info(
-                    "Venues",
-                    f"Venue {venue_id} not found in bulk payload. Deleting..."
-                )
-                if venue := self[_id]:
-                    await venue.delete()
+        return [v.id for v in self._venues]
+    
+################################################################################
+    async def bulk_prepare(self) -> Tuple[Dict[str, XIVVenue], Dict[str, XIVVenue]]:
         
-        count = 0
-        for venue in self.venues:
-            for vdata in payload:
-                if venue.name.lower() == vdata.name.lower():
-                    await venue.update_from_xiv_venue(interaction, vdata)
-                    await venue._update_post_components()
-                    count += 1
-                    break
+        # Fetched again on resume - it's one request, and may have changed.
+        return self._index_payload(await self.bot.veni_client.get_all_venues())
+    
+################################################################################
+    async def bulk_apply(
+        self, venue_id: str, payload: Tuple[Dict[str, XIVVenue], Dict[str, XIVVenue]]
+    ) -> str:
         
-        await msg.delete()
+        venue = self[venue_id]
+        if venue is None:
+            return "gone"
         
-        confirm = U.make_embed(
-            title="Bulk Update Complete",
-            description=(
-                f"Successfully updated **[{count}]** venues.\n"
-                f"Deleted **[{len(venue_ids) - count}]** venues."
+        xiv = self._match_venue(venue, *payload)
+        if xiv is None:
+            log.info(
+                "Venues",
+                f"Venue {venue.name} ({venue._xiv_id}) not found in bulk payload. Deleting..."
             )
-        )
-        await interaction.respond(embed=confirm)
+            await venue.delete()
+            return "deleted"
+        
+        if not await venue.update_from_xiv_venue(None, xiv):
+            return "unchanged"
+        
+        await venue._update_post_components()
+        return "updated"
+        
+################################################################################
+    async def incremental_sync(self, payload: List[XIVVenue]) -> int:
+        """Applies FFXIV Venues changes to linked venues, skipping any whose
+        record hasn't been modified since we last saw it. Unlike
+        ``bulk_update`` this never deletes anything. Returns the number of
+        venues updated."""
+        
+        matched, _ = self._match_payload(payload)
+        
+        changed = []
+        for venue, xiv in matched:
+            # Only venues that were imported are kept in sync automatically.
+            if venue._xiv_id is None or venue.is_current(xiv):
+                continue
+            if await venue.update_from_xiv_venue(None, xiv):
+                changed.append(venue)
+                
+        await self._refresh_posts(changed)
         
         log.info(
             "Venues",
-            f"Bulk update completed. [{count}] venues updated, "
-            f"[{len(venue_ids) - count}] venues deleted."
+            f"Incremental sync complete. [{len(changed)}] of [{len(matched)}] linked venues updated."
         )
         
+        return len(changed)
+    
+################################################################################
+    def _match_payload(
+        self, payload: List[XIVVenue]
+    ) -> Tuple[List[Tuple[Venue, XIVVenue]], List[Venue]]:
+        
+        by_id, by_name = self._index_payload(payload)
+        
+        matched = []
+        unmatched = []
+        for venue in self.venues:
+            xiv = self._match_venue(venue, by_id, by_name)
+            if xiv is None:
+                unmatched.append(venue)
+            else:
+                matched.append((venue, xiv))
+                
+        return matched, unmatched
+    
+################################################################################
+    @staticmethod
+    def _index_payload(payload: List[XIVVenue]) -> Tuple[Dict[str, XIVVenue], Dict[str, XIVVenue]]:
+        
+        return {v.id: v for v in payload}, {v.name.lower(): v for v in payload}
+    
+################################################################################
+    @staticmethod
+    def _match_venue(
+        venue: Venue, by_id: Dict[str, XIVVenue], by_name: Dict[str, XIVVenue]
+    ) -> Optional[XIVVenue]:
+        
+        # Hash join on the FFXIV Venues ID, falling back to the name for
+        # venues that were never linked to (or have lost) their record.
+        return by_id.get(venue._xiv_id) or by_name.get(venue.name.lower())
+    
+################################################################################
+    async def _refresh_posts(self, venues: List[Venue]) -> None:
+        
+        semaphore = asyncio.Semaphore(self.POST_CONCURRENCY)
+        
+        async def refresh(v: Venue) -> None:
+            async with semaphore:
+                await v._update_post_components()
+        
+        await asyncio.gather(*(refresh(v) for v in venues))
+        
 ################################################################################
-        
\ No newline at end of file
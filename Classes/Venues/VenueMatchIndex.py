@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from Utilities import NSFWPreference, RPLevel, VenueForumTag
+
+if TYPE_CHECKING:
+    from Classes import Venue, VenueManager
+################################################################################
+
+__all__ = ("VenueMatchIndex",)
+
+# Each forum tag gets its own bit so tag overlap becomes a single AND + popcount.
+TAG_BITS: Dict[str, int] = {
+    tag.proper_name.lower(): 1 << i
+    for i, tag in enumerate(VenueForumTag)
+}
+
+# (RP level value, NSFW flag, tag bitmask) - RP level and NSFW flag are None
+# if unset.
+VenueFeatures = Tuple[Optional[int], Optional[bool], int]
+
+################################################################################
+class VenueMatchIndex:
+    """Precomputed per-venue feature vectors for internship matching."""
+
+    __slots__ = (
+        "_mgr",
+        "_features",
+    )
+
+################################################################################
+    def __init__(self, mgr: VenueManager) -> None:
+
+        self._mgr: VenueManager = mgr
+        self._features: Dict[str, VenueFeatures] = {}
+
+################################################################################
+    @staticmethod
+    def tag_mask(tags: Iterable[str]) -> int:
+
+        mask = 0
+        for tag in tags:
+            mask |= TAG_BITS.get(tag.lower(), 0)
+
+        return mask
+
+################################################################################
+    def refresh(self, venue: Venue) -> VenueFeatures:
+
+        features = (
+            venue.rp_level.value if venue.rp_level is not None else None,
+            bool(venue.nsfw) if venue.nsfw is not None else None,
+            self.tag_mask(t.tag_text for t in venue.tags),
+        )
+        self._features[venue.id] = features
+
+        return features
+
+################################################################################
+    def remove(self, venue_id: str) -> None:
+
+        self._features.pop(venue_id, None)
+
+################################################################################
+    def top(
+        self,
+        rp_level: RPLevel,
+        nsfw_pref: NSFWPreference,
+        tags: List[VenueForumTag],
+        k: int = 5
+    ) -> List[Tuple[str, float]]:
+
+        want_nsfw = nsfw_pref is NSFWPreference.NSFW
+        query = self.tag_mask(t.proper_name for t in tags)
+        tag_weight = 20 / query.bit_count() if query else 0
+
+        def _scores():
+            for venue in self._mgr._venues:
+                if venue.post_url is None:
+                    continue
+
+                # Venues added since the last query are indexed lazily.
+                features = self._features.get(venue.id) or self.refresh(venue)
+                level, nsfw, mask = features
+                if level is None:
+                    continue
+
+                score = 50 - 10 * abs(rp_level.value - level)
+                # A venue that hasn't said either way doesn't count as a
+                # match for an SFW preference any more than an NSFW one.
+                if nsfw is not None and want_nsfw == nsfw:
+                    score += 30
+                score += (mask & query).bit_count() * tag_weight
+
+                yield venue.id, score
+
+        return heapq.nlargest(k, _scores(), key=lambda x: x[1])
+
+################################################################################
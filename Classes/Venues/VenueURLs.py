@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Optional, Type, TypeVar, Any, Dict
 from discord import Interaction, NotFound
 
 from UI.Venues import VenueDiscordURLModal, VenueWebsiteURLModal, VenueApplicationURLModal
-from Utilities import Utilities as U, FroggeColor, log
+from Utilities import Utilities as U, FroggeColor, log, RenderCache
 
 if TYPE_CHECKING:
     from Classes import Venue, StaffPartyBot, XIVVenue
@@ -84,15 +84,20 @@ class VenueURLs:
     def update(self) -> None:
         
         self.bot.database.update.venue_urls(self)
+        RenderCache.invalidate(self._parent)
 
 ################################################################################
-    def update_from_xiv_venue(self, venue: XIVVenue) -> None:
+    def update_from_xiv_venue(self, venue: XIVVenue) -> bool:
+        """Returns True if anything changed (and was written)."""
         
-        self._discord_url = venue.discord
-        self._website_url = venue.website
-        self._banner_url = venue.banner
+        values = (venue.discord, venue.website, venue.banner)
+        if values == (self._discord_url, self._website_url, self._banner_url):
+            return False
+        
+        self._discord_url, self._website_url, self._banner_url = values
         
         self.update()
+        return True
 
 ################################################################################
     async def set_discord_url(self, interaction: Interaction) -> None:
@@ -6,6 +6,7 @@ from .VenueAvailability import VenueAvailability
 from .VenueHours import VenueHours
 from .VenueLocation import VenueLocation
 from .VenueManager import VenueManager
+from .VenueMatchIndex import VenueMatchIndex
 from .VenueTag import VenueTag
 from .VenueURLs import VenueURLs
 ################################################################################
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-from flask import Flask, request, abort, url_for
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from typing import TYPE_CHECKING
+from aiohttp import web
+from dotenv import load_dotenv
+
+from Utilities import log, Metrics
+from .XIVVenues import XIVVenue
 
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
@@ -12,38 +22,199 @@ __all__ = ("FroggeHookManager", )
 
 ################################################################################
 class FroggeHookManager:
-    
+    """Receives FFXIV Venues change notifications over HTTP.
+
+    The server runs on the bot's own event loop (aiohttp ships with py-cord).
+    Each request must be signed: ``X-Frogge-Timestamp`` carries the send
+    time in epoch seconds and ``X-Frogge-Signature`` is ``sha256=`` plus the
+    hex HMAC-SHA256 of ``"<timestamp>." + body`` keyed with
+    ``WEBHOOK_SECRET``. Requests that are unsigned, badly signed or older than
+    ``MAX_SKEW`` seconds are rejected.
+
+    The body is a venue record in the FFXIV Venues API format, a list of
+    them, or ``{"venue": {...}}``. Accepted venues are queued by ID - a
+    venue changed twice before the queue is drained is only applied once,
+    with its latest revision - and a background task feeds them to each
+    guild's ``VenueManager.incremental_sync``.
+
+    Heroku only routes HTTP to the ``web`` process type, and only on the
+    ``PORT`` it assigns, so receiving webhooks there means running the bot
+    as ``web`` instead of ``worker`` - see the README.
+    """
+
     __slots__ = (
         "_state",
-        "__app__",
+        "_secret",
+        "_port",
+        "_runner",
+        "_worker",
+        "_pending",
+        "_wakeup",
+        "_last_event",
     )
-    
+
+    DEFAULT_PORT = 5000
+    MAX_SKEW = 300  # seconds
+
+    SIGNATURE_HEADER = "X-Frogge-Signature"
+    TIMESTAMP_HEADER = "X-Frogge-Timestamp"
+
 ################################################################################
     def __init__(self, bot: StaffPartyBot):
 
         self._state: StaffPartyBot = bot
-        
-        self.__app__: Flask = Flask(__name__)
-        self.add_routes()
-
-################################################################################
-    def get_app(self) -> Flask:
-        
-        return self.__app__
-    
-################################################################################
-    def add_routes(self):
-        @self.__app__.route("/", methods=["POST"])
-        def home():
-            print(request.data)
-            return "success"
-    
-################################################################################
-    def run(self):
-        
-        with self.__app__.test_request_context():
-            print(url_for('home', _external=True))
-        self.__app__.run(debug=True, port=5000)
-        
-################################################################################
-        
\ No newline at end of file
+
+        load_dotenv()
+        self._secret: Optional[bytes] = (
+            os.getenv("WEBHOOK_SECRET").encode() if os.getenv("WEBHOOK_SECRET") else None
+        )
+        self._port: int = int(os.getenv("WEBHOOK_PORT") or os.getenv("PORT") or self.DEFAULT_PORT)
+
+        self._runner: Optional[web.AppRunner] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # FFXIV Venues ID -> latest revision we've been sent
+        self._pending: Dict[str, XIVVenue] = {}
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._last_event: Optional[float] = None
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    @property
+    def running(self) -> bool:
+
+        return self._runner is not None
+
+################################################################################
+    @property
+    def last_event(self) -> Optional[float]:
+
+        return self._last_event
+
+################################################################################
+    async def start(self) -> None:
+
+        if self.running:
+            return
+
+        if self._secret is None:
+            log.warning("Webhooks", "WEBHOOK_SECRET is not set - not receiving webhooks.")
+            return
+
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        app.router.add_post("/venues", self._handle)
+
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, "0.0.0.0", self._port).start()
+        except OSError as ex:
+            # Most likely the port is taken or not ours to bind (e.g. a
+            # Heroku worker dyno) - webhooks are optional, so carry on
+            # without them rather than failing the whole startup.
+            log.error("Webhooks", f"Unable to listen on port {self._port}, not receiving webhooks: {ex}")
+            await runner.cleanup()
+            return
+
+        self._runner = runner
+
+        self._worker = asyncio.create_task(self._run())
+
+        log.info("Webhooks", f"Receiving FFXIV Venues webhooks on port {self._port}.")
+
+################################################################################
+    async def stop(self) -> None:
+
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+################################################################################
+    def verify(self, timestamp: Optional[str], signature: Optional[str], body: bytes) -> bool:
+
+        if self._secret is None or not timestamp or not signature:
+            return False
+
+        try:
+            sent = int(timestamp)
+        except ValueError:
+            return False
+
+        if abs(time.time() - sent) > self.MAX_SKEW:
+            return False
+
+        expected = hmac.new(self._secret, f"{timestamp}.".encode() + body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(f"sha256={expected}", signature)
+
+################################################################################
+    async def _handle(self, request: web.Request) -> web.Response:
+
+        body = await request.read()
+        if not self.verify(
+            request.headers.get(self.TIMESTAMP_HEADER),
+            request.headers.get(self.SIGNATURE_HEADER),
+            body
+        ):
+            log.warning("Webhooks", f"Rejected unsigned or badly signed webhook from {request.remote}.")
+            return web.Response(status=401)
+
+        try:
+            venues = self._parse(json.loads(body))
+        except Exception as ex:
+            log.warning("Webhooks", f"Rejected malformed webhook payload: {ex}")
+            return web.Response(status=400)
+
+        for venue in venues:
+            self._pending[venue.id] = venue
+        self._last_event = time.time()
+        self._wakeup.set()
+
+        log.debug("Webhooks", f"Queued {len(venues)} FFXIV Venues update(s).")
+
+        return web.Response(status=202)
+
+################################################################################
+    @staticmethod
+    def _parse(payload: Any) -> List[XIVVenue]:
+
+        if isinstance(payload, dict) and "venue" in payload:
+            payload = payload["venue"]
+        if isinstance(payload, dict):
+            payload = [payload]
+        if not isinstance(payload, list):
+            raise ValueError("expected a venue or a list of venues")
+
+        return [XIVVenue.from_data(v) for v in payload]
+
+################################################################################
+    async def _run(self) -> None:
+
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            batch, self._pending = list(self._pending.values()), {}
+            if not batch:
+                continue
+
+            async with Metrics.track("Webhooks.venue_update"):
+                for frogge in self.bot.guild_manager.fguilds:
+                    try:
+                        await frogge.venue_manager.incremental_sync(batch)
+                    except Exception as ex:
+                        log.error(
+                            "Webhooks",
+                            f"Failed to apply FFXIV Venues update in guild {frogge.guild_id}: {ex}"
+                        )
+
+################################################################################
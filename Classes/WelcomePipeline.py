@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
+
+from discord import Member
+
+from Utilities import log
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+################################################################################
+
+__all__ = ("WelcomePipeline",)
+
+################################################################################
+class WelcomePipeline:
+    """Welcomes new members once they've picked their roles.
+
+    New members wait in ``_pending`` until a role update shows they've chosen
+    something, or until ``ROLE_WINDOW`` runs out. Anyone who is ready is held
+    for ``BATCH_WINDOW`` seconds so that a burst of joins is greeted together
+    in as few messages as possible. Every member starts with the same window,
+    so deadlines arrive in join order and a plain deque keeps them sorted.
+    """
+
+    __slots__ = (
+        "_guild",
+        "_pending",
+        "_deadlines",
+        "_ready",
+        "_wakeup",
+        "_task",
+    )
+
+    ROLE_WINDOW = 300  # seconds
+    BATCH_WINDOW = 15  # seconds
+    MAX_BATCH = 10  # members per message, keeps us under 2000 characters
+
+################################################################################
+    def __init__(self, guild: GuildData) -> None:
+
+        self._guild: GuildData = guild
+
+        self._pending: Dict[int, float] = {}
+        self._deadlines: Deque[Tuple[float, int]] = deque()
+        # Used as an ordered set.
+        self._ready: Dict[int, None] = {}
+
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._pending) + len(self._ready)
+
+################################################################################
+    def add(self, member: Member) -> None:
+
+        deadline = time.monotonic() + self.ROLE_WINDOW
+        self._pending[member.id] = deadline
+        self._deadlines.append((deadline, member.id))
+
+        self._start()
+
+################################################################################
+    def on_member_update(self, before: Member, after: Member) -> None:
+
+        if after.id not in self._pending or before.roles == after.roles:
+            return
+
+        if not self._sections(after):
+            return
+
+        del self._pending[after.id]
+        self._ready[after.id] = None
+
+        self._wakeup.set()
+
+################################################################################
+    def remove(self, member_id: int) -> None:
+
+        # Any deadline entry left behind is skipped when it comes up.
+        self._pending.pop(member_id, None)
+        self._ready.pop(member_id, None)
+
+################################################################################
+    def adopt(self, other: WelcomePipeline) -> None:
+        """Takes over ``other``'s waiting members and stops it - for when a
+        guild reload replaces the pipeline mid-wait."""
+
+        other.stop()
+
+        self._pending.update(other._pending)
+        self._deadlines.extend(other._deadlines)
+        self._ready.update(other._ready)
+
+        if self._deadlines or self._ready:
+            self._start()
+
+################################################################################
+    def stop(self) -> None:
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+################################################################################
+    def _start(self) -> None:
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+################################################################################
+    async def _run(self) -> None:
+
+        while True:
+            self._expire()
+
+            if self._ready:
+                # Give anyone else who's mid-selection a chance to join the batch.
+                await asyncio.sleep(self.BATCH_WINDOW)
+                self._expire()
+                await self._flush()
+                continue
+
+            if not self._deadlines:
+                break
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=max(0.0, self._deadlines[0][0] - time.monotonic())
+                )
+            except asyncio.TimeoutError:
+                pass
+
+################################################################################
+    def _expire(self) -> None:
+
+        now = time.monotonic()
+        while self._deadlines:
+            deadline, member_id = self._deadlines[0]
+            # Stale if they've already been readied, left, or rejoined since.
+            if self._pending.get(member_id) != deadline:
+                self._deadlines.popleft()
+                continue
+            if deadline > now:
+                break
+
+            self._deadlines.popleft()
+            del self._pending[member_id]
+            self._ready[member_id] = None
+
+################################################################################
+    async def _flush(self) -> None:
+
+        member_ids = list(self._ready)
+        self._ready.clear()
+
+        channel = self._guild.channel_manager.welcome_channel
+        if channel is None:
+            return
+
+        members = [
+            m for m in (self._guild.parent.get_member(i) for i in member_ids)
+            if m is not None
+        ]
+
+        log.info("Core", f"Welcoming {len(members)} new member(s).")
+
+        for i in range(0, len(members), self.MAX_BATCH):
+            try:
+                await channel.send(self._compose(members[i:i + self.MAX_BATCH]))
+            except Exception as ex:
+                log.error("Core", f"Failed to send welcome message: {ex}")
+
+################################################################################
+    def _sections(self, member: Member) -> List[str]:
+
+        ret = []
+        if self._guild.role_manager.venue_management in member.roles:
+            ret.append("venue")
+        if self._guild.role_manager.staff_unvalidated in member.roles:
+            ret.append("staff")
+        if "trainee" in [r.name.lower() for r in member.roles]:
+            ret.append("trainee")
+
+        return ret
+
+################################################################################
+    def _compose(self, members: List[Member]) -> str:
+
+        grouped: Dict[str, List[Member]] = {}
+        for m in members:
+            for section in self._sections(m) or ["none"]:
+                grouped.setdefault(section, []).append(m)
+
+        def mentions(ms: List[Member]) -> str:
+            return ", ".join(m.mention for m in ms)
+
+        single = len(members) == 1
+        message = (
+            "# __Welcome to the <a:party_bus:1225557207836393645> "
+            "Staff Party Bus!! <a:party_bus:1225557207836393645>__\n\n"
+
+            f"Hiya, {mentions(members)}! I'm the Staff Party Bot, and I'm going to be "
+            f"your best friend throughout your time here at the Staff Party Bus!\n\n"
+        )
+
+        if "venue" in grouped:
+            message += (
+                ("" if single else f"{mentions(grouped['venue'])}: ") +
+                "It looks like you've selected the Venue Management role!\n"
+                "You can follow the instructions <#1220087653815291954> to set up "
+                "your venue profile \\o/ <a:bartender:1168135253387378748> \n\n"
+            )
+        if "staff" in grouped:
+            message += (
+                ("" if single else f"{mentions(grouped['staff'])}: ") +
+                "I see you've picked the Staff Pending role!\n"
+                "You can follow the instructions here <#1104515062636478643> to do "
+                "your staff validation and you'll be able to create your staff "
+                "profile afterwards! <a:dancer:1168134583158575175>\n\n"
+            )
+        if "trainee" in grouped:
+            message += (
+                ("" if single else f"{mentions(grouped['trainee'])}: ") +
+                "I see you've selected the Trainee role!\n"
+                "You can follow the instructions here <#1219488746664230974> to "
+                "set up your profile and receive training! <a:greeter:1168134573926912071>\n\n"
+            )
+        if "none" in grouped:
+            message += (
+                ("" if single else f"{mentions(grouped['none'])}: ") +
+                "It looks like you haven't selected any roles yet! You can do so "
+                "in <#1104515062636478638> to get started! <a:host:1168134582000943124>"
+            )
+
+        return message
+
+################################################################################
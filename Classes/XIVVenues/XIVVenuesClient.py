@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import os
 
-import requests
 from typing import TYPE_CHECKING, Optional, Any, Dict, List
 from dotenv import load_dotenv
 from .XIVVenue import XIVVenue
 from Utilities.Errors.WTFException import WTFException
 if TYPE_CHECKING:
+    from requests import Response
+
     from Classes import StaffPartyBot
 ################################################################################
 
@@ -33,6 +34,14 @@ class XIVVenuesClient:
         
         self._state: StaffPartyBot = state
         
+################################################################################
+    @staticmethod
+    def _get(query: str) -> Response:
+
+        # Deferred so requests is only loaded once the API is actually used.
+        import requests
+        return requests.get(query)
+
 ################################################################################
     async def get_venues_by_manager(self, manager_id: int) -> List[XIVVenue]:
         
@@ -42,7 +51,7 @@ class XIVVenuesClient:
         if os.getenv("DEBUG") == "True":
             print("Executing XIVClient query: " + query)
             
-        response = requests.get(query)
+        response = self._get(query)
         
         if response.status_code != 200:
             raise WTFException(
@@ -69,7 +78,7 @@ class XIVVenuesClient:
         if os.getenv("DEBUG") == "True":
             print("Executing XIVClient query: " + query)
             
-        response = requests.get(query)
+        response = self._get(query)
 
         if response.status_code != 200:
             raise WTFException(
@@ -96,7 +105,7 @@ class XIVVenuesClient:
         if os.getenv("DEBUG") == "True":
             print("Executing XIVClient query: " + query)
             
-        response = requests.get(query)
+        response = self._get(query)
         
         if response.status_code != 200:
             raise WTFException(
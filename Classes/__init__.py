@@ -11,13 +11,21 @@ if TYPE_CHECKING:
     from .XIVVenues import *
     
     # Modules
+    from .Common import *
     from .Bot import StaffPartyBot
+    from .BulkJobs import BulkJobRunner, BulkJob
     from .ChannelManager import ChannelManager
+    from .DataTransfer import DataTransfer
     from .GuildData import GuildData
     from .GuildManager import GuildManager
     from .HelpMessage import HelpMessage
+    from .ImagePipeline import ImagePipeline
     from .Logger import Logger
     from .RoleManager import RoleManager
+    from .SnapshotManager import SnapshotManager
+    from .TimerService import TimerService, Timer
+    from .UrlShortener import UrlShortener
     from .Webhooks import FroggeHookManager
+    from .WelcomePipeline import WelcomePipeline
 ################################################################################
     
\ No newline at end of file
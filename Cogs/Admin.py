@@ -338,6 +338,79 @@ class Admin(Cog):
 
         await self.bot[ctx.guild_id].bulk_update_menu(ctx.interaction)
         
+################################################################################
+    @admin.command(
+        name="metrics",
+        description="View interaction latency and cost metrics."
+    )
+    async def metrics(self, ctx: ApplicationContext) -> None:
+
+        await self.bot.report_manager.metrics_report(ctx.interaction)
+        
+################################################################################
+    @admin.command(
+        name="export_data",
+        description="Export every staff profile (and optionally more) as a backup file."
+    )
+    async def export_data(
+        self,
+        ctx: ApplicationContext,
+        tusers: Option(
+            SlashCommandOptionType.boolean,
+            name="include_trainers",
+            description="Also export trainer/trainee records.",
+            required=False,
+            default=False
+        ),
+        venues: Option(
+            SlashCommandOptionType.boolean,
+            name="include_venues",
+            description="Also export venues.",
+            required=False,
+            default=False
+        ),
+        jobs: Option(
+            SlashCommandOptionType.boolean,
+            name="include_jobs",
+            description="Also export job postings and their hours.",
+            required=False,
+            default=False
+        ),
+        compress: Option(
+            SlashCommandOptionType.boolean,
+            name="compress",
+            description="Gzip the file. (Default: True)",
+            required=False,
+            default=True
+        )
+    ) -> None:
+
+        sections = [
+            name for name, wanted in (("tusers", tusers), ("venues", venues), ("jobs", jobs))
+            if wanted
+        ]
+        await self.bot.data_transfer.export(
+            ctx.interaction, self.bot[ctx.guild_id], sections, compress
+        )
+        
+################################################################################
+    @admin.command(
+        name="import_profiles",
+        description="Import staff profiles from a file made with /admin export_data."
+    )
+    async def import_profiles(
+        self,
+        ctx: ApplicationContext,
+        file: Option(
+            SlashCommandOptionType.attachment,
+            name="file",
+            description="The exported data file.",
+            required=True
+        )
+    ) -> None:
+
+        await self.bot.data_transfer.import_profiles(ctx.interaction, self.bot[ctx.guild_id], file)
+        
 ################################################################################          
 def setup(bot: "StaffPartyBot") -> None:
 
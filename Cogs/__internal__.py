@@ -4,6 +4,9 @@ from discord import Cog
 from typing import TYPE_CHECKING
 from discord.ext import tasks
 
+from UI.Common import PersistentView
+from Utilities import log, Metrics
+
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
 ################################################################################
@@ -21,8 +24,9 @@ class Internal(Cog):
         await self.bot.load_all()
 
         print("Starting tasks...")
-        self.cull_job_postings.start()
-        # self.training_reminder.start()
+        self.refresh_snapshot.start()
+        self.sync_xiv_venues.start()
+        self.dump_metrics.start()
         
         print("TrainingBot Online!")
 
@@ -45,19 +49,83 @@ class Internal(Cog):
         await self.bot[member.guild.id].on_member_leave(member)
         
 ################################################################################
-    @tasks.loop(minutes=30)
-    async def cull_job_postings(self) -> None:
+    @Cog.listener("on_member_update")
+    async def on_member_update(self, before, after) -> None:
 
-        for f in self.bot.guild_manager.fguilds:
-            await f.jobs_manager.cull_job_postings()
+        if frogge := self.bot[after.guild.id]:
+            frogge.on_member_update(before, after)
         
+################################################################################
+    @Cog.listener("on_thread_create")
+    async def on_thread_create(self, thread) -> None:
+
+        if frogge := self.bot[thread.guild.id]:
+            frogge.thread_index.add(thread)
+        
+################################################################################
+    @Cog.listener("on_raw_thread_update")
+    async def on_raw_thread_update(self, payload) -> None:
+
+        if frogge := self.bot[payload.guild_id]:
+            frogge.thread_index.rename(
+                payload.parent_id, payload.thread_id, payload.data["name"], payload.thread
+            )
+        
+################################################################################
+    @Cog.listener("on_raw_thread_delete")
+    async def on_raw_thread_delete(self, payload) -> None:
+
+        if frogge := self.bot[payload.guild_id]:
+            frogge.thread_index.discard(payload.parent_id, payload.thread_id)
+        
+################################################################################
+    @Cog.listener("on_interaction")
+    async def on_interaction(self, interaction) -> None:
+
+        # Buttons on long-lived posts aren't registered as views; route
+        # them to their handlers by custom_id instead.
+        await PersistentView.dispatch(interaction)
+        
+################################################################################
+    @tasks.loop(hours=1)
+    async def refresh_snapshot(self) -> None:
+
+        # Skip the first iteration; load_all has only just written it.
+        if self.refresh_snapshot.current_loop == 0:
+            return
+        
+        await self.bot.snapshots.refresh()
+        
+################################################################################
+    @tasks.loop(hours=1)
+    async def sync_xiv_venues(self) -> None:
+
+        # Venues were just loaded; there's nothing to catch up on yet.
+        if self.sync_xiv_venues.current_loop == 0:
+            return
+        
+        # Changes are pushed to us while the webhook receiver is up, so the
+        # full catalogue is only polled once a day to catch anything missed.
+        if self.bot.webhooks.running and self.sync_xiv_venues.current_loop % 24:
+            return
+        
+        try:
+            payload = await self.bot.veni_client.get_all_venues()
+        except Exception as ex:
+            log.warning("Venues", f"Incremental FFXIV Venues sync failed: {ex}")
+            return
+        
+        for f in self.bot.guild_manager.fguilds:
+            await f.venue_manager.incremental_sync(payload)
+            
 ################################################################################
     @tasks.loop(minutes=5)
-    async def training_reminder(self) -> None:
+    async def dump_metrics(self) -> None:
 
-        for frogge in self.bot.guild_manager.fguilds:
-            for group in frogge.training_manager.groups:
-                await group.reminder()    
+        try:
+            Metrics.dump()
+        except Exception as ex:
+            log.warning("Core", f"Unable to write interaction metrics: {ex}")
             
 ################################################################################
 def setup(bot: StaffPartyBot) -> None:
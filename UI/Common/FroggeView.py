@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import time
+
 from discord    import Interaction, Member, User
-from discord.ui import View
-from typing     import TYPE_CHECKING, Any, Optional, Union
+from discord.ui import Item, View
+from typing     import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from Utilities import MenuExpiredError
+from Utilities.Metrics import Metrics
 
 if TYPE_CHECKING:
     pass
@@ -15,6 +20,9 @@ __all__ = (
 ################################################################################
 class FroggeView(View):
 
+    # Guild ID -> when its data was last reloaded (time.monotonic())
+    _reloaded: Dict[int, float] = {}
+
     def __init__(
         self,
         owner: Union[Member, User],
@@ -30,15 +38,35 @@ class FroggeView(View):
 
         self._interaction: Optional[Interaction] = None
         self._close_on_complete: bool = close_on_complete
+        self._opened_at: float = time.monotonic()
+
+################################################################################
+    @classmethod
+    def expire_guild(cls, guild_id: int) -> None:
+        """Closes every menu already open in the guild on its next click -
+        they hold objects its reloaded data has replaced."""
+
+        cls._reloaded[guild_id] = time.monotonic()
 
 ################################################################################
     async def interaction_check(self, interaction: Interaction) -> bool:
 
-        if interaction.user == self.owner:
-            self._interaction = interaction
-            return True
+        if interaction.user != self.owner:
+            return False
+
+        if self._reloaded.get(interaction.guild_id, 0.0) > self._opened_at:
+            await interaction.respond(embed=MenuExpiredError(), ephemeral=True)
+            await self.stop()
+            return False
+
+        self._interaction = interaction
+        return True
+
+################################################################################
+    async def _scheduled_task(self, item: Item, interaction: Interaction):
 
-        return False
+        async with Metrics.track(f"{type(self).__name__}.{type(item).__name__}"):
+            await super()._scheduled_task(item, interaction)
 
 ################################################################################
     async def on_timeout(self) -> None:
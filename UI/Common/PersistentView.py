@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Pattern, Tuple
+
+from discord import Interaction, InteractionType
+from discord.ui import View
+
+from Utilities.Metrics import Metrics
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+################################################################################
+
+__all__ = ("PersistentView",)
+
+# (interaction, guild, *custom_id groups) -> whether the click was handled
+RouteHandler = Callable[..., Awaitable[bool]]
+
+################################################################################
+class PersistentView(View):
+    """Components for long-lived posts, routed by ``custom_id`` on click.
+
+    These views only render their buttons and are never registered with the
+    bot. Each component type registers a single handler against its
+    ``custom_id`` pattern with ``PersistentView.route``; when a button is
+    clicked, ``dispatch`` pulls the entity ID back out of the ``custom_id``
+    and the handler resolves the entity through the guild's managers. A
+    handler returns ``False`` if it can't find its entity so that another
+    route matching the same pattern gets a turn.
+    """
+
+    _routes: List[Tuple[Pattern, RouteHandler]] = []
+
+################################################################################
+    def __init__(self):
+
+        super().__init__(timeout=None)
+
+        # py-cord holds on to any unfinished view it sends or edits into a
+        # message. A stopped one is dropped from its store instead.
+        self.stop()
+
+################################################################################
+    @classmethod
+    def route(cls, pattern: str) -> Callable[[RouteHandler], RouteHandler]:
+
+        def decorator(func: RouteHandler) -> RouteHandler:
+            cls._routes.append((re.compile(pattern), func))
+            return func
+
+        return decorator
+
+################################################################################
+    @classmethod
+    async def dispatch(cls, interaction: Interaction) -> bool:
+
+        if interaction.type != InteractionType.component or interaction.guild_id is None:
+            return False
+
+        guild: GuildData = interaction.client[interaction.guild_id]
+        if guild is None:
+            return False
+
+        custom_id = interaction.custom_id or ""
+        matches = [
+            (handler, match) for pattern, handler in cls._routes
+            if (match := pattern.fullmatch(custom_id)) is not None
+        ]
+        if not matches:
+            return False
+
+        async with Metrics.track(cls.__name__) as sample:
+            for handler, match in matches:
+                if await handler(interaction, guild, *match.groups()):
+                    # e.g. "JobPostingPickupView.accept"
+                    sample.name = f"{handler.__module__.rsplit('.', 1)[-1]}.{handler.__name__}"
+                    return True
+
+        return False
+
+################################################################################
@@ -6,6 +6,7 @@ from .FroggeButton import FroggeButton
 from .FroggeModal import FroggeModal
 from .FroggeView import FroggeView
 from .Frogginator import Frogginator
+from .PersistentView import PersistentView
 from .TimezoneSelectView import TimezoneSelectView
 from .YesNoView import YesNoView
 ################################################################################
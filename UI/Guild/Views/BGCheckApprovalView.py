@@ -3,27 +3,25 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from discord import ButtonStyle, Interaction
-from discord.ui import Button, View
+from discord.ui import Button
+
+from UI.Common import PersistentView
 
 if TYPE_CHECKING:
-    from Classes import BackgroundCheck
+    from Classes import BackgroundCheck, GuildData
 ################################################################################
 
 __all__ = ("BGCheckApprovalView",)
 
 ################################################################################
-class BGCheckApprovalView(View):
+class BGCheckApprovalView(PersistentView):
 
     def __init__(self, bg_check: BackgroundCheck):
         
-        super().__init__(timeout=None)
-        
-        self.bg_check: BackgroundCheck = bg_check
+        super().__init__()
         
-        button_list = [ApproveButton(bg_check.user_id)] if not bg_check.approved else []
-        for btn in button_list:
-            if not self.bg_check.approved:
-                self.add_item(btn)
+        if not bg_check.approved:
+            self.add_item(ApproveButton(bg_check.user_id))
 
 ################################################################################
     @staticmethod
@@ -50,9 +48,16 @@ class ApproveButton(Button):
             custom_id=f"approve_bg_check_{user_id}"
         )
         
-    async def callback(self, interaction):
-        await self.view.bg_check.approve(interaction.user)
-        await self.view.edit_message_helper(interaction, view=None)
-        self.view.stop()
+################################################################################
+@PersistentView.route(r"approve_bg_check_(\d+)")
+async def approve(interaction: Interaction, guild: GuildData, user_id: str) -> bool:
+    
+    tuser = guild.training_manager[int(user_id)]
+    if tuser is None or tuser.bg_check is None:
+        return False
+    
+    await tuser.bg_check.approve(interaction.user)
+    await BGCheckApprovalView.edit_message_helper(interaction, view=None)
+    return True
         
 ################################################################################
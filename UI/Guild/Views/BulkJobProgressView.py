@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from discord import ButtonStyle, Interaction
+from discord.ui import Button
+
+from UI.Common import PersistentView
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+################################################################################
+
+__all__ = ("BulkJobProgressView",)
+
+################################################################################
+class BulkJobProgressView(PersistentView):
+
+    def __init__(self, job_id: str):
+        
+        super().__init__()
+        
+        self.add_item(CancelBulkJobButton(job_id))
+
+################################################################################
+class CancelBulkJobButton(Button):
+    
+    def __init__(self, job_id: str):
+        
+        super().__init__(
+            style=ButtonStyle.danger,
+            label="Cancel",
+            disabled=False,
+            row=0,
+            custom_id=f"bulk_job_cancel_{job_id}"
+        )
+        
+################################################################################
+@PersistentView.route(r"bulk_job_cancel_(\w+)")
+async def cancel(interaction: Interaction, guild: GuildData, job_id: str) -> bool:
+    
+    return await guild.bot.bulk_jobs.cancel(interaction, job_id)
+        
+################################################################################
@@ -27,6 +27,7 @@ class ReportMenuView(FroggeView):
             UnpaidTrainerButton(),
             PositionsButton(),
             TempJobPostingsButton(),
+            TrainerRecommendationsButton(),
             CloseMessageButton(),
         ]
         for btn in button_list:
@@ -105,3 +106,21 @@ class TempJobPostingsButton(Button):
         await self.view.stop()  # type: ignore
         
 ################################################################################
+class TrainerRecommendationsButton(Button):
+    
+    def __init__(self):
+        
+        super().__init__(
+            style=ButtonStyle.primary,
+            label="Trainer Recommendations",
+            disabled=False,
+            row=1
+        )
+        
+    async def callback(self, interaction):
+        await self.view.guild.training_manager.recommendation_report(interaction)
+        
+        self.view.complete = True
+        await self.view.stop()  # type: ignore
+        
+################################################################################
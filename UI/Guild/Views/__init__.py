@@ -1,4 +1,5 @@
 from .BGCheckApprovalView import BGCheckApprovalView
+from .BulkJobProgressView import BulkJobProgressView
 from .BulkUpdateView import BulkUpdateView
 from .ChannelStatusView import ChannelStatusView
 from .ReportMenuView import ReportMenuView
@@ -2,34 +2,32 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List
 
-from discord import User, ButtonStyle
-from discord.ui import Button, View
+from discord import ButtonStyle, Interaction
+from discord.ui import Button
 
 from Assets import BotEmojis
-from UI.Common import CloseMessageButton
+from UI.Common import PersistentView
 
 if TYPE_CHECKING:
-    from Classes import JobPosting
+    from Classes import GuildData, JobPosting
 ################################################################################
 
 __all__ = ("JobPostingPickupView",)
 
 ################################################################################
-class JobPostingPickupView(View):
+class JobPostingPickupView(PersistentView):
 
     def __init__(self, posting: JobPosting):
         
-        super().__init__(timeout=None)
-        
-        self.posting: JobPosting = posting
+        super().__init__()
         
         button_list: List[Button] = (
             [AcceptButton(posting.id)] if posting.candidate is None 
             else []
         )
         button_list.append(RejectButton(posting.id))
-        if self.posting.candidate is not None:
-            button_list.append(CancelButton(posting))
+        if posting.candidate is not None:
+            button_list.append(CancelButton(posting.id))
         
         for btn in button_list:
             self.add_item(btn)
@@ -48,9 +46,6 @@ class AcceptButton(Button):
             custom_id=f"{posting_id}_accept"
         )
         
-    async def callback(self, interaction):
-        await self.view.posting.candidate_accept(interaction)       
-        
 ################################################################################
 class RejectButton(Button):
     
@@ -65,13 +60,10 @@ class RejectButton(Button):
             custom_id=f"{posting_id}_reject"
         )
         
-    async def callback(self, interaction):
-        await self.view.posting.reject(interaction)
-        
 ################################################################################
 class CancelButton(Button):
     
-    def __init__(self, posting: JobPosting):
+    def __init__(self, posting_id: str):
         
         super().__init__(
             style=ButtonStyle.secondary,
@@ -79,15 +71,43 @@ class CancelButton(Button):
             disabled=False,
             row=0,
             emoji=BotEmojis.Cross,
-            custom_id=f"{posting.id}_cancel"
+            custom_id=f"{posting_id}_cancel"
         )
         
-        self.user: User = posting.candidate.user
-        
-    async def callback(self, interaction):
-        if interaction.user == self.user:
-            await self.view.posting.cancel(interaction)
-        
 ################################################################################
+@PersistentView.route(r"(\w+)_accept")
+async def accept(interaction: Interaction, guild: GuildData, posting_id: str) -> bool:
+    
+    # Group training posts share this suffix, so let them have a go if
+    # there's no matching posting.
+    posting = guild.jobs_manager.get_posting(posting_id)
+    if posting is None:
+        return False
+    
+    await posting.candidate_accept(interaction)
+    return True
+
+################################################################################
+@PersistentView.route(r"(\w+)_reject")
+async def reject(interaction: Interaction, guild: GuildData, posting_id: str) -> bool:
+    
+    posting = guild.jobs_manager.get_posting(posting_id)
+    if posting is None:
+        return False
+    
+    await posting.reject(interaction)
+    return True
+
+################################################################################
+@PersistentView.route(r"(\w+)_cancel")
+async def cancel(interaction: Interaction, guild: GuildData, posting_id: str) -> bool:
+    
+    posting = guild.jobs_manager.get_posting(posting_id)
+    if posting is None:
+        return False
+    
+    if posting.candidate is not None and interaction.user.id == posting.candidate.user_id:
+        await posting.cancel(interaction)
+    return True
         
-        
\ No newline at end of file
+################################################################################
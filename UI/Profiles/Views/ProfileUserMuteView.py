@@ -1,27 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 
 from discord import Interaction, ButtonStyle
-from discord.ui import View
 
-from UI.Common import FroggeButton
+from UI.Common import FroggeButton, PersistentView
 
 if TYPE_CHECKING:
-    from Classes import Profile
+    from Classes import GuildData, Profile
 ################################################################################
 
 __all__ = ("ProfileUserMuteView",)
 
 ################################################################################        
-class ProfileUserMuteView(View):
+class ProfileUserMuteView(PersistentView):
 
     def __init__(self, profile: Profile):
 
-        super().__init__(timeout=None)
+        super().__init__()
 
-        self.profile: Profile = profile
-        self.add_item(MuteUserButton(self.profile.id))
+        self.add_item(MuteUserButton(profile.id))
 
 ################################################################################        
 class MuteUserButton(FroggeButton):
@@ -36,7 +34,15 @@ class MuteUserButton(FroggeButton):
             custom_id=f"mute_user_{_id}"
         )
 
-    async def callback(self, interaction: Interaction) -> None:
-        await self.view.profile.venue_mute(interaction)
+################################################################################
+@PersistentView.route(r"mute_user_(\w+)")
+async def mute_user(interaction: Interaction, guild: GuildData, profile_id: str) -> bool:
+
+    profile = guild.profile_manager.get_profile(profile_id)
+    if profile is None:
+        return False
+
+    await profile.venue_mute(interaction)
+    return True
 
 ################################################################################
@@ -1,33 +1,28 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 
-from discord import Interaction, User, ButtonStyle
-from discord.ui import View
+from discord import Interaction, ButtonStyle
 
-from Assets import BotEmojis
-from UI.Common import FroggeView, CloseMessageButton, FroggeButton
+from UI.Common import FroggeButton, PersistentView
 from Utilities import edit_message_helper
 
 if TYPE_CHECKING:
-    from Classes import GroupTraining
+    from Classes import GroupTraining, GuildData
 ################################################################################
 
 __all__ = ("GroupTrainingPickupView",)
 
 ################################################################################
-class GroupTrainingPickupView(View):
+class GroupTrainingPickupView(PersistentView):
 
     def __init__(self, training: GroupTraining) -> None:
 
-        super().__init__(timeout=None)
-
-        self.group: GroupTraining = training
+        super().__init__()
 
         button_list = [
-            AcceptButton(self.group.id),
-            TentativeButton(self.group.id),
+            AcceptButton(training.id),
+            TentativeButton(training.id),
         ]
         
         for btn in button_list:
@@ -46,10 +41,6 @@ class AcceptButton(FroggeButton):
             custom_id=f"{group_id}_accept"
         )
 
-    async def callback(self, interaction: Interaction) -> None:
-        await self.view.group.signup(interaction)
-        await edit_message_helper(interaction, embed=self.view.group.status())
-
 ################################################################################
 class TentativeButton(FroggeButton):
 
@@ -63,8 +54,28 @@ class TentativeButton(FroggeButton):
             custom_id=f"{group_id}_tentative"
         )
 
-    async def callback(self, interaction: Interaction) -> None:
-        await self.view.group.tentative_signup(interaction)
-        await edit_message_helper(interaction, embed=self.view.group.status())
+################################################################################
+@PersistentView.route(r"(\w+)_accept")
+async def accept(interaction: Interaction, guild: GuildData, group_id: str) -> bool:
+
+    group = guild.training_manager.get_group_training(group_id)
+    if group is None:
+        return False
+
+    await group.signup(interaction)
+    await edit_message_helper(interaction, embed=group.status())
+    return True
+
+################################################################################
+@PersistentView.route(r"(\w+)_tentative")
+async def tentative(interaction: Interaction, guild: GuildData, group_id: str) -> bool:
+
+    group = guild.training_manager.get_group_training(group_id)
+    if group is None:
+        return False
+
+    await group.tentative_signup(interaction)
+    await edit_message_helper(interaction, embed=group.status())
+    return True
 
 ################################################################################
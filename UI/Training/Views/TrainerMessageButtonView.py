@@ -3,20 +3,22 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from discord import Interaction, ButtonStyle
-from discord.ui import Button, View
+from discord.ui import Button
+
+from UI.Common import PersistentView
 
 if TYPE_CHECKING:
-    from Classes import SignUpMessage
+    from Classes import GuildData, SignUpMessage
 ################################################################################
 
 __all__ = ("TrainerMessageButtonView",)
 
 ################################################################################
-class TrainerMessageButtonView(View):
+class TrainerMessageButtonView(PersistentView):
 
     def __init__(self, msg: SignUpMessage):
         
-        super().__init__(timeout=None)
+        super().__init__()
         
         self.msg: SignUpMessage = msg
         
@@ -40,7 +42,11 @@ class AcquireTrainingsButton(Button):
             custom_id="training_pickup_button"
         )
         
-    async def callback(self, interaction: Interaction):
-        await self.view.msg.acquire_single_trainee(interaction)
+################################################################################
+@PersistentView.route(r"training_pickup_button")
+async def acquire_trainings(interaction: Interaction, guild: GuildData) -> bool:
+    
+    await guild.training_manager.signup_message.acquire_single_trainee(interaction)
+    return True
     
 ################################################################################
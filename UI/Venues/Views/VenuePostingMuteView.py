@@ -3,25 +3,25 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from discord import Interaction, ButtonStyle
-from discord.ui import Button, View
+from discord.ui import Button
 
 from Assets import BotEmojis
+from UI.Common import PersistentView
 
 if TYPE_CHECKING:
-    from Classes import Venue
+    from Classes import GuildData, Venue
 ################################################################################
 
 __all__ = ("VenuePostingMuteView",)
 
 ################################################################################
-class VenuePostingMuteView(View):
+class VenuePostingMuteView(PersistentView):
 
     def __init__(self,  venue: Venue):
         
-        super().__init__(timeout=None)
+        super().__init__()
         
-        self.venue: Venue = venue
-        self.add_item(VenueMuteButton(self.venue.id))
+        self.add_item(VenueMuteButton(venue.id))
         
 ################################################################################
 class VenueMuteButton(Button):
@@ -37,13 +37,20 @@ class VenueMuteButton(Button):
             custom_id=f"venue_mute_{venue_id}"
         )
         
-    async def callback(self, interaction: Interaction):
-        venue: Venue = self.view.venue
-        tuser = venue.guild.training_manager[interaction.user.id]
-        if tuser is None:
-            await interaction.edit()
-            return
-        
-        await tuser.mute_venue(interaction, venue)
+################################################################################
+@PersistentView.route(r"venue_mute_(\w+)")
+async def venue_mute(interaction: Interaction, guild: GuildData, venue_id: str) -> bool:
+    
+    venue = guild.venue_manager[venue_id]
+    if venue is None:
+        return False
+    
+    tuser = guild.training_manager[interaction.user.id]
+    if tuser is None:
+        await interaction.edit()
+        return True
+    
+    await tuser.mute_venue(interaction, venue)
+    return True
     
 ################################################################################
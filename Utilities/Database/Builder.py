@@ -11,6 +11,7 @@ class DatabaseBuilder(DBWorkerBranch):
 
     def build_all(self) -> None:
         
+        self._build_migrations()
         self._build_views()
         self._build_initial_records()
         
@@ -31,6 +32,71 @@ class DatabaseBuilder(DBWorkerBranch):
                 guild.id,
             )
   
+################################################################################
+    def _build_migrations(self) -> None:
+        
+        # Last-seen FFXIV Venues modification time, for incremental syncing.
+        self.execute(
+            "ALTER TABLE venues ADD COLUMN IF NOT EXISTS xiv_modified TIMESTAMPTZ;"
+        )
+        
+        # Content hash -> image dump URL, so identical uploads are stored once.
+        self.execute(
+            "CREATE TABLE IF NOT EXISTS image_hashes ("
+            "hash TEXT PRIMARY KEY,"
+            "url TEXT NOT NULL,"
+            "created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()"
+            ");"
+        )
+        
+        # Long URL -> shortened URL, so each link is only shortened once.
+        self.execute(
+            "CREATE TABLE IF NOT EXISTS short_urls ("
+            "long_url TEXT PRIMARY KEY,"
+            "short_url TEXT NOT NULL,"
+            "created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()"
+            ");"
+        )
+        
+        # Background bulk operations and how far they got, so they can resume.
+        self.execute(
+            "CREATE TABLE IF NOT EXISTS bulk_jobs ("
+            "_id TEXT PRIMARY KEY,"
+            "guild_id BIGINT NOT NULL,"
+            "kind TEXT NOT NULL,"
+            "user_id BIGINT NOT NULL,"
+            "channel_id BIGINT,"
+            "message_id BIGINT,"
+            "targets TEXT[] NOT NULL,"
+            "done TEXT[] NOT NULL DEFAULT '{}',"
+            "outcomes TEXT NOT NULL DEFAULT '{}',"
+            "status TEXT NOT NULL DEFAULT 'running',"
+            "created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()"
+            ");"
+        )
+        
+        # The warm-restart snapshot - a single row, replaced on every write.
+        self.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "_id INTEGER PRIMARY KEY,"
+            "version INTEGER NOT NULL,"
+            "created_at TIMESTAMPTZ NOT NULL,"
+            "data BYTEA NOT NULL"
+            ");"
+        )
+        
+        # Pending delayed actions, so they survive a restart.
+        self.execute(
+            "CREATE TABLE IF NOT EXISTS timers ("
+            "guild_id BIGINT NOT NULL,"
+            "kind TEXT NOT NULL,"
+            "key TEXT NOT NULL,"
+            "due DOUBLE PRECISION NOT NULL,"
+            "payload TEXT NOT NULL DEFAULT '{}',"
+            "PRIMARY KEY (guild_id, kind, key)"
+            ");"
+        )
+        
 ################################################################################
     def _build_views(self) -> None:
 
@@ -125,7 +191,9 @@ class DatabaseBuilder(DBWorkerBranch):
             "u.website_url,"
             "u.banner_url,"
             "u.logo_url,"
-            "u.application_url "
+            "u.application_url,"
+            # Appended last so CREATE OR REPLACE can still extend the view.
+            "v.xiv_modified "
             "FROM venues v "
             "JOIN venue_locations l ON v._id = l.venue_id "
             "JOIN venue_aag a ON v._id = a.venue_id "
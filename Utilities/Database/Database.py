@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any, Dict, Tuple
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
 
 import psycopg2
 from dotenv import load_dotenv
 from psycopg2 import OperationalError
+from psycopg2.extras import execute_values
 
+from Utilities import Metrics
 from .Worker import DatabaseWorker
 
 if TYPE_CHECKING:
@@ -20,6 +26,21 @@ if TYPE_CHECKING:
 
 __all__ = ("Database", )
 
+################################################################################
+class _WriteBatch:
+    """Writes queued by ``Database.deferred()``, waiting to be run."""
+
+    __slots__ = (
+        "statements",
+        "open",
+    )
+
+    def __init__(self) -> None:
+
+        # (query, args, is execute_many)
+        self.statements: List[Tuple[str, Tuple[Any, ...], bool]] = []
+        self.open: bool = True
+
 ################################################################################
 class Database:
     """Database class for handling all database interactions."""
@@ -29,8 +50,15 @@ class Database:
         "_connection",
         "_cursor",
         "_worker",
+        "_txn_depth",
+        "_txn_failed",
+        "_writes",
     )
 
+    _batch: ContextVar[Optional[_WriteBatch]] = ContextVar("db_write_batch", default=None)
+    # (connection, cursor) of the current detached() block
+    _detached: ContextVar[Optional[Tuple[Any, Any]]] = ContextVar("db_detached", default=None)
+
 ################################################################################
     def __init__(self, bot: StaffPartyBot):
 
@@ -40,6 +68,10 @@ class Database:
         self._cursor: cursor = None  # type: ignore
         self._worker: DatabaseWorker = DatabaseWorker(bot)
         
+        self._txn_depth: int = 0
+        self._txn_failed: bool = False
+        self._writes: int = 0
+        
 ################################################################################        
     def _connect(self) -> None:
 
@@ -47,15 +79,48 @@ class Database:
 
         self._reset_connection()
         
-        if os.getenv("DEBUG") == "True":
-            self._connection = psycopg2.connect(os.getenv("DATABASE_URL"))
-        else:
-            self._connection = psycopg2.connect(os.getenv("HEROKU_POSTGRESQL_NAVY_URL"), sslmode="require")
-            
+        self._connection = self._open_connection()
         self._cursor = self._connection.cursor()
 
         print("Connecting to database")
 
+################################################################################
+    @staticmethod
+    def _open_connection() -> connection:
+
+        if os.getenv("DEBUG") == "True":
+            return psycopg2.connect(os.getenv("DATABASE_URL"))
+        else:
+            return psycopg2.connect(os.getenv("HEROKU_POSTGRESQL_NAVY_URL"), sslmode="require")
+
+################################################################################
+    @contextmanager
+    def detached(self) -> Iterator[None]:
+        """Runs everything inside the block over a connection of its own,
+        committed when the block exits. For big jobs run on a worker thread
+        (``asyncio.to_thread``), which must never touch the shared cursor
+        the event loop is using."""
+
+        load_dotenv()
+
+        conn = self._open_connection()
+        token = self._detached.set((conn, conn.cursor()))
+        try:
+            yield
+            conn.commit()
+        finally:
+            self._detached.reset(token)
+            conn.close()
+
+################################################################################
+    @property
+    def writes(self) -> int:
+        """How many statements other than reads have been sent over the
+        shared connection. It goes up before each one runs, so if it hasn't
+        moved, nothing can have been written in the meantime."""
+
+        return self._writes
+
 ################################################################################
     def _assert_structure(self) -> None:
 
@@ -65,6 +130,36 @@ class Database:
     def _load_all(self) -> Dict[str, Any]:
 
         return self._worker.load_all()
+
+################################################################################
+    def _load_image_hashes(self) -> Tuple[Tuple[Any, ...], ...]:
+
+        return self._worker.load_image_hashes()
+    
+################################################################################
+    def _load_bulk_jobs(self) -> Tuple[Tuple[Any, ...], ...]:
+
+        return self._worker.load_bulk_jobs()
+    
+################################################################################
+    def _load_timers(self) -> Tuple[Tuple[Any, ...], ...]:
+
+        return self._worker.load_timers()
+    
+################################################################################
+    def _load_snapshot(self) -> Optional[Tuple[Any, ...]]:
+
+        return self._worker.load_snapshot()
+    
+################################################################################
+    def _lookup_short_url(self, long_url: str) -> Optional[str]:
+
+        return self._worker.lookup_short_url(long_url)
+    
+################################################################################
+    def _stream_export(self, guild_id: int, kinds: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+
+        return self._worker.stream_export(guild_id, kinds)
     
 ################################################################################
     def _reset_connection(self) -> None:
@@ -81,30 +176,219 @@ class Database:
 ################################################################################
     def execute(self, query: str, *fmt_args: Any) -> None:
 
+        if self._queue(query, fmt_args, False):
+            return
+
+        if (detached := self._detached.get()) is not None:
+            detached[1].execute(query, fmt_args)
+            return
+
+        if query.lstrip()[:6].upper() != "SELECT":
+            self._writes += 1
+
         try:
             self._cursor.execute("SELECT 1")
         except:
             self._connect()
+            # Anything run earlier in the transaction went with the old connection.
+            if self._txn_depth:
+                self._txn_failed = True
 
         load_dotenv()
         
+        start = time.perf_counter()
         try:
             self._cursor.execute(query, fmt_args)
-            self._connection.commit()
+            if not self._txn_depth:
+                self._connection.commit()
+            Metrics.record_db(time.perf_counter() - start)
             if os.getenv("DEBUG") == "True":
                 print(f"Database execution succeeded on query: '{query}', Args: {fmt_args}")
         except:
             print(f"Database execution failed on query: '{query}', Args: {fmt_args}")
+            if self._txn_depth:
+                self._txn_failed = True
+
+################################################################################
+    def execute_many(self, query: str, rows: List[Tuple[Any, ...]], page_size: int = 500) -> None:
+        """Runs ``query`` - which must contain a single ``VALUES %s`` - for
+        all of ``rows``, ``page_size`` rows per round trip."""
+
+        if not rows:
+            return
+
+        if self._queue(query, rows, True):
+            return
+
+        self._writes += 1
+
+        try:
+            self._cursor.execute("SELECT 1")
+        except:
+            self._connect()
+            if self._txn_depth:
+                self._txn_failed = True
+
+        start = time.perf_counter()
+        try:
+            execute_values(self._cursor, query, rows, page_size=page_size)
+            if not self._txn_depth:
+                self._connection.commit()
+            Metrics.record_db(time.perf_counter() - start)
+        except:
+            print(f"Database batch execution failed on query: '{query}', Rows: {len(rows)}")
+            if self._txn_depth:
+                self._txn_failed = True
+
+################################################################################
+    def stream(self, query: str, *fmt_args: Any, batch: int = 500) -> Iterator[Dict[str, Any]]:
+        """Yields the rows of ``query`` as column -> value dicts, fetched
+        ``batch`` at a time through a server-side cursor so the whole result
+        never has to sit in memory. ``query`` must not end in a semicolon.
+
+        Inside ``detached()`` the cursor lives in that block's transaction.
+        On the shared connection it's held across commits, so other
+        statements may run between rows - but a rollback or reconnect by
+        one of them closes it, so anything long belongs in ``detached()``."""
+
+        detached = self._detached.get()
+        if detached is None:
+            try:
+                self._cursor.execute("SELECT 1")
+            except:
+                self._connect()
+
+        conn = detached[0] if detached is not None else self._connection
+        with conn.cursor(name=f"stream_{uuid4().hex}", withhold=detached is None) as cur:
+            cur.itersize = batch
+            cur.execute(query, fmt_args)
+
+            columns = None
+            for row in cur:
+                if columns is None:
+                    columns = [c.name for c in cur.description]
+                yield dict(zip(columns, row))
+
+        if detached is None and not self._txn_depth:
+            self._connection.commit()
+
+################################################################################
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Defers commits until the outermost block exits, then commits every
+        statement run inside it at once - or rolls them all back if any of
+        them (or the block itself) failed. Blocks may be nested.
+
+        The connection is shared, so never ``await`` inside the block - use
+        ``deferred()`` for that."""
+
+        self._txn_depth += 1
+        try:
+            yield
+        except:
+            self._txn_failed = True
+            raise
+        finally:
+            self._txn_depth -= 1
+            if not self._txn_depth:
+                failed, self._txn_failed = self._txn_failed, False
+                try:
+                    if failed:
+                        self._connection.rollback()
+                        print("Database transaction rolled back.")
+                    else:
+                        self._connection.commit()
+                except (OperationalError, AttributeError):
+                    pass
+
+################################################################################
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """Queues the writes made inside the block - by this task, and by any
+        task it starts - and runs them all in one transaction once it exits.
+        Nothing is written if the block raises.
+
+        Unlike ``transaction()`` this may be held across ``await``s: nothing
+        is open on the shared connection while the block is suspended, so
+        writes from other coroutines are never caught up in it. Reads still
+        run immediately, and so don't see writes queued earlier in the block.
+        """
+
+        batch = _WriteBatch()
+        token = self._batch.set(batch)
+        try:
+            yield
+        finally:
+            batch.open = False
+            self._batch.reset(token)
+
+        self._run_batch(batch.statements)
+
+################################################################################
+    def _queue(self, query: str, args: Any, many: bool) -> bool:
+        """Queues ``query`` on the current ``deferred()`` block, if there is
+        one and it's a write. Returns whether it was queued."""
+
+        batch = self._batch.get()
+        if batch is None or query.lstrip()[:6].upper() == "SELECT":
+            return False
+
+        if not batch.open:
+            # Started inside a deferred block that has since finished -
+            # there's nothing left to queue on, so just run it.
+            return False
+
+        batch.statements.append((query, args, many))
+        return True
+
+################################################################################
+    def _run_batch(self, statements: List[Tuple[str, Tuple[Any, ...], bool]]) -> None:
+
+        if not statements:
+            return
+
+        # A dropped connection part way through fails the transaction -
+        # replay it once on the fresh connection rather than lose it. Only
+        # possible when we own the transaction outright.
+        attempts = 1 if self._txn_depth else 2
+        for attempt in range(attempts):
+            if not self._txn_depth:
+                try:
+                    self._cursor.execute("SELECT 1")
+                except:
+                    self._connect()
+
+            with self.transaction():
+                for query, args, many in statements:
+                    if many:
+                        self.execute_many(query, args)
+                    else:
+                        self.execute(query, *args)
+                failed = self._txn_failed
+            if not failed:
+                return
+            if attempt + 1 < attempts:
+                print(f"Retrying batch of {len(statements)} database statement(s).")
+
+################################################################################
+    @property
+    def transaction_failed(self) -> bool:
+        """Whether a statement in the current transaction has failed, meaning
+        it will be rolled back."""
+
+        return self._txn_failed
 
 ################################################################################
     def fetchall(self) -> Tuple[Tuple[Any, ...]]:
 
-        return self._cursor.fetchall()
+        detached = self._detached.get()
+        return (detached[1] if detached is not None else self._cursor).fetchall()
 
 ################################################################################
     def fetchone(self) -> Tuple[Any, ...]:
 
-        return self._cursor.fetchone()
+        detached = self._detached.get()
+        return (detached[1] if detached is not None else self._cursor).fetchone()
     
 ################################################################################
 
@@ -119,6 +119,14 @@ class DatabaseDeleter(DBWorkerBranch):
             signup.id
         )
         
+################################################################################
+    def _delete_timer(self, guild_id: int, kind: str, key: str) -> None:
+        
+        self.execute(
+            "DELETE FROM timers WHERE guild_id = %s AND kind = %s AND key = %s;",
+            guild_id, kind, key
+        )
+        
 ################################################################################
 
     requirement             = _delete_requirement
@@ -134,6 +142,7 @@ class DatabaseDeleter(DBWorkerBranch):
     sp_availability         = _delete_service_profile_availability
     group_training          = delete_group_training
     group_training_signup   = delete_group_training_signup
+    timer                   = _delete_timer
     
 ################################################################################
     
\ No newline at end of file
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from datetime import time
-from typing import TYPE_CHECKING, Optional, List
+from datetime import datetime, time
+from typing import TYPE_CHECKING, Any, Dict, Optional, List
 
 from Utilities import TrainingLevel, Weekday
 from .Branch import DBWorkerBranch
@@ -307,6 +307,129 @@ class DatabaseInserter(DBWorkerBranch):
         
         return new_id
         
+################################################################################
+    def _add_image_hash(self, key: str, url: str) -> None:
+        
+        self.execute(
+            "INSERT INTO image_hashes (hash, url) VALUES (%s, %s) "
+            "ON CONFLICT DO NOTHING;",
+            key, url
+        )
+        
+################################################################################
+    def _add_profile_batch(
+        self,
+        profiles: List[Dict[str, Any]],
+        additional_images: List[Dict[str, Any]],
+        availability: List[Dict[str, Any]]
+    ) -> None:
+        """Inserts whole profiles at once. ``profiles`` are ``profile_master``
+        rows; ids and guild IDs are taken as given."""
+        
+        execute = self.database.execute_many
+        
+        execute(
+            "INSERT INTO profiles (_id, guild_id, user_id) VALUES %s;",
+            [(p["_id"], p["guild_id"], p["user_id"]) for p in profiles]
+        )
+        execute(
+            "INSERT INTO details (_id, char_name, url, color, jobs, rates, "
+            "post_url, positions, dm_preference) VALUES %s;",
+            [
+                (
+                    p["_id"], p["char_name"], p["custom_url"], p["color"], p["jobs"],
+                    p["rates"], p["post_url"], p["positions"], p["dm_preference"]
+                )
+                for p in profiles
+            ]
+        )
+        execute(
+            "INSERT INTO personality (_id, likes, dislikes, personality, aboutme) "
+            "VALUES %s;",
+            [
+                (p["_id"], p["likes"], p["dislikes"], p["personality"], p["aboutme"])
+                for p in profiles
+            ]
+        )
+        execute(
+            "INSERT INTO ataglance (_id, gender, pronouns, race, clan, orientation, "
+            "height, age, mare, data_centers) VALUES %s;",
+            [
+                (
+                    p["_id"], p["gender"], p["pronouns"], p["race"], p["clan"],
+                    p["orientation"], p["height"], p["age"], p["mare"], p["data_centers"]
+                )
+                for p in profiles
+            ]
+        )
+        execute(
+            "INSERT INTO images (_id, thumbnail, main_image) VALUES %s;",
+            [(p["_id"], p["thumbnail"], p["main_image"]) for p in profiles]
+        )
+        execute(
+            "INSERT INTO additional_images (_id, profile_id, url, caption) VALUES %s;",
+            [(a["_id"], a["profile_id"], a["url"], a["caption"]) for a in additional_images]
+        )
+        execute(
+            "INSERT INTO profile_availability (profile_id, day, start_time, end_time) "
+            "VALUES %s;",
+            [(a["profile_id"], a["day"], a["start_time"], a["end_time"]) for a in availability]
+        )
+        
+################################################################################
+    def _add_bulk_job(
+        self,
+        guild_id: int,
+        kind: str,
+        user_id: int,
+        channel_id: Optional[int],
+        message_id: Optional[int],
+        targets: List[str]
+    ) -> str:
+        
+        new_id = self.generate_id()
+        
+        self.execute(
+            "INSERT INTO bulk_jobs (_id, guild_id, kind, user_id, channel_id, "
+            "message_id, targets) VALUES (%s, %s, %s, %s, %s, %s, %s);",
+            new_id, guild_id, kind, user_id, channel_id, message_id, targets
+        )
+        
+        return new_id
+        
+################################################################################
+    def _add_short_url(self, long_url: str, short_url: str) -> None:
+        
+        self.execute(
+            "INSERT INTO short_urls (long_url, short_url) VALUES (%s, %s) "
+            "ON CONFLICT DO NOTHING;",
+            long_url, short_url
+        )
+        
+################################################################################
+    def _add_timer(self, guild_id: int, kind: str, key: str, due: float, payload: str) -> None:
+        """Adds the timer, or replaces the pending one with the same identity."""
+        
+        self.execute(
+            "INSERT INTO timers (guild_id, kind, key, due, payload) "
+            "VALUES (%s, %s, %s, %s, %s) "
+            "ON CONFLICT (guild_id, kind, key) "
+            "DO UPDATE SET due = EXCLUDED.due, payload = EXCLUDED.payload;",
+            guild_id, kind, key, due, payload
+        )
+        
+################################################################################
+    def _add_snapshot(self, version: int, created_at: datetime, data: bytes) -> None:
+        """Replaces the stored snapshot."""
+        
+        self.execute(
+            "INSERT INTO snapshots (_id, version, created_at, data) "
+            "VALUES (1, %s, %s, %s) "
+            "ON CONFLICT (_id) DO UPDATE SET version = EXCLUDED.version, "
+            "created_at = EXCLUDED.created_at, data = EXCLUDED.data;",
+            version, created_at, data
+        )
+        
 ################################################################################
 
     position                = _add_position
@@ -328,6 +451,12 @@ class DatabaseInserter(DBWorkerBranch):
     sp_availability         = _add_service_availability
     group_training          = _add_group_training
     group_training_signup   = _add_group_training_signup
+    image_hash              = _add_image_hash
+    short_url               = _add_short_url
+    profile_batch           = _add_profile_batch
+    bulk_job                = _add_bulk_job
+    timer                   = _add_timer
+    snapshot                = _add_snapshot
     
 ################################################################################
     
\ No newline at end of file
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from .Branch import DBWorkerBranch
 
@@ -14,6 +14,27 @@ __all__ = ("DatabaseLoader",)
 class DatabaseLoader(DBWorkerBranch):
     """A utility class for loading data from the database."""
 
+    # Record kind -> the guild's rows of it. Run through server-side cursors,
+    # so no trailing semicolons.
+    EXPORT_QUERIES = {
+        "profile": "SELECT * FROM profile_master WHERE guild_id = %s",
+        "additional_image": (
+            "SELECT a.* FROM additional_images a "
+            "JOIN profiles p ON a.profile_id = p._id WHERE p.guild_id = %s"
+        ),
+        "profile_availability": (
+            "SELECT pa.* FROM profile_availability pa "
+            "JOIN profiles p ON pa.profile_id = p._id WHERE p.guild_id = %s"
+        ),
+        "tuser": "SELECT * FROM tuser_master WHERE guild_id = %s",
+        "tuser_availability": "SELECT * FROM availability WHERE guild_id = %s",
+        "qualification": "SELECT * FROM qualifications WHERE guild_id = %s",
+        "venue": "SELECT * FROM venue_master WHERE guild_id = %s",
+        "venue_hours": "SELECT * FROM venue_hours WHERE guild_id = %s",
+        "job_posting": "SELECT * FROM job_postings WHERE guild_id = %s",
+        "job_hours": "SELECT * FROM job_hours WHERE guild_id = %s",
+    }
+
     def load_all(self) -> Dict[str, Any]:
         """Performs all sub-loaders and returns a dictionary of their results."""
 
@@ -195,4 +216,52 @@ class DatabaseLoader(DBWorkerBranch):
         self.execute("SELECT * FROM group_training_signups;")
         return self.fetchall()
     
+################################################################################
+    def load_image_hashes(self) -> Tuple[Tuple[Any, ...], ...]:
+        """Not guild data, so not part of ``load_all``."""
+        
+        self.execute("SELECT hash, url FROM image_hashes;")
+        return self.fetchall()
+    
+################################################################################
+    def load_bulk_jobs(self) -> Tuple[Tuple[Any, ...], ...]:
+        """Bulk jobs that were still running when the bot last stopped."""
+        
+        self.execute(
+            "SELECT _id, guild_id, kind, user_id, channel_id, message_id, "
+            "targets, done, outcomes FROM bulk_jobs WHERE status = 'running';"
+        )
+        return self.fetchall()
+    
+################################################################################
+    def load_timers(self) -> Tuple[Tuple[Any, ...], ...]:
+        """Timers that hadn't fired when the bot last stopped."""
+        
+        self.execute("SELECT guild_id, kind, key, due, payload FROM timers;")
+        return self.fetchall()
+    
+################################################################################
+    def load_snapshot(self) -> Optional[Tuple[Any, ...]]:
+        """(version, created_at, data) of the warm-restart snapshot, if any."""
+        
+        self.execute("SELECT version, created_at, data FROM snapshots WHERE _id = 1;")
+        return self.fetchone()
+    
+################################################################################
+    def lookup_short_url(self, long_url: str) -> Optional[str]:
+        
+        self.execute("SELECT short_url FROM short_urls WHERE long_url = %s;", long_url)
+        row = self.fetchone()
+        
+        return row[0] if row else None
+    
+################################################################################
+    def stream_export(self, guild_id: int, kinds: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yields ``(kind, row)`` for every row of each of ``kinds``, one
+        kind after another."""
+        
+        for kind in kinds:
+            for row in self.database.stream(self.EXPORT_QUERIES[kind], guild_id):
+                yield kind, row
+    
 ################################################################################
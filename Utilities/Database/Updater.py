@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING, Optional
 
 from .Branch import DBWorkerBranch
@@ -233,12 +234,13 @@ class DatabaseUpdater(DBWorkerBranch):
         self.execute(
             "UPDATE venues SET users = %s, positions = %s, pending = %s, "
             "post_url = %s, name = %s, description = %s, hiring = %s, "
-            "mare_id = %s, mare_pass = %s, mute_list = %s, xivvenues_id = %s "
-            "WHERE _id = %s;",
+            "mare_id = %s, mare_pass = %s, mute_list = %s, xivvenues_id = %s, "
+            "xiv_modified = %s WHERE _id = %s;",
             [u.id for u in venue.authorized_users], [p.id for p in venue.positions],
             venue.pending, venue.post_url, venue.name, venue.description,
             venue.hiring, venue.mare_id, venue.mare_password,
-            [u.id for u in venue.muted_users], venue._xiv_id, venue.id
+            [u.id for u in venue.muted_users], venue._xiv_id, venue._xiv_modified,
+            venue.id
         )
         
 ################################################################################
@@ -394,6 +396,15 @@ class DatabaseUpdater(DBWorkerBranch):
             signup.level.value, signup.id
         )
         
+################################################################################
+    def _update_bulk_job(self, job: BulkJob) -> None:
+        
+        self.execute(
+            "UPDATE bulk_jobs SET message_id = %s, done = %s, outcomes = %s, "
+            "status = %s WHERE _id = %s;",
+            job.message_id, list(job.done), json.dumps(job.outcomes), job.status, job.id
+        )
+        
 ################################################################################
     
     log_channel             = _update_log_channel
@@ -426,6 +437,7 @@ class DatabaseUpdater(DBWorkerBranch):
     service_profile         = _update_service_profile
     group_training          = _update_group_training
     group_training_signup   = _update_group_training_signup
+    bulk_job                = _update_bulk_job
     
 ################################################################################
     
\ No newline at end of file
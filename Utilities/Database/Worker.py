@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from .Builder import DatabaseBuilder
 from .Deleter import DatabaseDeleter
@@ -52,4 +52,34 @@ class DatabaseWorker:
 
         return self._loader.load_all()
 
+################################################################################
+    def load_image_hashes(self) -> Tuple[Tuple[Any, ...], ...]:
+
+        return self._loader.load_image_hashes()
+
+################################################################################
+    def load_bulk_jobs(self) -> Tuple[Tuple[Any, ...], ...]:
+
+        return self._loader.load_bulk_jobs()
+
+################################################################################
+    def load_timers(self) -> Tuple[Tuple[Any, ...], ...]:
+
+        return self._loader.load_timers()
+
+################################################################################
+    def load_snapshot(self) -> Optional[Tuple[Any, ...]]:
+
+        return self._loader.load_snapshot()
+
+################################################################################
+    def lookup_short_url(self, long_url: str) -> Optional[str]:
+
+        return self._loader.lookup_short_url(long_url)
+
+################################################################################
+    def stream_export(self, guild_id: int, kinds: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+
+        return self._loader.stream_export(guild_id, kinds)
+
 ################################################################################
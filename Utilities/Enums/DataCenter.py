@@ -26,61 +26,27 @@ class DataCenter(FroggeEnum):
         if xiv_name is None:
             return 
         
-        for dc in cls:
-            if dc.proper_name == xiv_name:
-                return dc
+        from .GameData import GameData
+        if (dc := GameData.data_center(xiv_name)) is None:
+            raise ValueError(f"Invalid XIV data center name: {xiv_name}")
             
-        raise ValueError(f"Invalid XIV data center name: {xiv_name}")
+        return dc
     
 ################################################################################
     @classmethod
     def from_world(cls, world: GameWorld) -> "DataCenter":
         
-        if world in (
-            GameWorld.Adamantoise, GameWorld.Cactuar, GameWorld.Faerie,
-            GameWorld.Gilgamesh, GameWorld.Jenova, GameWorld.Midgardsormr,
-            GameWorld.Sargatanas, GameWorld.Siren
-        ):
-            return cls.Aether
+        from .GameData import GameData
+        if (dc := GameData.DC_OF_WORLD.get(world)) is None:
+            raise ValueError(f"Invalid world: {world}")
         
-        if world in (
-            GameWorld.Balmung, GameWorld.Brynhildr, GameWorld.Coeurl,
-            GameWorld.Diabolos, GameWorld.Goblin, GameWorld.Malboro,
-            GameWorld.Mateus, GameWorld.Zalera
-        ):
-            return cls.Crystal
-        
-        if world in (
-            GameWorld.Halicarnassus, GameWorld.Maduin, GameWorld.Marilith,
-            GameWorld.Seraph
-        ):
-            return cls.Dynamis
-        
-        if world in (
-            GameWorld.Behemoth, GameWorld.Excalibur, GameWorld.Exodus,
-            GameWorld.Famfrit, GameWorld.Hyperion, GameWorld.Lamia,
-            GameWorld.Leviathan, GameWorld.Ultros
-        ):
-            return cls.Primal
-        
-        if world in (
-            GameWorld.Alpha, GameWorld.Lich, GameWorld.Odin, GameWorld.Phoenix, 
-            GameWorld.Raiden, GameWorld.Shiva, GameWorld.Twintania, GameWorld.Zodiark
-        ):
-            return cls.Light
-        
-        if world in (
-            GameWorld.Cerberus, GameWorld.Louisoix, GameWorld.Moogle, GameWorld.Omega, 
-            GameWorld.Phantom, GameWorld.Ragnarok, GameWorld.Sagittarius, GameWorld.Spriggan
-        ):
-            return cls.Chaos
-        
-        raise ValueError(f"Invalid world: {world}")
+        return dc
     
 ################################################################################
     @staticmethod
     def select_options() -> List[SelectOption]:
         
-        return [dc.select_option for dc in DataCenter]
+        from .GameData import GameData
+        return list(GameData.DC_OPTIONS)
     
 ################################################################################
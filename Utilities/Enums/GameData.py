@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from discord import SelectOption
+
+from .DataCenter import DataCenter
+from .GameWorld import GameWorld
+from .GlobalDataCenter import GlobalDataCenter
+from .HousingZone import HousingZone
+################################################################################
+
+__all__ = ("GameData",)
+
+################################################################################
+# The single source of truth: region -> (short codes, data center -> worlds).
+# Everything in GameData is generated from this once, at import.
+_LAYOUT = {
+    GlobalDataCenter.Americas: (("NA", "AM"), {
+        DataCenter.Aether: (
+            GameWorld.Adamantoise, GameWorld.Cactuar, GameWorld.Faerie, GameWorld.Gilgamesh,
+            GameWorld.Jenova, GameWorld.Midgardsormr, GameWorld.Sargatanas, GameWorld.Siren,
+        ),
+        DataCenter.Crystal: (
+            GameWorld.Balmung, GameWorld.Brynhildr, GameWorld.Coeurl, GameWorld.Diabolos,
+            GameWorld.Goblin, GameWorld.Malboro, GameWorld.Mateus, GameWorld.Zalera,
+        ),
+        DataCenter.Dynamis: (
+            GameWorld.Halicarnassus, GameWorld.Maduin, GameWorld.Marilith, GameWorld.Seraph,
+        ),
+        DataCenter.Primal: (
+            GameWorld.Behemoth, GameWorld.Excalibur, GameWorld.Exodus, GameWorld.Famfrit,
+            GameWorld.Hyperion, GameWorld.Lamia, GameWorld.Leviathan, GameWorld.Ultros,
+        ),
+    }),
+    GlobalDataCenter.Europe: (("EU",), {
+        DataCenter.Light: (
+            GameWorld.Alpha, GameWorld.Lich, GameWorld.Odin, GameWorld.Phoenix,
+            GameWorld.Raiden, GameWorld.Shiva, GameWorld.Twintania, GameWorld.Zodiark,
+        ),
+        DataCenter.Chaos: (
+            GameWorld.Cerberus, GameWorld.Louisoix, GameWorld.Moogle, GameWorld.Omega,
+            GameWorld.Phantom, GameWorld.Ragnarok, GameWorld.Sagittarius, GameWorld.Spriggan,
+        ),
+    }),
+    GlobalDataCenter.Oceania: (("OC",), {
+        DataCenter.Materia: (
+            GameWorld.Bismarck, GameWorld.Ravana, GameWorld.Sephirot, GameWorld.Sophia,
+            GameWorld.Zurvan,
+        ),
+    }),
+    GlobalDataCenter.Japanese: (("JP",), {
+        DataCenter.Elemental: (
+            GameWorld.Aegis, GameWorld.Atomos, GameWorld.Carbuncle, GameWorld.Garuda,
+            GameWorld.Gungnir, GameWorld.Kujata, GameWorld.Tonberry, GameWorld.Typhon,
+        ),
+        DataCenter.Gaia: (
+            GameWorld.Alexander, GameWorld.Bahamut, GameWorld.Durandal, GameWorld.Fenrir,
+            GameWorld.Ifrit, GameWorld.Ridill, GameWorld.Tiamat, GameWorld.Ultima,
+        ),
+        DataCenter.Mana: (
+            GameWorld.Anima, GameWorld.Asura, GameWorld.Chocobo, GameWorld.Hades,
+            GameWorld.Ixion, GameWorld.Masamune, GameWorld.Pandaemonium, GameWorld.Titan,
+        ),
+        DataCenter.Meteor: (
+            GameWorld.Belias, GameWorld.Mandragora, GameWorld.Ramuh, GameWorld.Shinryu,
+            GameWorld.Unicorn, GameWorld.Valefor, GameWorld.Yojimbo, GameWorld.Zeromus,
+        ),
+    }),
+}
+
+################################################################################
+class GameData:
+    """Constant-time lookups over the static FFXIV world/data center/region
+    layout and the housing zones.
+
+    Name tables are keyed by casefolded name. Data center sets are bitmasks
+    (bit ``dc.value``) so membership and overlap tests are a single AND.
+    The ``SelectOption`` tuples are built once and shared by every view -
+    callers get a fresh list around the same option objects, and must not
+    modify the options themselves.
+    """
+
+    __slots__ = ()
+
+    WORLDS: Dict[str, GameWorld] = {w.proper_name.casefold(): w for w in GameWorld}
+    DATA_CENTERS: Dict[str, DataCenter] = {dc.proper_name.casefold(): dc for dc in DataCenter}
+    HOUSING_ZONES: Dict[str, HousingZone] = {
+        **{z.name.casefold(): z for z in HousingZone},
+        **{z.proper_name.casefold(): z for z in HousingZone},
+    }
+
+    DC_OF_WORLD: Dict[GameWorld, DataCenter] = {
+        world: dc
+        for _, dcs in _LAYOUT.values()
+        for dc, worlds in dcs.items()
+        for world in worlds
+    }
+    REGION_OF_DC: Dict[DataCenter, GlobalDataCenter] = {
+        dc: region for region, (_, dcs) in _LAYOUT.items() for dc in dcs
+    }
+    WORLDS_BY_DC: Dict[DataCenter, Tuple[GameWorld, ...]] = {
+        dc: worlds for _, dcs in _LAYOUT.values() for dc, worlds in dcs.items()
+    }
+    DCS_BY_REGION: Dict[GlobalDataCenter, Tuple[DataCenter, ...]] = {
+        region: tuple(dcs) for region, (_, dcs) in _LAYOUT.items()
+    }
+    REGIONS_BY_CODE: Dict[str, GlobalDataCenter] = {
+        code: region for region, (codes, _) in _LAYOUT.items() for code in codes
+    }
+    REGION_MASKS: Dict[GlobalDataCenter, int] = {
+        region: sum(1 << dc.value for dc in dcs) for region, (_, dcs) in _LAYOUT.items()
+    }
+
+    WORLD_OPTIONS: Dict[DataCenter, Tuple[SelectOption, ...]] = {
+        dc: tuple(w.select_option for w in worlds) for dc, worlds in WORLDS_BY_DC.items()
+    }
+    DC_OPTIONS: Tuple[SelectOption, ...] = tuple(dc.select_option for dc in DataCenter)
+    REGION_OPTIONS: Tuple[SelectOption, ...] = tuple(r.select_option for r in GlobalDataCenter)
+    ZONE_OPTIONS: Tuple[SelectOption, ...] = tuple(z.select_option for z in HousingZone)
+
+################################################################################
+    @classmethod
+    def world(cls, name: Optional[str]) -> Optional[GameWorld]:
+
+        return cls.WORLDS.get(name.casefold()) if name else None
+
+################################################################################
+    @classmethod
+    def data_center(cls, name: Optional[str]) -> Optional[DataCenter]:
+
+        return cls.DATA_CENTERS.get(name.casefold()) if name else None
+
+################################################################################
+    @classmethod
+    def housing_zone(cls, name: Optional[str]) -> Optional[HousingZone]:
+
+        return cls.HOUSING_ZONES.get(name.casefold()) if name else None
+
+################################################################################
+    @classmethod
+    def region_mask(cls, regions: Iterable[GlobalDataCenter]) -> int:
+        """The data centers of all of ``regions``, as one bitmask."""
+
+        mask = 0
+        for region in regions:
+            mask |= cls.REGION_MASKS[region]
+
+        return mask
+
+################################################################################
+    @staticmethod
+    def dc_bit(dc: Optional[DataCenter]) -> int:
+
+        return 1 << dc.value if dc is not None else 0
+
+################################################################################
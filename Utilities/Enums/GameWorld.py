@@ -98,139 +98,24 @@ class GameWorld(FroggeEnum):
         if xiv_name is None:
             return
         
-        for world in cls:
-            if world.proper_name == xiv_name:
-                return world
-            
-        raise ValueError(f"Invalid XIV world name: {xiv_name}")
+        from .GameData import GameData
+        if (world := GameData.world(xiv_name)) is None:
+            raise ValueError(f"Invalid XIV world name: {xiv_name}")
+        
+        return world
     
 ################################################################################
     @classmethod
     def from_string(cls, world_name: str) -> Optional["GameWorld"]:
         
-        for world in cls:
-            if world_name.lower() == world.proper_name.lower():
-                return world
+        from .GameData import GameData
+        return GameData.world(world_name)
     
 ################################################################################
     @staticmethod
     def select_options_by_dc(dc: FroggeEnum) -> List[SelectOption]:
         
-        if dc.value == 1:  # Aether
-            world_list = [
-                GameWorld.Adamantoise,
-                GameWorld.Cactuar,
-                GameWorld.Faerie,
-                GameWorld.Gilgamesh,
-                GameWorld.Jenova,
-                GameWorld.Midgardsormr,
-                GameWorld.Sargatanas,
-                GameWorld.Siren,
-            ]
-        elif dc.value == 2:  # Crystal
-            world_list = [
-                GameWorld.Balmung,
-                GameWorld.Brynhildr,
-                GameWorld.Coeurl,
-                GameWorld.Diabolos,
-                GameWorld.Goblin,
-                GameWorld.Malboro,
-                GameWorld.Mateus,
-                GameWorld.Zalera,
-            ]
-        elif dc.value == 3:  # Dynamis
-            world_list = [
-                GameWorld.Halicarnassus,
-                GameWorld.Maduin,
-                GameWorld.Marilith,
-                GameWorld.Seraph,
-            ]
-        elif dc.value == 4:  # Primal
-            world_list = [
-                GameWorld.Behemoth,
-                GameWorld.Excalibur,
-                GameWorld.Exodus,
-                GameWorld.Famfrit,
-                GameWorld.Hyperion,
-                GameWorld.Lamia,
-                GameWorld.Leviathan,
-                GameWorld.Ultros,
-            ]
-        elif dc.value == 5:  # Light
-            world_list = [
-                GameWorld.Alpha,
-                GameWorld.Lich,
-                GameWorld.Odin,
-                GameWorld.Phoenix,
-                GameWorld.Raiden,
-                GameWorld.Shiva,
-                GameWorld.Twintania,
-                GameWorld.Zodiark,
-            ]
-        elif dc.value == 6:  # Chaos
-            world_list = [
-                GameWorld.Cerberus,
-                GameWorld.Louisoix,
-                GameWorld.Moogle,
-                GameWorld.Omega,
-                GameWorld.Phantom,
-                GameWorld.Ragnarok,
-                GameWorld.Sagittarius,
-                GameWorld.Spriggan,
-            ]
-        elif dc.value == 7:  # Materia
-            world_list = [
-                GameWorld.Bismarck,
-                GameWorld.Ravana,
-                GameWorld.Sephirot,
-                GameWorld.Sophia,
-                GameWorld.Zurvan,
-            ]
-        elif dc.value == 8:  # Elemental
-            world_list = [
-                GameWorld.Aegis,
-                GameWorld.Atomos,
-                GameWorld.Carbuncle,
-                GameWorld.Garuda,
-                GameWorld.Gungnir,
-                GameWorld.Kujata,
-                GameWorld.Tonberry,
-                GameWorld.Typhon,
-            ]
-        elif dc.value == 9:  # Gaia
-            world_list = [
-                GameWorld.Alexander,
-                GameWorld.Bahamut,
-                GameWorld.Durandal,
-                GameWorld.Fenrir,
-                GameWorld.Ifrit,
-                GameWorld.Ridill,
-                GameWorld.Tiamat,
-                GameWorld.Ultima,
-            ]
-        elif dc.value == 10:  # Mana
-            world_list = [
-                GameWorld.Anima,
-                GameWorld.Asura,
-                GameWorld.Chocobo,
-                GameWorld.Hades,
-                GameWorld.Ixion,
-                GameWorld.Masamune,
-                GameWorld.Pandaemonium,
-                GameWorld.Titan,
-            ]
-        else:  # Meteor
-            world_list = [
-                GameWorld.Belias,
-                GameWorld.Mandragora,
-                GameWorld.Ramuh,
-                GameWorld.Shinryu,
-                GameWorld.Unicorn,
-                GameWorld.Valefor,
-                GameWorld.Yojimbo,
-                GameWorld.Zeromus,
-            ]
-            
-        return [world.select_option for world in world_list]
+        from .GameData import GameData
+        return list(GameData.WORLD_OPTIONS[dc])
     
 ################################################################################
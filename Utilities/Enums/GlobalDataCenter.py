@@ -16,47 +16,29 @@ class GlobalDataCenter(FroggeEnum):
     @staticmethod
     def select_options() -> List[SelectOption]:
         
-        return [dc.select_option for dc in GlobalDataCenter]
+        from .GameData import GameData
+        return list(GameData.REGION_OPTIONS)
     
 ################################################################################
     @property
     def abbreviation(self) -> str:
         
-        if self.value == 1:
-            return "AM"
-        elif self.value == 2:
-            return "EU"
-        elif self.value == 3:
-            return "OC"
-        elif self.value == 4:
-            return "JP"
+        return ("AM", "EU", "OC", "JP")[self.value - 1]
     
 ################################################################################
     def contains(self, dc: DataCenter) -> bool:
         
-        if dc is None:
-            return False
-        
-        if self.value == 1:
-            return dc.value in [1, 2, 3, 4]
-        elif self.value == 2:
-            return dc.value in [5, 6]
-        elif self.value == 3:
-            return dc.value in [7]
-        elif self.value == 4:
-            return dc.value in [8, 9, 10, 11]
+        from .GameData import GameData
+        return bool(GameData.REGION_MASKS[self] & GameData.dc_bit(dc))
         
 ################################################################################
     @staticmethod
     def data_centers_by_region(region: str) -> List[DataCenter]:
         
-        if region == "NA":
-            return [DataCenter.Aether, DataCenter.Crystal, DataCenter.Dynamis, DataCenter.Primal]
-        elif region == "EU":
-            return [DataCenter.Light, DataCenter.Chaos]
-        elif region == "OC":
-            return [DataCenter.Materia]
-        elif region == "JP":
-            return [DataCenter.Elemental, DataCenter.Gaia, DataCenter.Mana, DataCenter.Meteor]
+        from .GameData import GameData
+        if (found := GameData.REGIONS_BY_CODE.get(region)) is None:
+            return
+        
+        return list(GameData.DCS_BY_REGION[found])
         
 ################################################################################
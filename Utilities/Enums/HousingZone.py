@@ -19,16 +19,18 @@ class HousingZone(FroggeEnum):
         if xiv_district is None:
             return
         
-        if xiv_district == "Lavender Beds":
-            return cls.LavenderBeds
+        from .GameData import GameData
+        if (zone := GameData.housing_zone(xiv_district)) is None:
+            raise KeyError(xiv_district)
         
-        return cls[xiv_district]
+        return zone
         
 ################################################################################
     @staticmethod
     def select_options() -> List[SelectOption]:
         
-        return [o.select_option for o in HousingZone]
+        from .GameData import GameData
+        return list(GameData.ZONE_OPTIONS)
     
 ################################################################################    
     @property
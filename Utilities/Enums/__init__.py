@@ -3,6 +3,7 @@ from .SignupLevel import SignupLevel
 from .MentionableType import MentionableType
 from .Clan import Clan
 from .DataCenter import DataCenter
+from .GameData import GameData
 from .GameWorld import GameWorld
 from .Gender import Gender
 from .GlobalDataCenter import GlobalDataCenter
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from ._Error import ErrorMessage
+################################################################################
+
+__all__ = ("MenuExpiredError",)
+
+################################################################################
+class MenuExpiredError(ErrorMessage):
+
+    def __init__(self):
+
+        super().__init__(
+            title="Menu Expired",
+            message="This menu was opened before the server's data was reloaded.",
+            solution="Please close it and open it again."
+        )
+
+################################################################################
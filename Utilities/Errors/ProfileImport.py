@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from ._Error import ErrorMessage
+################################################################################
+
+__all__ = ("ProfileImportError",)
+
+################################################################################
+class ProfileImportError(ErrorMessage):
+
+    def __init__(self, reason: str):
+
+        super().__init__(
+            title="Profile Import Error",
+            message=f"The provided file couldn't be imported: {reason}",
+            solution=(
+                "Please supply an unmodified file created by `/admin export_data`."
+            )
+        )
+
+################################################################################
@@ -20,6 +20,7 @@ from .InvalidPositionSelection import InvalidPositionSelectionError
 from .InvalidSalaryError import InvalidSalaryError
 from .InvalidWorldName import InvalidWorldNameError
 from .JobPostingNotFound import JobPostingNotFoundError
+from .MenuExpired import MenuExpiredError
 from .MalformedURL import MalformedURLError
 from .MissingNameError import MissingNameError
 from .NoAvailableUsersRemoval import NoAvailableUsersRemovalError
@@ -32,6 +33,7 @@ from .PositionNotFound import PositionNotFoundError
 from .PostingNotComplete import PostingNotCompleteError
 from .ProfileChannelNotSet import ProfileChannelNotSetError
 from .ProfileExport import ProfileExportError
+from .ProfileImport import ProfileImportError
 from .ProfileIncomplete import ProfileIncompleteError
 from .ServiceNotFound import ServiceNotFoundError
 from .TimeRange import TimeRangeError
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .RenderCache import RenderCache
+################################################################################
+
+__all__ = ("Metrics", "Histogram")
+
+################################################################################
+class Histogram:
+    """Fixed-bucket histogram. Quantiles are reported as the upper bound of
+    the bucket they fall in, which is plenty to spot a regression."""
+
+    __slots__ = (
+        "bounds",
+        "buckets",
+        "count",
+        "total",
+        "max",
+    )
+
+################################################################################
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+
+        self.bounds: Tuple[float, ...] = bounds
+        # One extra bucket for anything past the last bound.
+        self.buckets: List[int] = [0] * (len(bounds) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+################################################################################
+    def observe(self, value: float) -> None:
+
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+################################################################################
+    @property
+    def mean(self) -> float:
+
+        return self.total / self.count if self.count else 0.0
+
+################################################################################
+    def quantile(self, q: float) -> float:
+
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+
+        return self.max
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 2),
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": round(self.max, 2),
+            "buckets": {
+                **{f"le_{b}": n for b, n in zip(self.bounds, self.buckets)},
+                "inf": self.buckets[-1],
+            },
+        }
+
+################################################################################
+class _Sample:
+    """Costs charged to a single tracked interaction."""
+
+    __slots__ = (
+        "name",
+        "db_statements",
+        "db_ms",
+        "rest_calls",
+        "rest_ms",
+    )
+
+    def __init__(self, name: str) -> None:
+
+        self.name: str = name
+        self.db_statements: int = 0
+        self.db_ms: float = 0.0
+        self.rest_calls: int = 0
+        self.rest_ms: float = 0.0
+
+################################################################################
+class Metrics:
+    """Process-wide latency and cost histograms for every interaction.
+
+    ``track`` wraps a slash command or component callback. Database
+    statements and Discord REST calls made while it's active (from the same
+    task, or tasks it spawns) are charged to it through a context variable,
+    and when it exits its wall time and costs are recorded under its name.
+    A ``track`` opened inside another one also rolls its costs up into the
+    outer sample when it exits. REST calls and statements are also recorded
+    globally whether or not an interaction is being tracked.
+    """
+
+    TIME_BOUNDS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)  # ms
+    COUNT_BOUNDS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250, 1000)
+
+    DEFAULT_PATH = "metrics.json"
+
+    _current: ContextVar[Optional[_Sample]] = ContextVar("metrics_sample", default=None)
+
+    # name -> {"wall_ms", "db_statements", "db_ms", "rest_calls"}
+    _interactions: Dict[str, Dict[str, Histogram]] = {}
+    # "METHOD /route/{param}" -> latency
+    _rest: Dict[str, Histogram] = {}
+    _db: Histogram = Histogram(TIME_BOUNDS)
+
+    started: float = time.time()
+
+################################################################################
+    @classmethod
+    @asynccontextmanager
+    async def track(cls, name: str) -> AsyncIterator[_Sample]:
+
+        parent = cls._current.get()
+        sample = _Sample(name)
+        token = cls._current.set(sample)
+        start = time.perf_counter()
+
+        try:
+            yield sample
+        finally:
+            wall_ms = (time.perf_counter() - start) * 1000
+            cls._current.reset(token)
+            cls._record(sample, wall_ms)
+
+            if parent is not None:
+                parent.db_statements += sample.db_statements
+                parent.db_ms += sample.db_ms
+                parent.rest_calls += sample.rest_calls
+                parent.rest_ms += sample.rest_ms
+
+################################################################################
+    @classmethod
+    def record_db(cls, elapsed: float) -> None:
+
+        elapsed_ms = elapsed * 1000
+        cls._db.observe(elapsed_ms)
+
+        sample = cls._current.get()
+        if sample is not None:
+            sample.db_statements += 1
+            sample.db_ms += elapsed_ms
+
+################################################################################
+    @classmethod
+    def record_rest(cls, route: str, elapsed: float) -> None:
+
+        elapsed_ms = elapsed * 1000
+        hist = cls._rest.get(route)
+        if hist is None:
+            hist = cls._rest[route] = Histogram(cls.TIME_BOUNDS)
+        hist.observe(elapsed_ms)
+
+        sample = cls._current.get()
+        if sample is not None:
+            sample.rest_calls += 1
+            sample.rest_ms += elapsed_ms
+
+################################################################################
+    @classmethod
+    def instrument_http(cls, http: Any) -> None:
+        """Times every REST request made through py-cord's ``HTTPClient``."""
+
+        request = http.request
+
+        async def timed_request(route, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await request(route, *args, **kwargs)
+            finally:
+                cls.record_rest(f"{route.method} {route.path}", time.perf_counter() - start)
+
+        http.request = timed_request
+
+################################################################################
+    @classmethod
+    def _record(cls, sample: _Sample, wall_ms: float) -> None:
+
+        hists = cls._interactions.get(sample.name)
+        if hists is None:
+            hists = cls._interactions[sample.name] = {
+                "wall_ms": Histogram(cls.TIME_BOUNDS),
+                "db_statements": Histogram(cls.COUNT_BOUNDS),
+                "db_ms": Histogram(cls.TIME_BOUNDS),
+                "rest_calls": Histogram(cls.COUNT_BOUNDS),
+            }
+
+        hists["wall_ms"].observe(wall_ms)
+        hists["db_statements"].observe(sample.db_statements)
+        hists["db_ms"].observe(sample.db_ms)
+        hists["rest_calls"].observe(sample.rest_calls)
+
+################################################################################
+    @classmethod
+    def reset(cls) -> None:
+
+        cls._interactions.clear()
+        cls._rest.clear()
+        cls._db = Histogram(cls.TIME_BOUNDS)
+        cls.started = time.time()
+
+################################################################################
+    @classmethod
+    def snapshot(cls) -> Dict[str, Any]:
+
+        return {
+            "since": cls.started,
+            "uptime": round(time.time() - cls.started),
+            "interactions": {
+                name: {k: h.to_dict() for k, h in hists.items()}
+                for name, hists in cls._interactions.items()
+            },
+            "rest": {route: h.to_dict() for route, h in cls._rest.items()},
+            "db": cls._db.to_dict(),
+            "render_cache": RenderCache.stats(),
+        }
+
+################################################################################
+    @classmethod
+    def render(cls, limit: int = 15) -> str:
+
+        # Busiest first - total time spent is what's worth looking at.
+        rows = sorted(
+            cls._interactions.items(),
+            key=lambda kv: kv[1]["wall_ms"].total,
+            reverse=True
+        )[:limit]
+
+        lines = [
+            f"{'Interaction':<32} {'n':>5} {'p50':>6} {'p95':>6} {'max':>7} {'db':>5} {'rest':>5}"
+        ]
+        for name, hists in rows:
+            wall = hists["wall_ms"]
+            lines.append(
+                f"{name[:32]:<32} {wall.count:>5} {wall.quantile(0.5):>6.0f} "
+                f"{wall.quantile(0.95):>6.0f} {wall.max:>7.0f} "
+                f"{hists['db_statements'].mean:>5.1f} {hists['rest_calls'].mean:>5.1f}"
+            )
+
+        routes = sorted(cls._rest.items(), key=lambda kv: kv[1].count, reverse=True)[:5]
+        if routes:
+            lines.append("")
+            lines.append(f"{'REST route':<45} {'n':>6} {'p95':>6}")
+            for route, hist in routes:
+                lines.append(f"{route[:45]:<45} {hist.count:>6} {hist.quantile(0.95):>6.0f}")
+
+        cache = RenderCache.stats()
+        lines.append("")
+        lines.append(
+            f"DB statements: {cls._db.count} (p95 {cls._db.quantile(0.95):.0f}ms) | "
+            f"Render cache hit rate: {cache['hit_rate']:.1%}"
+        )
+
+        return "\n".join(lines)
+
+################################################################################
+    @classmethod
+    def dump(cls) -> None:
+
+        path = os.getenv("METRICS_PATH") or cls.DEFAULT_PATH
+        tmp_path = f"{path}.tmp"
+
+        with open(tmp_path, "w") as f:
+            json.dump(cls.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+
+################################################################################
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import time
+import weakref
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+
+from discord import Embed
+################################################################################
+
+__all__ = ("RenderCache",)
+
+################################################################################
+class RenderCache:
+    """Process-wide memo of compiled embeds, invalidated per entity.
+
+    Entities call ``RenderCache.invalidate(self)`` whenever they persist a
+    change (which every setter already routes through ``update()``), and any
+    render method decorated with ``RenderCache.cached`` is rebuilt on its next
+    call. Entries also expire after ``MAX_AGE`` seconds as a backstop for
+    state that lives outside the entity (member names, roles, etc.), and
+    expired ones are swept out every ``MAX_AGE`` seconds.
+
+    Entities are only weakly referenced, so a cached entity must have a
+    ``__weakref__`` slot. Its entries go as soon as it's garbage collected,
+    and owners also invalidate explicitly when they delete one.
+    """
+
+    MAX_AGE = 300  # seconds
+
+    # id(entity) -> (ref to entity, {(method, args): (created, value)})
+    _entries: Dict[int, Tuple[weakref.ref, Dict[Tuple[Any, ...], Tuple[float, Any]]]] = {}
+    _last_prune: float = time.monotonic()
+
+    hits: int = 0
+    misses: int = 0
+
+################################################################################
+    @classmethod
+    def cached(cls, func: Callable) -> Callable:
+
+        @wraps(func)
+        def wrapper(entity, *args, **kwargs):
+
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            bucket = cls._bucket(entity)
+            entry = bucket.get(key)
+            if entry is not None and now - entry[0] < cls.MAX_AGE:
+                cls.hits += 1
+                return cls._copy(entry[1])
+
+            cls.misses += 1
+            value = func(entity, *args, **kwargs)
+            bucket[key] = (now, value)
+
+            if now - cls._last_prune >= cls.MAX_AGE:
+                cls._prune(now)
+
+            return cls._copy(value)
+
+        return wrapper
+
+################################################################################
+    @classmethod
+    def _bucket(cls, entity: Any) -> Dict[Tuple[Any, ...], Tuple[float, Any]]:
+
+        key = id(entity)
+        found = cls._entries.get(key)
+        # A dead ref means the id() has been recycled for a new object.
+        if found is not None and found[0]() is entity:
+            return found[1]
+
+        def forget(ref: weakref.ref) -> None:
+            # Only if the slot still belongs to the entity that just died.
+            if cls._entries.get(key, (None,))[0] is ref:
+                del cls._entries[key]
+
+        bucket = {}
+        cls._entries[key] = (weakref.ref(entity, forget), bucket)
+
+        return bucket
+
+################################################################################
+    @classmethod
+    def _prune(cls, now: float) -> None:
+
+        for key, (_, bucket) in list(cls._entries.items()):
+            for entry_key, (created, _) in list(bucket.items()):
+                if now - created >= cls.MAX_AGE:
+                    del bucket[entry_key]
+            if not bucket:
+                del cls._entries[key]
+
+        cls._last_prune = now
+
+################################################################################
+    @classmethod
+    def invalidate(cls, entity: Any) -> None:
+
+        found = cls._entries.get(id(entity))
+        if found is not None and found[0]() is entity:
+            del cls._entries[id(entity)]
+
+################################################################################
+    @classmethod
+    def clear(cls) -> None:
+
+        cls._entries.clear()
+
+################################################################################
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+
+        total = cls.hits + cls.misses
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": (cls.hits / total) if total else 0.0,
+            "entities": len(cls._entries),
+        }
+
+################################################################################
+    @staticmethod
+    def _copy(value: Any) -> Any:
+
+        # Callers routinely tweak the embeds they get back, so never hand out
+        # the cached instance itself.
+        if isinstance(value, Embed):
+            return value.copy()
+        if isinstance(value, tuple):
+            return tuple(RenderCache._copy(v) for v in value)
+
+        return value
+
+################################################################################
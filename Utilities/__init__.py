@@ -8,6 +8,8 @@ from .DTOperations import DTOperations
 from .FroggeLog import log
 from .Helpers import *
 from .LogColors import LOG_COLORS
+from .Metrics import Metrics
 from .NotSet import NS
+from .RenderCache import RenderCache
 from .Utilities import *
 ################################################################################